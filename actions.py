@@ -1,10 +1,13 @@
  # Description: The actions module.
 
-from room import Room
 from item import Item
 from player import Player
 from character import *
 from character import MonsterCharacter
+import output
+from output import emit
+from events import NpcTalkedTo
+from locations import CHARACTERS, ITEMS
 
 # The actions module contains the functions that are called when a command is executed.
 # Each function takes 3 parameters:
@@ -12,36 +15,43 @@ from character import MonsterCharacter
 # - list_of_words: the list of words in the command
 # - number_of_parameters: the number of parameters expected by the command
 # The functions return True if the command was executed successfully, False otherwise.
-# The functions print an error message if the number of parameters is incorrect.
-# The error message is different depending on the number of parameters expected by the command.
-
-
-# The error message is stored in the MSG0 and MSG1 variables and formatted with the command_word variable, the first word in the command.
-# The MSG0 variable is used when the command does not take any parameter.
-MSG0 = "\nLa commande '{command_word}' ne prend pas de paramètre.\n"
-# The MSG1 variable is used when the command takes 1 parameter.
-MSG1 = "\nLa commande '{command_word}' prend 1 seul paramètre.\n"
+# The number of parameters is checked once by CommandTable.parse (command.py)
+# before the function is called: list_of_words always has an accepted length.
 
 class Actions:
     @staticmethod
     def go(game, list_of_words, number_of_parameters):
         player = game.player
-        l = len(list_of_words)
-
-        if l != number_of_parameters + 1:
-            print(MSG1.format(command_word=list_of_words[0]))
-            return False
-
         direction = list_of_words[1]
+        # "go n", "nord", "go N"... -> clé des sorties ("N"), comme Player.move
+        exit_key = game.directions.normalize(direction)
 
-        # --- BLOQUER L'ACCÈS À LA FORÊT TANT QUE LA QUÊTE "parler au chef" N'EST PAS FINIE ---
         current_room = player.current_room
 
         # Récupère la salle cible via les sorties
         target_room = None
-        if hasattr(current_room, "exits") and direction in current_room.exits:
-            target_room = current_room.exits[direction]
+        if hasattr(current_room, "exits") and exit_key in current_room.exits:
+            target_room = current_room.exits[exit_key]
+
+        if not Actions._may_enter(game, target_room):
+            return False
+
+        # L'escorte du marchand et les quêtes suivent le déplacement via
+        # game.events (story.py, QuestManager) : rien à faire ici.
+        success = player.move(direction)
+
+        if success:
+            game.update_characters()
+            game.check_end_game()
+
+        return success
+
+    @staticmethod
+    def _may_enter(game, target_room):
+        """Règles du scénario sur un déplacement (go, goto) : affiche le refus et retourne False."""
+        player = game.player
 
+        # --- BLOQUER L'ACCÈS À LA FORÊT TANT QUE LA QUÊTE "parler au chef" N'EST PAS FINIE ---
         if target_room and getattr(target_room, "name", "").lower() == "foret":
             qm = getattr(player, "quest_manager", None)
 
@@ -64,7 +74,7 @@ class Actions:
 
             # Ici on cherche une quête dont le titre contient "chef" ou "parler au chef"
             if not quest_done("Rencontrer l'ancien") and not quest_done("ancien"):
-                print("\n🚫 Accès à la forêt verrouillé : tu dois d'abord valider la quête 'Parler au chef'.\n")
+                emit("\n🚫 Accès à la forêt verrouillé : tu dois d'abord valider la quête 'Parler au chef'.\n")
                 return False
 
         # Marchand refuse le retour en arrière
@@ -72,171 +82,118 @@ class Actions:
             # si tu utilises l'historique du player :
             if hasattr(player, "history") and player.history:
                 previous_room = player.history[-1]
-                current_room = player.current_room
-                target_room = getattr(current_room, "exits", {}).get(direction)
                 if target_room is previous_room:
-                    print("\n Le marchand refuse de faire demi-tour. Continue vers la capitale.\n")
+                    emit("\n Le marchand refuse de faire demi-tour. Continue vers la capitale.\n")
                     return False
-        
-
-        success = player.move(direction) 
-        
-        
-        # ---------------------------
-        # ESCORTE : déplacer le PNJ APRÈS le déplacement du joueur
-        # ---------------------------
-        if success and getattr(game, "following_npc", None) is not None and not getattr(game, "marchand_removed", False):
-            npc = game.following_npc
-            npc_key = getattr(npc, "name", "npc").lower()
-
-            old_room = getattr(npc, "current_room", None)
-            new_room = game.player.current_room
-
-            # retirer de l'ancienne salle
-            if old_room is not None and hasattr(old_room, "characters"):
-                old_room.characters.pop(npc_key, None)
-
-            # placer dans la nouvelle salle
-            npc.current_room = new_room
-            if hasattr(new_room, "characters"):
-                new_room.characters[npc_key] = npc
-
-        # --- STOP escorte quand on atteint l'avant-poste ---
-        if success and getattr(game, "following_npc", None) is not None:
-            if game.player.current_room and game.player.current_room.name == "avant_post_capitale":
-                npc = game.following_npc
-                npc_key = getattr(npc, "name", "npc").lower()
-
-                # il reste à l'avant-poste, mais ne suit plus
-                game.following_npc = None
-
-                print("\n Le marchand ambulant : 'Merci ! À partir d'ici je suis en sécurité. Au revoir !'\n")
-
-                # flag pour dire qu'il est "posé" à l'avant-poste
-                game.marchand_waiting_at_avantpost = True
-
-
-        # --- Disparition du marchand quand tu quittes l'avant-poste vers la capitale ---
-        if success and getattr(game, "marchand_waiting_at_avantpost", False):
-            if game.player.current_room and game.player.current_room.name == "rue_capitale":
-                # on le retire de l'avant-poste (il ne doit plus apparaître ensuite)
-                try:
-                    game.avant_post_capitale.characters.pop("marchand_ambulant", None)
-                except Exception:
-                    pass
-
-                game.marchand_waiting_at_avantpost = False
-                game.marchand_removed = True
-
 
-        if success:
-            game.update_characters()
+        return True
 
-            if hasattr(player, "quest_manager") and player.quest_manager is not None:
-                try:
-                    player.quest_manager.check_action_objectives("aller", player.current_room.name)
-                except Exception as e:
-                    print(f"\n[ERREUR Quêtes] check_action_objectives(aller, {player.current_room.name}) -> {e}\n")
+    @staticmethod
+    def goto(game, list_of_words, number_of_parameters):
+        player = game.player
+        room_name = list_of_words[1]
+        navigation = game.get_navigation()
 
+        target = navigation.find(room_name)
+        if target is None:
+            emit(f"La salle '{room_name}' n'existe pas.")
+            return False
+        if target.lower() != room_name.lower():
+            emit(f"(salle '{room_name}' introuvable, utilisation de '{target}')")
 
-            game.check_end_game()
+        origin = player.current_room.name
+        if target == origin:
+            emit(f"\nVous êtes déjà dans {target}.\n")
+            return False
+        route = navigation.route(origin, target)
+        if route is None:
+            emit(f"\nAucun chemin connu vers {target}.\n")
+            return False
 
-        return success
+        # Un seul tour : chaque pas passe les règles du scénario et publie
+        # PlayerMoved (quêtes, escorte), mais les PNJ ne bougent et la fin de
+        # partie n'est vérifiée qu'une fois, à l'arrivée (ou à l'arrêt).
+        path = [origin]
+        for direction, name in route:
+            next_room = player.current_room.exits.get(direction)
+            if next_room is None or next_room.name != name:
+                emit(f"\nLe chemin vers {target} est coupé.\n")
+                break
+            if not Actions._may_enter(game, next_room):
+                break
+            if not player.move(direction, describe=False):
+                break
+            path.append(name)
+
+        if len(path) == 1:
+            return False
+        emit(f"\nTrajet : {' → '.join(path)}")
+        emit(player.current_room.get_long_description())
+        game.update_characters()
+        game.check_end_game()
+        return len(path) == len(route) + 1
 
     @staticmethod
     def back(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
         return game.player.back()
 
     @staticmethod
     def history(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
-
         player = game.player
         if hasattr(player, "get_history"):
-            print(player.get_history())
+            emit(player.get_history())
         else:
             if not getattr(player, "history", []):
-                print("\nAucun historique.\n")
+                emit("\nAucun historique.\n")
             else:
-                print("\nHistorique :")
+                emit("\nHistorique :")
                 for r in player.history:
-                    print(f"  - {r.name}")
-                print()
+                    emit(f"  - {r.name}")
+                emit()
         return True
 
     @staticmethod
     def look(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
-
         room = game.player.current_room
 
         # Description + sorties
-        print(room.get_long_description())
+        emit(room.get_long_description())
 
         # Objets
         if hasattr(room, "get_inventory"):
-            print(room.get_inventory())
+            emit(room.get_inventory())
         else:
             inv = getattr(room, "inventory", {})
             if not inv:
-                print("\nIl n'y a rien ici.\n")
+                emit("\nIl n'y a rien ici.\n")
             else:
-                print("\nLa pièce contient :")
+                emit("\nLa pièce contient :")
                 for it in inv.values():
-                    print(f"    - {it}")
-                print()
+                    emit(f"    - {it}")
+                emit()
 
-        # Personnages / monstres
-        chars = getattr(room, "characters", {})
+        # Personnages / monstres (texte en cache dans la salle)
+        chars = room.get_characters_description()
         if chars:
-            pnjs = []
-            monstres = []
-            for c in chars.values():
-                if isinstance(c, MonsterCharacter):
-                    monstres.append(c)
-                else:
-                    pnjs.append(c)
-
-            if pnjs:
-                print("\nPersonnages présents :")
-                for c in pnjs:
-                    print(f"    - {c}")
-                print()
-
-            if monstres:
-                print("\nMonstres présents :")
-                for m in monstres:
-                    print(f"    - {m.name} : {m.description}")
-                print()
+            emit(chars, end="")
 
         return True
 
 
     @staticmethod
     def take(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG1.format(command_word=list_of_words[0]))
-            return False
-
         item_name = list_of_words[1]
         player = game.player
         room = player.current_room
 
         if item_name not in room.inventory:
-            print(f"\nL'objet '{item_name}' n'est pas dans la pièce.\n")
+            emit(f"\nL'objet '{item_name}' n'est pas dans la pièce.\n")
             return False
 
         item = room.inventory[item_name]
 
-        if player.get_current_weight() + item.weight > player.max_weight:
-            print(f"\nVous ne pouvez pas prendre l'objet '{item_name}' : poids maximal atteint.\n")
+        if not player.can_carry(item):
+            emit(f"\nVous ne pouvez pas prendre l'objet '{item_name}' : poids maximal atteint.\n")
             return False
 
         ok = player.add_item(item)
@@ -244,56 +201,46 @@ class Actions:
             return False
 
         del room.inventory[item_name]
-        print(f"\nVous avez pris l'objet '{item_name}'.\n")
-
-        print(f"\nVous avez pris l'objet '{item_name}'.\n")
+        if game.locations is not None:
+            game.locations.discard(ITEMS, room, item_name, item)
+        emit(f"\nVous avez pris l'objet '{item_name}'.\n")
 
-        if hasattr(player, "quest_manager") and player.quest_manager is not None:
-            player.quest_manager.check_action_objectives("obtenir", item.name)
+        emit(f"\nVous avez pris l'objet '{item_name}'.\n")
 
         game.check_end_game()
         return True
 
     @staticmethod
     def drop(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG1.format(command_word=list_of_words[0]))
-            return False
-
         item_name = list_of_words[1]
         player = game.player
         room = player.current_room
 
         if item_name not in player.inventory:
-            print(f"\nL'objet '{item_name}' n'est pas dans l'inventaire.\n")
+            emit(f"\nL'objet '{item_name}' n'est pas dans l'inventaire.\n")
             return False
 
         item = player.inventory[item_name]
         room.inventory[item_name] = item
         del player.inventory[item_name]
+        if game.locations is not None:
+            game.locations.add(ITEMS, room, item_name, item)
 
-        print(f"\nVous avez déposé l'objet '{item_name}'.\n")
+        output.event(output.ITEM_DROPPED, item=item_name, room=room.name)
+        emit(f"\nVous avez déposé l'objet '{item_name}'.\n")
         return True
 
     @staticmethod
     def check(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
-
         player = game.player
         if hasattr(player, "get_inventory"):
-            print(player.get_inventory())
+            emit(player.get_inventory())
         else:
-            print("\n" + player.list_inventory() + "\n")
+            emit("\n" + player.list_inventory() + "\n")
         return True
 
     @staticmethod
     def talk(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG1.format(command_word=list_of_words[0]))
-            return False
-
         npc_key = list_of_words[1].lower()
         room = game.player.current_room
 
@@ -307,15 +254,16 @@ class Actions:
 
 
         if not char:
-            print(f"\nIl n'y a pas de personnage nommé '{npc_key}' ici.\n")
+            emit(f"\nIl n'y a pas de personnage nommé '{npc_key}' ici.\n")
             return False
 
 
         # 100% GUI
         if not getattr(game, "gui", None):
-            print("\nLe dialogue est disponible uniquement en interface graphique.\n")
+            emit("\nLe dialogue est disponible uniquement en interface graphique.\n")
             return True
 
+        output.event(output.TALKED, npc=npc_key, room=room.name)
         dlg = getattr(game, "dialogues", {}).get(npc_key)
 
         # ---------------------------
@@ -326,11 +274,7 @@ class Actions:
             room = game.player.current_room
 
             # Valider l'objectif "parler marchand_ambulant" dès qu'on lui parle
-            if getattr(game.player, "quest_manager", None):
-                try:
-                    game.player.quest_manager.check_action_objectives("parler", npc_key)
-                except Exception as e:
-                    print(f"\n[ERREUR Quêtes] check_action_objectives(parler, {npc_key}) -> {e}\n")
+            game.events.publish(NpcTalkedTo(game.player, npc_key))
 
 
             # 1) Tant que les squelettes sont vivants
@@ -409,7 +353,7 @@ class Actions:
         # ---------------------------
         if npc_key == "guard_village":
             if not dlg:
-                print("\nDialogue du garde manquant dans game.dialogues.\n")
+                emit("\nDialogue du garde manquant dans game.dialogues.\n")
                 return True
 
             # L'Ancien est dans maison_ancien (pas dans la salle du garde)
@@ -492,11 +436,7 @@ class Actions:
             )
             char.talked = True
 
-            if getattr(game.player, "quest_manager", None):
-                try:
-                    game.player.quest_manager.check_action_objectives("parler", npc_key)
-                except Exception as e:
-                    print(f"\n[ERREUR Quêtes] check_action_objectives(parler, {npc_key}) -> {e}\n")
+            game.events.publish(NpcTalkedTo(game.player, npc_key))
 
 
             game.check_end_game()
@@ -518,8 +458,7 @@ class Actions:
             replies=["", "", ""],
         )
 
-        if getattr(game.player, "quest_manager", None):
-            game.player.quest_manager.check_action_objectives("parler", npc_key)
+        game.events.publish(NpcTalkedTo(game.player, npc_key))
 
         game.check_end_game()
         return True
@@ -528,13 +467,9 @@ class Actions:
 
     @staticmethod
     def quests(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
-
         qm = getattr(game.player, "quest_manager", None)
         if qm is None:
-            print("\nAucune quête.\n")
+            emit("\nAucune quête.\n")
             return True
 
         if hasattr(qm, "show_quests"):
@@ -545,14 +480,10 @@ class Actions:
 
     @staticmethod
     def quest(game, list_of_words, number_of_parameters):
-        if len(list_of_words) < number_of_parameters + 1:
-            print(MSG1.format(command_word=list_of_words[0]))
-            return False
-
         quest_title = " ".join(list_of_words[1:])
         qm = getattr(game.player, "quest_manager", None)
         if qm is None:
-            print("\nAucune quête.\n")
+            emit("\nAucune quête.\n")
             return True
 
         if hasattr(qm, "show_quest_details"):
@@ -564,14 +495,10 @@ class Actions:
 
     @staticmethod
     def activate(game, list_of_words, number_of_parameters):
-        if len(list_of_words) < number_of_parameters + 1:
-            print(MSG1.format(command_word=list_of_words[0]))
-            return False
-
         quest_title = " ".join(list_of_words[1:])
         qm = getattr(game.player, "quest_manager", None)
         if qm is None:
-            print("\nAucune quête.\n")
+            emit("\nAucune quête.\n")
             return False
 
         if hasattr(qm, "activate_quest"):
@@ -582,54 +509,40 @@ class Actions:
 
     @staticmethod
     def rewards(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
         game.player.show_rewards()
         return True
 
     @staticmethod
     def quit(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
         player = game.player
-        print(f"\nMerci {player.name} d'avoir joué. Au revoir.\n")
+        emit(f"\nMerci {player.name} d'avoir joué. Au revoir.\n")
         game.finished = True
         return True
 
     @staticmethod
     def help(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
-
-        print("\nVoici les commandes disponibles:")
+        emit("\nVoici les commandes disponibles:")
         for command in game.commands.values():
-            print("\t- " + str(command))
-        print()
+            emit("\t- " + str(command))
+        emit()
         return True
 
     @staticmethod
     def fight(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG1.format(command_word=list_of_words[0]))
-            return False
-
         player = game.player
         room = player.current_room
         monster_name = list_of_words[1].lower()
 
         if monster_name not in room.characters:
-            print(f"\nIl n'y a pas de monstre nommé '{monster_name}' ici.\n")
+            emit(f"\nIl n'y a pas de monstre nommé '{monster_name}' ici.\n")
             return False
 
         monster = room.characters[monster_name]
         if not isinstance(monster, MonsterCharacter):
-            print(f"\n{monster_name} n'est pas un monstre.\n")
+            emit(f"\n{monster_name} n'est pas un monstre.\n")
             return False
 
-        print(f"\nVous engagez le combat contre {monster.name}.\n")
+        emit(f"\nVous engagez le combat contre {monster.name}.\n")
 
         if getattr(game, "gui", None):
             game.gui.open_combat_window(monster)
@@ -642,18 +555,14 @@ class Actions:
 
     @staticmethod
     def activateall(game, list_of_words, number_of_parameters):
-        if len(list_of_words) != number_of_parameters + 1:
-            print(MSG0.format(command_word=list_of_words[0]))
-            return False
-
         qm = getattr(game.player, "quest_manager", None)
         if qm is None:
-            print("\nAucune quête.\n")
+            emit("\nAucune quête.\n")
             return True
 
         quests = getattr(qm, "quests", [])
         if not quests:
-            print("\nAucune quête.\n")
+            emit("\nAucune quête.\n")
             return True
 
         activated = 0
@@ -680,15 +589,11 @@ class Actions:
             if ok:
                 activated += 1
 
-        print(f"\n✅ Quêtes activées : {activated}/{len(quests)}\n")
+        emit(f"\n✅ Quêtes activées : {activated}/{len(quests)}\n")
         return True
 
     @staticmethod
     def teleport(game, list_of_words, number_of_parameters):
-        if len(list_of_words) < 2:
-            print("Usage : teleport <salle> ou teleport <entité> <salle>")
-            return False
-
         # Déterminer l'entité et la salle cible
         if len(list_of_words) == 2:
             entity = game.player
@@ -702,31 +607,38 @@ class Actions:
 
             # Si pas trouvé par clé, chercher par nom (au cas où la clé diffère)
             if entity is None:
-                for c in room.characters.values():
-                    if getattr(c, "name", "").lower() == entity_key:
-                        entity = c
+                for place, char in game.get_locations().where(entity_key):
+                    if place is room:
+                        entity = char
                         break
 
             if entity is None:
-                print(f"Il n'y a pas de monstre ou PNJ nommé '{entity_key}' ici.")
+                emit(f"Il n'y a pas de monstre ou PNJ nommé '{entity_key}' ici.")
                 return False
 
         target_room = game.get_room_by_name(target_room_name)
         if not target_room:
-            print(f"La salle '{target_room_name}' n'existe pas.")
-            return False
+            # faute de frappe ? (salle_donjon1 -> salle_donjon_1)
+            target_room = game.resolve_room(target_room_name)
+            if not target_room:
+                emit(f"La salle '{target_room_name}' n'existe pas.")
+                return False
+            emit(f"(salle '{target_room_name}' introuvable, utilisation de '{target_room.name}')")
 
         # Retirer de l'ancienne salle si l'entité y est enregistrée
         old_room = getattr(entity, "current_room", None)
+        old_key = None
         if old_room is not None and hasattr(old_room, "characters"):
             key = getattr(entity, "name", "").lower()
             if key in old_room.characters and old_room.characters[key] is entity:
                 del old_room.characters[key]
+                old_key = key
             else:
                 # sécurité : si la clé est différente, supprimer la bonne entrée
                 for k, v in list(old_room.characters.items()):
                     if v is entity:
                         del old_room.characters[k]
+                        old_key = k
                         break
 
         # Cas spécial joueur : mettre à jour l'historique
@@ -737,12 +649,68 @@ class Actions:
         # Déplacement
         entity.current_room = target_room
         if hasattr(target_room, "characters"):
-            target_room.characters[getattr(entity, "name", "").lower()] = entity
+            new_key = getattr(entity, "name", "").lower()
+            target_room.characters[new_key] = entity
+            if game.locations is not None:
+                if old_key is not None:
+                    game.locations.discard(CHARACTERS, old_room, old_key, entity)
+                game.locations.add(CHARACTERS, target_room, new_key, entity)
+
+        output.event(
+            output.TELEPORTED,
+            entity=getattr(entity, "name", ""),
+            origin=getattr(old_room, "name", None),
+            room=target_room.name,
+        )
 
         # Message
         if old_room is not None:
-            print(f"{getattr(entity, 'name', 'Entité')} a été téléporté de {old_room.name} à {target_room.name} !")
+            emit(f"{getattr(entity, 'name', 'Entité')} a été téléporté de {old_room.name} à {target_room.name} !")
         else:
-            print(f"{getattr(entity, 'name', 'Entité')} a été téléporté vers {target_room.name} !")
+            emit(f"{getattr(entity, 'name', 'Entité')} a été téléporté vers {target_room.name} !")
 
         return True
+
+    @staticmethod
+    def where(game, list_of_words, number_of_parameters):
+        # Index des positions (locations.py) : pas de parcours des salles
+        name = list_of_words[1]
+        player = game.player
+        if name.lower() == player.name.lower():
+            emit(f"\n{player.name} est dans {player.current_room.name}.\n")
+            return True
+
+        found = game.get_locations().where(name)
+        # étages pas (ou plus) construits : placement connu par les régions
+        unloaded = game.regions.locate(CHARACTERS, name) if game.regions is not None else []
+        if not found and not unloaded:
+            emit(f"\nAucun PNJ ni monstre nommé '{name}'.\n")
+            return False
+        emit(f"\n{name} :")
+        for room, char in found:
+            kind = "monstre" if getattr(char, "is_monster", False) else "PNJ"
+            emit(f"  - {room.name} ({kind} {char.name})")
+        for room_name, data in unloaded:
+            kind = "monstre" if "monster" in data else "PNJ"
+            emit(f"  - {room_name} ({kind} {data['name']}, étage non chargé)")
+        emit()
+        return True
+
+    @staticmethod
+    def find(game, list_of_words, number_of_parameters):
+        item_name = list_of_words[1]
+        found = game.get_locations().find(item_name)
+        unloaded = game.regions.locate(ITEMS, item_name) if game.regions is not None else []
+        carried = item_name in game.player.inventory
+        if not found and not unloaded and not carried:
+            emit(f"\nL'objet '{item_name}' n'est posé nulle part.\n")
+            return False
+        emit(f"\n{item_name} :")
+        for room, item in found:
+            emit(f"  - {room.name}")
+        for room_name, data in unloaded:
+            emit(f"  - {room_name} (étage non chargé)")
+        if carried:
+            emit("  - dans votre inventaire")
+        emit()
+        return True
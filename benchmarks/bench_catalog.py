@@ -0,0 +1,84 @@
+# bench_catalog.py
+# Catalogue d'objets (catalog.py) contre un parcours de toutes les définitions.
+#  - catalogue généré : N références (types, prix de revente, niveau requis
+#    et attaque tirés au hasard) ;
+#  - requêtes : par type, bande de prix, niveau requis, meilleures attaques
+#    (une page de 9, comme la grille de la boutique) ;
+#  - dernière page d'un stock de marchand de N références ;
+#  - catalogue du monde de base : références et stock du village.
+#
+# Usage : python benchmarks/bench_catalog.py [nb_references]
+
+import os
+import random
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from catalog import Catalog, required_level, sell_price
+from game import Game
+from item import Item
+from output import OutputSink
+
+TYPES = ("weapon", "armor", "shield", "magic", "potion", "other")
+PAGE = 9
+
+
+def generate(n):
+    r = random.Random(1)
+    catalog = Catalog()
+    for i in range(n):
+        item = Item(
+            f"objet_{i}", "", 1.0, type=r.choice(TYPES), attack=r.randint(0, 40),
+            vendable=r.randint(1, 1000), niveau_requis=r.randint(1, 50),
+        )
+        catalog.add(item.definition, price=r.randint(1, 2000))
+    return catalog
+
+
+def scan_queries(defs):
+    return (
+        [d for d in defs if d.item_type == "shield"][:PAGE],
+        [d for d in defs if 100 <= sell_price(d) <= 120][:PAGE],
+        [d for d in defs if required_level(d) <= 3][:PAGE],
+        sorted((d for d in defs if d.attack >= 1), key=lambda d: -d.attack)[:PAGE],
+    )
+
+
+def catalog_queries(catalog):
+    return (
+        catalog.of_type("shield", limit=PAGE),
+        catalog.priced(100, 120, limit=PAGE),
+        catalog.for_level(3, limit=PAGE),
+        catalog.top("attack", limit=PAGE),
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    catalog = generate(n)
+    catalog_queries(catalog)   # index triés construits une fois
+
+    loops = 20
+    t_scan = timeit.timeit(lambda: scan_queries(catalog.definitions), number=loops) / loops
+    loops = 20_000
+    t_cat = timeit.timeit(lambda: catalog_queries(catalog), number=loops) / loops
+    last = (len(catalog.offers) - 1) // PAGE * PAGE
+    t_page = timeit.timeit(lambda: catalog.shop(last, PAGE), number=loops) / loops
+
+    print(f"{n} références")
+    print(f"  4 requêtes, parcours     {t_scan * 1e3:8.2f} ms")
+    print(f"  4 requêtes, catalogue    {t_cat * 1e6:8.2f} µs")
+    print(f"  dernière page du stock   {t_page * 1e6:8.2f} µs")
+
+    game = Game(seed=1)
+    game.output = OutputSink()
+    game.setup("bench")
+    base = game.get_catalog()
+    print(f"monde de base : {len(base)} références, {len(base.offers)} en boutique")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# bench_commands.py
+# Coût du découpage + aiguillage d'une commande (sans exécuter l'action) :
+# ancien split(" ") + dict exact vs CommandTable.parse (alias, préfixes, arité).
+#
+# Usage : python benchmarks/bench_commands.py [nb_commandes]
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game import Game
+
+INPUTS = ["go N", "look", "take pomme", "check", "go S", "talk ancien", "quests", "back"]
+TYPED = ["n", "look", "take  pomme", "inventaire", "sud", "talk ancien", "quests", "back"]
+
+
+def legacy_dispatch(commands, command_string):
+    list_of_words = command_string.split(" ")
+    command_word = list_of_words[0]
+    if command_word not in commands:
+        return None
+    command = commands[command_word]
+    # ancien contrôle d'arité refait dans chaque Actions.*
+    if len(list_of_words) != command.number_of_parameters + 1:
+        return None
+    return command, list_of_words
+
+
+def per_call(fn, inputs, n):
+    batch = inputs * (n // len(inputs))
+    start = time.perf_counter()
+    for s in batch:
+        fn(s)
+    return (time.perf_counter() - start) / len(batch)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    game = Game()
+    game.setup(player_name="x")
+    commands = game.commands
+    plain = dict(commands)
+
+    print(f"Aiguillage moyen sur {n} commandes")
+    print(f"  split(' ') + dict exact        {per_call(lambda s: legacy_dispatch(plain, s), INPUTS, n) * 1e9:8.0f} ns")
+    print(f"  CommandTable.parse             {per_call(commands.parse, INPUTS, n) * 1e9:8.0f} ns")
+    print(f"  CommandTable.parse (raccourcis){per_call(commands.parse, TYPED, n) * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
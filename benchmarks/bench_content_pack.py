@@ -0,0 +1,67 @@
+# bench_content_pack.py
+# Compare Game().setup() et le chargement depuis le content pack.
+#  - cold start : nouveau processus, imports + construction mesurés dans le
+#    processus (médiane, démarrage de l'interpréteur exclu : il est commun) ;
+#    load_game importe game.py comme setup(), plus json, puis lit le pack :
+#    il reste plus lent à froid (quelques ms) ;
+#  - warm start : constructions répétées dans le même processus
+#
+# Usage : python benchmarks/bench_content_pack.py [nb_runs_cold] [nb_builds_warm]
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game import Game
+import content_pack
+
+COLD_SETUP = "from game import Game; Game().setup(player_name='x')"
+COLD_PACK = "import content_pack; content_pack.load_game('x')"
+
+
+def cold(code, runs):
+    timed = f"import time; start = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)"
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", timed], cwd=ROOT, check=True, capture_output=True, text=True)
+        times.append(float(out.stdout.split()[-1]))
+    return statistics.median(times)
+
+
+def warm(factory, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        factory()
+    return (time.perf_counter() - start) / n
+
+
+def setup_game():
+    g = Game()
+    g.setup(player_name="x")
+    return g
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    if not os.path.exists(content_pack.DEFAULT_PACK_PATH):
+        content_pack.save_pack(content_pack.compile_pack())
+
+    print("Cold start (imports + construction, médiane de %d processus)" % runs)
+    print(f"  Game().setup()          {cold(COLD_SETUP, runs) * 1000:8.1f} ms")
+    print(f"  content_pack.load_game  {cold(COLD_PACK, runs) * 1000:8.1f} ms")
+
+    pack = content_pack.load_pack()
+    print(f"\nWarm start (moyenne sur {n} constructions)")
+    print(f"  Game().setup()          {warm(setup_game, n) * 1000:8.3f} ms")
+    print(f"  build_game(pack)        {warm(lambda: content_pack.build_game(pack, 'x'), n) * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
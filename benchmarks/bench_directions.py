@@ -0,0 +1,107 @@
+# bench_directions.py
+# Jeux de directions par monde (directions.py).
+#  - deux mondes joués en parallèle dans des threads : le monde de base et
+#    un labyrinthe avec diagonales ("ne", "nord-est"...) ; chacun ne
+#    reconnaît que ses propres directions ;
+#  - coût de la normalisation d'une saisie (jeu de base / avec diagonales) ;
+#  - get_exit sur un labyrinthe généré à 8 directions, sorties en dict puis
+#    gelées dans un RoomStore.
+#
+# Usage : python benchmarks/bench_directions.py [nb_salles] [nb_tours]
+
+import os
+import sys
+import threading
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from content_pack import load_game
+from directions import DEFAULT_DIRECTIONS
+from output import OutputSink
+from room import Room
+from room_store import RoomStore
+
+DIAGONALS = DEFAULT_DIRECTIONS.with_aliases({
+    "ne": "NE", "nord-est": "NE",
+    "no": "NO", "nord-ouest": "NO",
+    "se": "SE", "sud-est": "SE",
+    "so": "SO", "sud-ouest": "SO",
+})
+
+STEPS = {"N": (0, -1), "S": (0, 1), "E": (1, 0), "O": (-1, 0),
+         "NE": (1, -1), "NO": (-1, -1), "SE": (1, 1), "SO": (-1, 1)}
+
+
+def labyrinth(n):
+    side = int(n ** 0.5)
+    rooms = [Room(f"case_{i}", "dans le labyrinthe.") for i in range(side * side)]
+    for i, room in enumerate(rooms):
+        x, y = i % side, i // side
+        for d, (dx, dy) in STEPS.items():
+            if 0 <= x + dx < side and 0 <= y + dy < side:
+                room.exits[d] = rooms[(y + dy) * side + x + dx]
+    return rooms
+
+
+def new_world(directions=None):
+    game = load_game("bench", seed=1, directions=directions)
+    game.output = OutputSink()
+    game.process_command("go bas")
+    game.process_command("go S")
+    if directions is not None:
+        # raccourci en diagonale village <-> magasin
+        game.village.exits["NE"] = game.magasin_village
+        game.magasin_village.exits["SO"] = game.village
+        game.register_directions(["NE", "SO"])
+    game.output.drain()
+    return game
+
+
+def play(game, n, results, key):
+    ok = 0
+    for _ in range(n):
+        ok += bool(game.process_command("ne").ok)
+        ok += bool(game.process_command("sud-ouest").ok)
+        game.output.drain()
+    results[key] = (ok, game.player.current_room.name)
+
+
+def main():
+    n_rooms = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    n_turns = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    base, maze = new_world(), new_world(DIAGONALS)
+    results = {}
+    threads = [
+        threading.Thread(target=play, args=(base, n_turns, results, "base")),
+        threading.Thread(target=play, args=(maze, n_turns, results, "diagonales")),
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(f"{n_turns} tours de ne / sud-ouest, deux mondes en parallèle")
+    for key, (ok, room) in results.items():
+        print(f"  {key:<11} {ok:6d} commandes acceptées, fin : {room}")
+    print(f"  jeu de base inchangé : {'ne' not in DEFAULT_DIRECTIONS.aliases and base.directions is DEFAULT_DIRECTIONS}")
+
+    loops = 200_000
+    for label, directions in (("base", DEFAULT_DIRECTIONS), ("diagonales", DIAGONALS)):
+        for word in ("n", "Nord-Est ", "x"):
+            t = timeit.timeit(lambda: directions.normalize(word), number=loops) / loops
+            print(f"  normalize({word!r:<11}) {label:<11} {t * 1e9:5.0f} ns")
+
+    rooms = labyrinth(n_rooms)
+    middle = rooms[len(rooms) // 2]
+    t_dict = timeit.timeit(lambda: middle.get_exit("ne", DIAGONALS), number=loops) / loops
+    store = RoomStore(rooms, DIAGONALS)
+    t_csr = timeit.timeit(lambda: middle.get_exit("ne"), number=loops) / loops
+    print(f"labyrinthe de {len(rooms)} salles, 8 directions")
+    print(f"  get_exit('ne') dict      {t_dict * 1e9:5.0f} ns")
+    print(f"  get_exit('ne') RoomStore {t_csr * 1e9:5.0f} ns ({store.nbytes() / len(rooms):.0f} o/salle)")
+
+
+if __name__ == "__main__":
+    main()
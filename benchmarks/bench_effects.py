@@ -0,0 +1,87 @@
+# bench_effects.py
+# Effets temporaires en roue de minuteurs (effects.py) contre l'ancien dict
+# de buffs réécrit à chaque tour (Player.tick_buffs).
+#  - raid : N effets en cours sur N / 4 cibles, durées étalées ;
+#  - coût d'un tour : tous les compteurs décrémentés contre le panier du
+#    tour courant (et un tour où rien n'expire) ;
+#  - application / prolongation d'un effet (règle MAX) ;
+#  - mêmes effets expirés aux mêmes tours dans les deux cas.
+#
+# Usage : python benchmarks/bench_effects.py [nb_effets] [nb_tours]
+
+import os
+import random
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from effects import StatusEffects
+
+STATS = ("attack", "armor", "magic", "agility")
+
+
+class Target:
+    pass
+
+
+def legacy_tick(buffs, n=1):
+    """Ancien tick_buffs, pour un dict {cible: {stat: {"amount", "turns"}}}."""
+    expired = 0
+    for temp_buffs in buffs.values():
+        to_del = []
+        for k, v in temp_buffs.items():
+            v["turns"] = int(v.get("turns", 0) or 0) - n
+            if v["turns"] <= 0:
+                to_del.append(k)
+        for k in to_del:
+            temp_buffs.pop(k, None)
+        expired += len(to_del)
+    return expired
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    r = random.Random(1)
+    targets = [Target() for _ in range(max(1, n // 4))]
+    plan = [(t, stat, r.randint(1, 20), r.randint(1, 4 * turns)) for t in targets for stat in STATS][:n]
+
+    wheel = StatusEffects()
+    start = time.perf_counter()
+    for target, stat, amount, duration in plan:
+        wheel.apply(target, stat, amount, duration)
+    t_apply = (time.perf_counter() - start) / len(plan)
+
+    buffs = {}
+    for target, stat, amount, duration in plan:
+        buffs.setdefault(target, {})[stat] = {"amount": amount, "turns": duration}
+
+    start = time.perf_counter()
+    old = [legacy_tick(buffs) for _ in range(turns)]
+    t_old = (time.perf_counter() - start) / turns
+    start = time.perf_counter()
+    new = [len(wheel.tick()) for _ in range(turns)]
+    t_new = (time.perf_counter() - start) / turns
+    assert old == new
+
+    loops = 100_000
+    quiet = StatusEffects()
+    for target, stat, amount, duration in plan:
+        quiet.apply(target, stat, amount, duration + 2 * loops)
+    t_quiet = timeit.timeit(quiet.tick, number=loops) / loops
+    target = targets[0]
+    t_refresh = timeit.timeit(lambda: quiet.apply(target, "attack", 5, 3), number=loops) / loops
+
+    print(f"{len(plan)} effets sur {len(targets)} cibles, {turns} tours ({sum(new)} expirés)")
+    print(f"  tour, dict réécrit       {t_old * 1e3:8.2f} ms")
+    print(f"  tour, roue               {t_new * 1e6:8.2f} µs")
+    print(f"  tour sans expiration     {t_quiet * 1e6:8.2f} µs")
+    print(f"  application              {t_apply * 1e6:8.2f} µs")
+    print(f"  prolongation (MAX)       {t_refresh * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# bench_events.py
+# Bus d'événements (events.py).
+#  - coût d'un publish() selon le nombre d'abonnés à d'AUTRES cibles
+#    (doit rester constant : seuls les abonnés concernés sont parcourus) ;
+#  - coût d'un aller-retour "go bas" / "go haut" avec toutes les quêtes
+#    actives (une seule vérification de quêtes par déplacement).
+#
+# Usage : python benchmarks/bench_events.py [nb_deplacements]
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from content_pack import load_game
+from events import EventBus, PlayerMoved
+from output import OutputSink
+from room import Room
+
+
+def publish_cost(n_other, n=100000):
+    bus = EventBus()
+    hits = []
+    bus.subscribe(PlayerMoved, hits.append, target="village")
+    for i in range(n_other):
+        bus.subscribe(PlayerMoved, hits.append, target=f"salle_{i}")
+    event = PlayerMoved(None, None, Room("village", ""), "N")
+    start = time.perf_counter()
+    for _ in range(n):
+        bus.publish(event)
+    return (time.perf_counter() - start) / n
+
+
+def move_cost(n):
+    game = load_game("bench")
+    game.output = OutputSink()
+    game.process_command("activateall")
+    start = time.perf_counter()
+    for _ in range(n):
+        game.process_command("go bas")
+        game.process_command("go haut")
+        game.output.drain()
+    return (time.perf_counter() - start) / (2 * n)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("publish(), 1 abonné concerné")
+    for n_other in (0, 100, 10000):
+        print(f"  + {n_other:>5} abonnés à d'autres cibles : {publish_cost(n_other) * 1e9:6.0f} ns")
+    print(f"déplacement (process_command go, quêtes actives) : {move_cost(n) * 1e6:6.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# bench_inventory.py
+# Inventaire à totaux tenus à jour (inventory.py) contre la somme des poids
+# recalculée à chaque contrôle (ancien Player.get_current_weight).
+#  - inventaire de N piles ;
+#  - contrôle de capacité d'un "take" (deux sommes avant : Actions.take puis
+#    Player.add_item) contre Inventory.fits ;
+#  - ajout / retrait d'un exemplaire sur une pile (totaux mis à jour) ;
+#  - piles : le poids compte la quantité (l'ancienne somme l'ignorait).
+#
+# Usage : python benchmarks/bench_inventory.py [nb_piles]
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from inventory import Inventory
+from item import Item
+
+
+def legacy_weight(inventory):
+    return sum(item.weight for item in inventory.values())
+
+
+def legacy_take_check(inventory, item, max_weight):
+    # Actions.take puis Player.add_item : deux parcours
+    return (legacy_weight(inventory) + item.weight <= max_weight
+            and legacy_weight(inventory) + item.weight <= max_weight)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    inv = Inventory()
+    for i in range(n):
+        inv.add(Item(f"objet_{i}", "", 0.1, quantity=1 + i % 5))
+    max_weight = 10 * n
+    item = Item("pomme", "", 0.2)
+
+    loops = 200
+    t_old = timeit.timeit(lambda: legacy_take_check(inv, item, max_weight), number=loops) / loops
+    loops = 200_000
+    t_new = timeit.timeit(lambda: inv.fits(item, max_weight), number=loops) / loops
+    loops = 100_000
+
+    def add_remove():
+        inv.add(Item.of(item.definition))
+        inv.remove("pomme")
+
+    t_add = timeit.timeit(add_remove, number=loops) / loops
+
+    print(f"{n} piles, {inv.count} objets")
+    print(f"  contrôle de take, sommes   {t_old * 1e6:10.2f} µs")
+    print(f"  contrôle de take, fits     {t_new * 1e6:10.2f} µs")
+    print(f"  ajout + retrait            {t_add * 1e6:10.2f} µs")
+    print(f"  poids : {inv.weight} kg (ancienne somme, sans les quantités : {legacy_weight(inv):.1f} kg)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# bench_items.py
+# Objets en poids mouche (item.py) : définitions partagées, piles légères.
+#  - monde chargé en butin : N monstres avec chacun Item("noyau", ...) et
+#    Item("potion_soin", ...), comme dans _setup_characters ;
+#  - ancienne classe (dict d'attributs + dict de stats par objet, fusion des
+#    registres et normalisation à chaque appel) contre Item / ItemDefinition ;
+#  - temps de création et mémoire allouée (tracemalloc) ;
+#  - monde de base : nombre d'objets et de définitions distinctes.
+#
+# Usage : python benchmarks/bench_items.py [nb_monstres]
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from content_pack import load_game
+from item import Item
+
+
+class LegacyItem:
+    """Objet tel qu'avant : tout dans __dict__, stats recopiées et normalisées."""
+
+    def __init__(self, name, description, weight=0.0, display_name=None, item_type=None, quantity=1, **kwargs):
+        self.name = name
+        self.stats = {}
+        self.display_name = display_name or name
+        self.description = description
+        self.weight = weight
+        for cat in [Item.ARMES, Item.UTILISABLES, Item.EQUIPEMENT, Item.ARTEFACTS, Item.MONSTER_ITEMS]:
+            if name in cat:
+                self.stats.update(cat[name])
+        self.stats.update({Item._KEY_MAP.get(k, k): v for k, v in kwargs.items()})
+        stats = self.stats
+        self.description = stats.get("description", description)
+        self.item_type = stats.get("type", item_type)
+        self.quantity = stats.get("quantity", quantity)
+        self.weight = 1 if self.item_type in Item._EQUIPMENT_TYPES else stats.get("weight", weight)
+        self.damage = int(stats.get("damage", 0) or 0)
+        self.durability = int(stats.get("durability", 0) or 0)
+        self.crit_chance = float(stats.get("crit_chance", 0) or 0)
+        self.armor_phys = int(stats.get("armor_phys", 0) or 0)
+        self.armor_mag = int(stats.get("armor_mag", 0) or 0)
+        self.bonus = stats.get("bonus", {}) or {}
+        self.heal = int(stats.get("heal", 0) or 0)
+        self.mana = int(stats.get("mana", 0) or 0)
+        self._attack = int(stats.get("attack", 0) or 0)
+        self._armor = int(stats.get("armor", 0) or 0)
+        self._magic = int(stats.get("magic", 0) or 0)
+        self._hp = int(stats.get("hp", 0) or 0)
+
+
+def loot(cls, n):
+    return [
+        [cls("noyau", "Un noyau vendable.", 0.1, vendable=8),
+         cls("potion_soin", "Restaure une partie de la vie.", 0.3, type="potion", soin=30, vendable=5)]
+        for _ in range(n)
+    ]
+
+
+def measure(cls, n):
+    loot(cls, 10)   # définitions déjà internées : régime établi
+    start = time.perf_counter()
+    loot(cls, n)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    kept = loot(cls, n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed / (2 * n), size / (2 * n)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    t_old, m_old = measure(LegacyItem, n)
+    t_new, m_new = measure(Item, n)
+    print(f"{n} monstres, 2 objets de butin chacun")
+    print(f"  ancienne classe   {t_old * 1e6:6.2f} µs / objet   {m_old:7.0f} o / objet")
+    print(f"  Item (pile)       {t_new * 1e6:6.2f} µs / objet   {m_new:7.0f} o / objet")
+    print(f"  pour 100 000 objets : {(m_old - m_new) * 100_000 / 1e6:.1f} Mo de moins")
+
+    game = load_game("bench", seed=1)
+    items = {}
+    for room in game.rooms:
+        for item in room.inventory.values():
+            items[id(item)] = item
+        for char in room.characters.values():
+            for item in getattr(char, "loot", ()):
+                items[id(item)] = item
+    definitions = {id(item.definition) for item in items.values()}
+    print(f"monde de base : {len(items)} objets, {len(definitions)} définitions distinctes")
+
+
+if __name__ == "__main__":
+    main()
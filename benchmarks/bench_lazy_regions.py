@@ -0,0 +1,69 @@
+# bench_lazy_regions.py
+# Coût par session : monde complet (build_game) vs étages construits à la
+# demande (regions.build_lazy_game).
+#  - temps de construction moyen
+#  - mémoire retenue par session (tracemalloc, N sessions gardées en vie)
+#
+# Usage : python benchmarks/bench_lazy_regions.py [nb_builds] [nb_sessions]
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import content_pack
+import regions
+
+
+def timed(factory, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        factory()
+    return (time.perf_counter() - start) / n
+
+
+def retained(factory, n):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [factory() for _ in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sessions
+    return (after - before) / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    pack = content_pack.load_pack()
+    eager = lambda: content_pack.build_game(pack, "x")
+    lazy = lambda: regions.build_lazy_game(pack, "x")
+
+    def lazy_visited():
+        # session qui descend jusqu'au premier étage
+        game = lazy()
+        game.get_room_by_name("salle_donjon_1")
+        return game
+
+    # prototypes d'objets construits une fois pour toutes
+    eager()
+
+    print(f"Construction (moyenne sur {n})")
+    print(f"  build_game            {timed(eager, n) * 1000:8.3f} ms")
+    print(f"  build_lazy_game       {timed(lazy, n) * 1000:8.3f} ms")
+    print(f"  lazy + donjon_1       {timed(lazy_visited, n) * 1000:8.3f} ms")
+
+    print(f"\nMémoire retenue par session ({sessions} sessions en vie)")
+    print(f"  build_game            {retained(eager, sessions) / 1024:8.1f} Ko")
+    print(f"  build_lazy_game       {retained(lazy, sessions) / 1024:8.1f} Ko")
+    print(f"  lazy + donjon_1       {retained(lazy_visited, sessions) / 1024:8.1f} Ko")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# bench_leveling.py
+# Montée de niveau groupée (leveling.py) contre l'ancienne boucle de
+# Player.gain_xp (un level_up, un recalcul des stats et un message par niveau).
+#  - gros gains d'XP (commande d'admin, simulation) depuis le niveau 1 ;
+#  - XP requise pour un niveau (chaque gain d'XP en combat) : lecture de la
+#    table contre la formule recalculée ;
+#  - contrôle : niveau, XP restante et stats identiques à l'ancienne boucle.
+#
+# Usage : python benchmarks/bench_leveling.py [xp_accordee]
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from leveling import LEVEL_CAP
+from output import OutputSink, emit, use_sink
+from player import Player
+
+
+def legacy_xp_required(level):
+    base = 50
+    growth = 1.4
+    return int(round(base * (growth ** (level - 1))))
+
+
+def legacy_gain_xp(player, amount):
+    """Ancien gain_xp : un level_up complet par niveau (limité à LEVEL_CAP)."""
+    player.xp += amount
+    emit(f"\n Vous gagnez {amount} XP.")
+    while player.level < LEVEL_CAP and player.xp >= player.xp_to_next:
+        player.xp -= player.xp_to_next
+        player.level += 1
+        player.base_hp += 20
+        player.base_attack += 5
+        player.base_magic += 2
+        player.base_armor += 1
+        player.xp_to_next = legacy_xp_required(player.level)
+        player.recalc_stats()
+        player.hp = player.max_hp
+        emit(
+            "\n=== LEVEL UP ===\n"
+            f"Niveau {player.level}\n"
+            "ATK +5 | MAG +2 | ARM +1 | PV +20\n"
+        )
+
+
+def state(player):
+    return (player.level, player.xp, player.xp_to_next, player.attack, player.magic,
+            player.armor, player.max_hp, player.hp)
+
+
+def main():
+    grant = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 15
+
+    sink = OutputSink()
+    with use_sink(sink):
+        old, new = Player("ancien"), Player("groupe")
+        legacy_gain_xp(old, grant)
+        new.gain_xp(grant)
+        assert state(old) == state(new), (state(old), state(new))
+        sink.drain()
+
+        loops = 2_000
+        t_old = timeit.timeit(lambda: legacy_gain_xp(Player("a"), grant), number=loops) / loops
+        t_new = timeit.timeit(lambda: Player("b").gain_xp(grant), number=loops) / loops
+        sink.drain()
+
+        loops = 200_000
+        t_formula = timeit.timeit(lambda: legacy_xp_required(37), number=loops) / loops
+        t_table = timeit.timeit(lambda: new.xp_required_for_level(37), number=loops) / loops
+
+    print(f"{grant} XP depuis le niveau 1 -> niveau {new.level} (contrôle : même état que l'ancienne boucle)")
+    print(f"  boucle niveau par niveau    {t_old * 1e6:8.2f} µs")
+    print(f"  montée groupée              {t_new * 1e6:8.2f} µs   (création du Player comprise)")
+    print(f"  XP requise, formule         {t_formula * 1e9:8.0f} ns")
+    print(f"  XP requise, table           {t_table * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# bench_locations.py
+# Index des positions (locations.py) : commandes "where" et "find".
+#  - monde généré de N salles, un PNJ et un objet par salle, PNJ mobiles ;
+#  - recherche d'un PNJ / d'un objet : parcours de toutes les salles
+#    (room.characters / room.inventory) contre l'index ;
+#  - coût de Character.move avec et sans mise à jour de l'index ;
+#  - l'index reste identique à un index reconstruit après les déplacements.
+#
+# Usage : python benchmarks/bench_locations.py [nb_salles] [nb_tours]
+
+import os
+import random
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import rng
+from character import Character
+from item import Item
+from locations import LocationIndex
+from room import Room
+
+
+def generate(n):
+    side = int(n ** 0.5) + 1
+    rooms = [Room(f"salle_{i}", "") for i in range(n)]
+    chars = []
+    for i, room in enumerate(rooms):
+        if i + 1 < n:
+            room.exits["E"] = rooms[i + 1]
+            rooms[i + 1].exits["O"] = room
+        if i + side < n:
+            room.exits["S"] = rooms[i + side]
+            rooms[i + side].exits["N"] = room
+        char = Character(f"pnj_{i}", "", room, [])
+        room.characters[char.name] = char
+        chars.append(char)
+        room.inventory[f"objet_{i}"] = Item(f"objet_{i}", "", 1)
+    return rooms, chars
+
+
+def scan_where(rooms, name):
+    return [(room, c) for room in rooms for key, c in room.characters.items() if key == name or c.name.lower() == name]
+
+
+def scan_find(rooms, name):
+    return [(room, room.inventory[name]) for room in rooms if name in room.inventory]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    rooms, chars = generate(n)
+    start = time.perf_counter()
+    locations = LocationIndex.from_rooms(rooms)
+    t_build = time.perf_counter() - start
+
+    target = f"pnj_{n - 1}"
+    item = f"objet_{n // 2}"
+    loops = 20
+    t_scan_where = timeit.timeit(lambda: scan_where(rooms, target), number=loops) / loops
+    t_scan_find = timeit.timeit(lambda: scan_find(rooms, item), number=loops) / loops
+    loops = 100_000
+    t_where = timeit.timeit(lambda: locations.where(target), number=loops) / loops
+    t_find = timeit.timeit(lambda: locations.find(item), number=loops) / loops
+
+    with rng.use_rng(random.Random(1)):
+        start = time.perf_counter()
+        for _ in range(turns):
+            for c in chars:
+                c.move()
+        t_move = (time.perf_counter() - start) / (turns * len(chars))
+    # l'index n'a pas suivi ces déplacements : on le reconstruit
+    locations = LocationIndex.from_rooms(rooms)
+    with rng.use_rng(random.Random(2)):
+        start = time.perf_counter()
+        for _ in range(turns):
+            for c in chars:
+                c.move(locations)
+        t_move_indexed = (time.perf_counter() - start) / (turns * len(chars))
+
+    fresh = LocationIndex.from_rooms(rooms)
+    same = locations.characters == fresh.characters and locations.items == fresh.items
+    assert locations.where(target) == scan_where(rooms, target)
+
+    print(f"{n} salles, {n} PNJ, {n} objets")
+    print(f"  construction de l'index     {t_build * 1e3:9.1f} ms")
+    print(f"  where {target:<14} parcours {t_scan_where * 1e3:9.2f} ms   index {t_where * 1e6:6.2f} µs")
+    print(f"  find  {item:<14} parcours {t_scan_find * 1e3:9.2f} ms   index {t_find * 1e6:6.2f} µs")
+    print(f"  Character.move              {t_move * 1e9:9.0f} ns   avec index {t_move_indexed * 1e9:6.0f} ns")
+    print(f"  index à jour après {turns} tours : {same}")
+
+
+if __name__ == "__main__":
+    main()
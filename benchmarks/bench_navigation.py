@@ -0,0 +1,131 @@
+# bench_navigation.py
+# Navigation (navigation.py) et commande goto.
+#  - trajet village -> donjon3_arrivee (23 pas) : une commande "go" par pas
+#    contre un seul "goto" (graphe et table déjà calculés, puis premier goto
+#    de la session) ;
+#  - grille générée de N salles : calcul d'une table de prochain pas, puis
+#    changements de sorties appliqués sur place (update_room) contre un
+#    recalcul complet.
+#
+# Usage : python benchmarks/bench_navigation.py [nb_salles] [repetitions]
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from content_pack import load_game
+from navigation import Navigation
+from output import OutputSink
+
+TARGET = "donjon3_arrivee"
+
+
+def new_game():
+    game = load_game("bench", seed=1)
+    game.output = OutputSink()
+    game.player.quest_manager.get_quest_by_title("Rencontrer l'Ancien").is_completed = True
+    game.process_command("go bas")
+    game.process_command("go S")
+    game.output.drain()
+    return game
+
+
+def walk_go(n):
+    directions = None
+    elapsed = 0.0
+    for _ in range(n):
+        game = new_game()
+        if directions is None:
+            directions = [d for d, _ in game.get_navigation().route("village", TARGET)]
+        start = time.perf_counter()
+        for d in directions:
+            game.process_command(f"go {d}")
+        elapsed += time.perf_counter() - start
+        assert game.player.current_room.name == TARGET
+    return elapsed / n, len(directions)
+
+
+def walk_goto(n, warm):
+    elapsed = 0.0
+    for _ in range(n):
+        game = new_game()
+        if warm:
+            nav = game.get_navigation()
+            nav.find(TARGET)
+            nav.table(TARGET)
+        start = time.perf_counter()
+        game.process_command(f"goto {TARGET}")
+        elapsed += time.perf_counter() - start
+        assert game.player.current_room.name == TARGET
+    return elapsed / n
+
+
+def grid(n):
+    side = int(n ** 0.5)
+    exits = {}
+    for i in range(side * side):
+        pairs = []
+        if i >= side:
+            pairs.append(("N", f"s{i - side}"))
+        if i + side < side * side:
+            pairs.append(("S", f"s{i + side}"))
+        if i % side:
+            pairs.append(("O", f"s{i - 1}"))
+        if (i + 1) % side:
+            pairs.append(("E", f"s{i + 1}"))
+        exits[f"s{i}"] = pairs
+    return exits, side
+
+
+def main():
+    n_rooms = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    reps = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    t_go, hops = walk_go(reps)
+    t_goto = walk_goto(reps, warm=True)
+    t_first = walk_goto(reps, warm=False)
+    print(f"village -> {TARGET} ({hops} pas)")
+    print(f"  {hops} x go                {t_go * 1e3:8.2f} ms")
+    print(f"  goto                    {t_goto * 1e3:8.2f} ms")
+    print(f"  goto (premier, à froid) {t_first * 1e3:8.2f} ms")
+
+    exits, side = grid(n_rooms)
+    nav = Navigation(exits)
+    corner = f"s{side * side - 1}"
+    start = time.perf_counter()
+    nav.table("s0")
+    t_table = time.perf_counter() - start
+    start = time.perf_counter()
+    route = nav.route(corner, "s0")
+    t_route = time.perf_counter() - start
+
+    # passage secret dans le coin opposé : seules quelques distances changent
+    start = time.perf_counter()
+    nav.update_room(corner, exits[corner] + [("haut", f"s{side * side - 3}")])
+    t_update = time.perf_counter() - start
+    # sortie supprimée qu'aucun plus court chemin n'emprunte
+    unused = f"s{side}"
+    start = time.perf_counter()
+    nav.update_room(unused, [p for p in exits[unused] if p[0] != "S"])
+    t_remove = time.perf_counter() - start
+    incremental = dict(nav.table("s0"))
+    nav.tables.clear()
+    start = time.perf_counter()
+    rebuilt = nav.table("s0")
+    t_rebuild = time.perf_counter() - start
+
+    print(f"grille de {side * side} salles")
+    print(f"  table vers s0           {t_table * 1e3:8.1f} ms")
+    print(f"  route ({len(route)} pas)        {t_route * 1e3:8.2f} ms")
+    print(f"  passage secret          {t_update * 1e3:8.2f} ms")
+    print(f"  sortie retirée          {t_remove * 1e3:8.2f} ms")
+    print(f"  recalcul complet        {t_rebuild * 1e3:8.1f} ms")
+    same = all(incremental[k][0] == v[0] for k, v in rebuilt.items())
+    print(f"  distances identiques : {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# bench_quest_index.py
+# Index inversé des objectifs (QuestManager.check_action_objectives).
+#  - 10 000 quêtes actives, chacune attendant "aller salle_i", plus
+#    quelques-unes partageant "parler avec garde" ;
+#  - coût d'une action qui ne concerne aucune quête, puis d'une action qui
+#    en concerne une : ancien parcours de toutes les quêtes (5 variantes de
+#    chaîne chacune) contre une recherche dans l'index.
+#
+# Usage : python benchmarks/bench_quest_index.py [nb_quetes]
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from output import OutputSink, use_sink
+from quest import Quest, QuestManager
+
+
+def make_manager(n, shared=10):
+    qm = QuestManager()
+    for i in range(n):
+        objectives = [f"aller salle_{i}", f"prendre objet_{i}"]
+        if i < shared:
+            objectives.append("parler avec garde")
+        qm.add_quest(Quest(f"quête {i}", "", objectives))
+    for quest in qm.quests:
+        quest.is_active = True
+    qm.active_quests = list(qm.quests)
+    return qm
+
+
+def scan(qm, action, target):
+    """Ancien check_action_objectives : toutes les quêtes actives."""
+    for quest in qm.active_quests[:]:
+        quest.check_action_objective(action, target, qm.player)
+        if quest.is_completed and quest in qm.active_quests:
+            qm.active_quests.remove(quest)
+
+
+def per_call(fn, qm, events):
+    start = time.perf_counter()
+    for action, target in events:
+        fn(qm, action, target)
+    return (time.perf_counter() - start) / len(events)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    misses = [("aller", "nulle_part")] * 50
+    hits = [("aller", f"salle_{i}") for i in range(0, n, max(1, n // 50))]
+    indexed = QuestManager.check_action_objectives
+
+    print(f"{n} quêtes actives")
+    with use_sink(OutputSink()):
+        for label, fn in (("parcours", scan), ("index", indexed)):
+            qm = make_manager(n)
+            if fn is indexed:
+                qm.check_action_objectives("aller", "nulle_part")  # construit l'index
+            t_miss = per_call(fn, qm, misses)
+            t_hit = per_call(fn, qm, hits)
+            done = sum(len(q.completed_objectives) for q in qm.quests)
+            print(f"  {label:<9} aucune quête {t_miss * 1e6:9.1f} µs   une quête {t_hit * 1e6:9.1f} µs   ({done} objectifs)")
+
+        qm = make_manager(n)
+        start = time.perf_counter()
+        qm.check_action_objectives("aller", "nulle_part")
+        print(f"  construction de l'index : {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# bench_quest_tracker.py
+# Compteurs de complétion (quest.QuestTracker).
+#  - coût de la vérification de fin de partie : ancien parcours de toutes
+#    les quêtes contre la lecture des compteurs ;
+#  - coût des pourcentages par catégorie (tableaux de bord).
+#
+# Usage : python benchmarks/bench_quest_tracker.py [nb_quetes]
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from output import OutputSink, use_sink
+from quest import Quest, QuestManager
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    qm = QuestManager()
+    for i in range(n):
+        qm.add_quest(Quest(f"quête {i}", "", [f"aller salle_{i}"], category=("principale", "secondaire")[i % 2]))
+    with use_sink(OutputSink()):
+        # toutes terminées sauf la dernière : le parcours va jusqu'au bout
+        for quest in qm.quests[:-1]:
+            quest.complete_quest()
+
+    loops = 200
+    t_scan = timeit.timeit(lambda: bool(qm.quests) and all(q.is_completed for q in qm.quests), number=loops) / loops
+    t_tracker = timeit.timeit(qm.all_quests_completed, number=loops * 1000) / (loops * 1000)
+    t_progress = timeit.timeit(qm.tracker.progress, number=loops * 1000) / (loops * 1000)
+
+    print(f"{n} quêtes ({qm.tracker.percent():.2f} % terminées)")
+    print(f"  fin de partie, parcours   {t_scan * 1e6:10.2f} µs")
+    print(f"  fin de partie, compteurs  {t_tracker * 1e6:10.2f} µs")
+    print(f"  progress() par catégorie  {t_progress * 1e6:10.2f} µs  {qm.tracker.progress()}")
+
+
+if __name__ == "__main__":
+    main()
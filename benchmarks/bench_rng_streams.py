@@ -0,0 +1,85 @@
+# bench_rng_streams.py
+# Simulations d'équilibrage reproductibles (rng.py).
+#  - N combats simulés, la graine de chacun dérivée de la graine maître
+#    (derive_seed(master, "sim", i)) ;
+#  - exécutés dans un seul processus puis répartis sur un Pool : les
+#    résultats doivent être identiques, dans le même ordre ;
+#  - coût d'un tirage via rng.current() comparé au module random.
+#
+# Usage : python benchmarks/bench_rng_streams.py [nb_simulations] [processus] [graine]
+
+import hashlib
+import multiprocessing
+import os
+import random
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import rng
+from character import MonsterCharacter
+from content_pack import build_game, load_pack
+from output import OutputSink
+
+
+def simulate(seed):
+    """Le joueur affronte chaque monstre du monde ; retourne (tours, PV restants) par monstre."""
+    game = build_game(load_pack(), "sim", seed=seed)
+    game.output = OutputSink()
+    player = game.player
+    monsters = [c for room in game.rooms for c in room.characters.values() if isinstance(c, MonsterCharacter)]
+    results = []
+    with game.session_rng(), game.session_output():
+        for monster in monsters:
+            player.hp = player.max_hp
+            turns = 0
+            while monster.hp > 0 and player.hp > 0 and turns < 200:
+                turns += 1
+                monster.take_damage(game.rng.randint(8, 20))
+                if monster.hp > 0:
+                    if monster.patterns:
+                        monster.perform_pattern(player)
+                    else:
+                        monster.perform_action(player)
+            results.append((monster.name, turns, player.hp))
+            game.output.drain()
+    return results
+
+
+def digest(all_results):
+    return hashlib.sha256(repr(all_results).encode()).hexdigest()[:16]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    master = int(sys.argv[3]) if len(sys.argv) > 3 else 2024
+    seeds = [rng.derive_seed(master, "sim", i) for i in range(n)]
+
+    start = time.perf_counter()
+    sequential = [simulate(seed) for seed in seeds]
+    t_seq = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(processes) as pool:
+        parallel = pool.map(simulate, seeds, chunksize=max(1, n // (processes * 4)))
+    t_par = time.perf_counter() - start
+
+    print(f"{n} simulations, graine maître {master}")
+    print(f"  1 processus   {t_seq:6.2f} s  empreinte {digest(sequential)}")
+    print(f"  {processes} processus   {t_par:6.2f} s  empreinte {digest(parallel)}")
+    print(f"  identiques : {sequential == parallel}")
+
+    game_rng = rng.GameRandom(1)
+    loops = 200000
+    with rng.use_rng(game_rng):
+        t_current = timeit.timeit("current().random()", globals={"current": rng.current}, number=loops)
+    t_module = timeit.timeit("random.random()", globals={"random": random}, number=loops)
+    print(f"  tirage : rng.current() {t_current / loops * 1e9:5.0f} ns, module random {t_module / loops * 1e9:5.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
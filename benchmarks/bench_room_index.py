@@ -0,0 +1,85 @@
+# bench_room_index.py
+# Recherche de salle par nom sur un monde généré de N salles :
+#  - ancien parcours linéaire de game.rooms vs RoomRegistry.get (exact)
+#  - RoomRegistry.resolve sur des fautes de frappe courantes
+#
+# Usage : python benchmarks/bench_room_index.py [nb_salles]
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from room import Room
+from room_index import RoomRegistry
+
+KINDS = ["salle", "couloir", "crypte", "caverne", "galerie", "tour", "puits", "chambre"]
+ADJ = ["sombre", "humide", "ancienne", "oubliee", "gelee", "ardente", "secrete", "royale"]
+
+
+def generate(n, rng):
+    return [Room(f"{rng.choice(KINDS)}_{rng.choice(ADJ)}_{i}", "") for i in range(n)]
+
+
+def linear_lookup(rooms, room_name):
+    room_name = room_name.lower().replace("-", "_")
+    for room in rooms:
+        if room.name.lower().replace("-", "_") == room_name:
+            return room
+    return None
+
+
+def typo(name, rng):
+    kind = rng.randrange(4)
+    if kind == 0:
+        # séparateur oublié : salle_donjon1
+        i = name.rfind("_")
+        return name[:i] + name[i + 1:]
+    if kind == 1:
+        # lettre manquante
+        i = rng.randrange(len(name))
+        return name[:i] + name[i + 1:]
+    if kind == 2:
+        # deux lettres inversées
+        i = rng.randrange(len(name) - 1)
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    # préfixe
+    return name[: max(3, len(name) - 2)]
+
+
+def per_call(fn, queries):
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    rooms = generate(n, rng)
+
+    start = time.perf_counter()
+    registry = RoomRegistry(rooms)
+    # première recherche : tri des clés pour les préfixes
+    registry.resolve("?")
+    build = time.perf_counter() - start
+
+    targets = [rng.choice(rooms) for _ in range(200)]
+    exact = [r.name for r in targets]
+    typos = [typo(r.name, rng) for r in targets]
+
+    print(f"{n} salles, index construit en {build * 1000:.0f} ms")
+    print(f"  parcours linéaire (exact)   {per_call(lambda q: linear_lookup(rooms, q), exact[:20]) * 1e6:10.1f} µs")
+    print(f"  RoomRegistry.get (exact)    {per_call(registry.get, exact) * 1e6:10.1f} µs")
+    print(f"  RoomRegistry.resolve (typo) {per_call(registry.resolve, typos) * 1e6:10.1f} µs")
+
+    hits = sum(registry.resolve(q) is r for q, r in zip(typos, targets))
+    print(f"  fautes résolues vers la bonne salle : {hits}/{len(typos)}")
+
+
+if __name__ == "__main__":
+    main()
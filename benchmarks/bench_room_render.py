@@ -0,0 +1,96 @@
+# bench_room_render.py
+# Textes des salles en cache (Room.get_long_description, get_exit_string,
+# get_inventory, get_characters_description).
+#  - trafic de bot : "look" puis aller-retour "go S" / "go N" depuis le village ;
+#  - avec le cache, puis en vidant les caches avant chaque commande
+#    (recomposition systématique, comme avant) ;
+#  - proportion de textes servis depuis le cache.
+#
+# Usage : python benchmarks/bench_room_render.py [nb_tours]
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from content_pack import load_game
+from output import OutputSink
+from room import Room
+
+COMMANDS = ("look", "go E", "look", "go O")
+
+
+def new_game():
+    game = load_game("bench", seed=1)
+    game.output = OutputSink()
+    game.process_command("go bas")
+    game.process_command("go S")
+    game.output.drain()
+    return game
+
+
+def run(n, cold):
+    game = new_game()
+    rooms = list(game.rooms)
+    start = time.perf_counter()
+    for _ in range(n):
+        for command in COMMANDS:
+            if cold:
+                for room in rooms:
+                    room._render = None
+            game.process_command(command)
+        game.output.drain()
+    return (time.perf_counter() - start) / (n * len(COMMANDS))
+
+
+def hit_ratio(n):
+    game = new_game()
+    calls = misses = 0
+    cached = Room._cached
+    store = Room._store_render
+
+    def counting_cached(self, kind, version):
+        nonlocal calls
+        calls += 1
+        return cached(self, kind, version)
+
+    def counting_store(self, kind, version, text):
+        nonlocal misses
+        misses += 1
+        return store(self, kind, version, text)
+
+    Room._cached, Room._store_render = counting_cached, counting_store
+    try:
+        for _ in range(n):
+            for command in COMMANDS:
+                game.process_command(command)
+            game.output.drain()
+    finally:
+        Room._cached, Room._store_render = cached, store
+    return 1 - misses / calls, calls
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    # le cache vidé coûte aussi un parcours des salles : mesuré à part
+    game = new_game()
+    rooms = list(game.rooms)
+    start = time.perf_counter()
+    for _ in range(n * len(COMMANDS)):
+        for room in rooms:
+            room._render = None
+    t_clear = (time.perf_counter() - start) / (n * len(COMMANDS))
+
+    t_warm = run(n, cold=False)
+    t_cold = run(n, cold=True) - t_clear
+    ratio, calls = hit_ratio(n)
+    print(f"{n} tours de {' / '.join(COMMANDS)}")
+    print(f"  sans cache   {t_cold * 1e6:7.2f} µs / commande")
+    print(f"  avec cache   {t_warm * 1e6:7.2f} µs / commande")
+    print(f"  textes servis depuis le cache : {ratio * 100:.1f} % ({calls} demandes)")
+
+
+if __name__ == "__main__":
+    main()
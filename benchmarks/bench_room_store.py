@@ -0,0 +1,101 @@
+# bench_room_store.py
+# Mémoire d'un monde généré (grille de N salles, sorties N/S/E/O, un objet
+# dans 1 salle sur 20) :
+#  - ancienne salle : __dict__ + trois dict (sorties, objets, personnages) ;
+#  - Room à __slots__, objets/personnages alloués seulement si non vides ;
+#  - idem avec les sorties gelées dans un RoomStore (tableaux CSR).
+# Puis coût de Room.get_exit dans chaque cas.
+#
+# Usage : python benchmarks/bench_room_store.py [nb_salles]
+
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from room import Room
+from room_store import RoomStore
+
+
+class LegacyRoom:
+    """Salle telle qu'avant : attributs dans __dict__, trois dict par salle."""
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self.exits = {}
+        self.inventory = {}
+        self.characters = {}
+
+    def get_exit(self, direction):
+        normalized = Room.normalize_direction(direction)
+        if normalized is None:
+            return None
+        if normalized in self.exits.keys():
+            return self.exits[normalized]
+        return None
+
+
+def generate(cls, n):
+    side = int(n ** 0.5) + 1
+    rooms = [cls(f"salle_{i}", "") for i in range(n)]
+    for i, room in enumerate(rooms):
+        exits = {}
+        if i >= side:
+            exits["N"] = rooms[i - side]
+        if i + side < n:
+            exits["S"] = rooms[i + side]
+        if i % side:
+            exits["O"] = rooms[i - 1]
+        if (i + 1) % side and i + 1 < n:
+            exits["E"] = rooms[i + 1]
+        room.exits = exits
+        if i % 20 == 0:
+            room.inventory["pomme"] = "pomme"
+    return rooms
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, size
+
+
+def frozen_world(n):
+    rooms = generate(Room, n)
+    return rooms, RoomStore(rooms)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    legacy, legacy_size = measure(lambda: generate(LegacyRoom, n))
+    slotted, slotted_size = measure(lambda: generate(Room, n))
+    (frozen, store), frozen_size = measure(lambda: frozen_world(n))
+
+    print(f"{n} salles (grille, 4 sorties max, objet dans 1 salle sur 20)")
+    for label, size in (
+        ("ancienne salle (__dict__ + 3 dict)", legacy_size),
+        ("Room __slots__, dict paresseux", slotted_size),
+        ("Room __slots__ + RoomStore (CSR)", frozen_size),
+    ):
+        print(f"  {label:<36} {size / 2**20:8.1f} Mo   {size / n:6.0f} o/salle")
+    print(f"  économie pour 100k salles : {(legacy_size - frozen_size) / n * 100_000 / 2**20:.1f} Mo"
+          f" (dont tableaux CSR : {store.nbytes() / 2**20:.2f} Mo)")
+
+    loops = 200_000
+    for label, room in (("ancienne", legacy[n // 2]), ("Room dict", slotted[n // 2]), ("Room CSR", frozen[n // 2])):
+        t = timeit.timeit(lambda: room.get_exit("n"), number=loops) / loops
+        print(f"  get_exit('n') {label:<10} {t * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# bench_scheduler.py
+# Réveil des PNJ par tour (scheduler.py) contre l'ancien passage sur tous
+# les personnages à chaque déplacement du joueur (Character.move).
+#  - monde généré : N PNJ dont une part seulement est mobile ;
+#  - coût moyen d'un tour, ancien parcours contre Scheduler.tick ;
+#  - nombre moyen de pas par PNJ mobile et par tour (0.5 attendu dans les
+#    deux cas : même loi, tirée autrement) ;
+#  - une ronde (Patrol) fait bien le tour de ses salles.
+#
+# Usage : python benchmarks/bench_scheduler.py [nb_pnj] [part_mobile] [nb_tours]
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import rng
+from character import Character
+from room import Room
+from scheduler import Patrol, Scheduler
+
+
+def generate(n, mobile):
+    side = int(n ** 0.5) + 1
+    rooms = [Room(f"salle_{i}", "") for i in range(n)]
+    for i, room in enumerate(rooms):
+        if i + 1 < n:
+            room.exits["E"] = rooms[i + 1]
+            rooms[i + 1].exits["O"] = room
+        if i + side < n:
+            room.exits["S"] = rooms[i + side]
+            rooms[i + side].exits["N"] = room
+    step = max(1, round(1 / mobile)) if mobile else n + 1
+    chars = []
+    for i, room in enumerate(rooms):
+        char = Character(f"pnj_{i}", "", room, [], movable=(i % step == 0))
+        room.characters[char.name] = char
+        chars.append(char)
+    return rooms, chars
+
+
+def poll(chars, turns):
+    moves = 0
+    start = time.perf_counter()
+    for _ in range(turns):
+        for c in chars:
+            moves += c.move()
+    return (time.perf_counter() - start) / turns, moves
+
+
+def scheduled(chars, turns):
+    scheduler = Scheduler()
+    scheduler.sync(chars)
+    moves = 0
+    start = time.perf_counter()
+    for _ in range(turns):
+        moves += len(scheduler.tick(chars))
+    return (time.perf_counter() - start) / turns, moves
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    mobile = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    turns = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    with rng.use_rng(random.Random(1)):
+        _, chars = generate(n, mobile)
+        movers = sum(c.movable for c in chars)
+        t_poll, m_poll = poll(chars, max(1, turns // 20))
+        t_sched, m_sched = scheduled(chars, turns)
+
+        rooms, _ = generate(4, 0)
+        guard = Character("garde", "", rooms[0], [])
+        rooms[0].characters["garde"] = guard
+        guard.policy = Patrol(["salle_0", "salle_1", "salle_2", "salle_3"], period=2)
+        scheduler = Scheduler()
+        visited = []
+        for _ in range(8):
+            if scheduler.tick([guard]):
+                visited.append(guard.current_room.name)
+
+    print(f"{n} PNJ, {movers} mobiles")
+    print(f"  parcours de tous les PNJ  {t_poll * 1e3:8.2f} ms / tour")
+    print(f"  Scheduler.tick            {t_sched * 1e3:8.3f} ms / tour")
+    print(f"  pas par PNJ mobile et par tour : {m_poll / (movers * max(1, turns // 20)):.3f}"
+          f" (ancien) / {m_sched / (movers * turns):.3f} (Scheduler)")
+    print(f"  ronde du garde : {' -> '.join(visited)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# bench_sharding.py
+# Débit des commandes (commandes/s) selon le nombre de processus workers.
+#  - LocalBackend (tout dans un processus) comme référence ;
+#  - ShardedBackend avec 1..N workers : S sessions jouent chacune la même
+#    séquence de commandes en boucle fermée (une commande en vol par session) ;
+#  - temps CPU par commande côté front et côté workers (Linux, /proc).
+# Le front asyncio n'est pas mesuré à travers TCP : voir load_test_server.py.
+#
+# Usage : python benchmarks/bench_sharding.py [max_workers] [sessions] [tours]
+#   max_workers par défaut : os.cpu_count()
+
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from server import LocalBackend
+from sharding import ShardedBackend
+
+SCRIPT = ["look", "go bas", "look", "back", "check", "help", "go haut", "quests"]
+
+
+def cpu_seconds(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return 0.0
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def session(backend, session_id, rounds):
+    await backend.open(session_id, f"bot{session_id}")
+    for _ in range(rounds):
+        for line in SCRIPT:
+            await backend.command(session_id, line)
+
+
+async def measure(backend, n_sessions, rounds):
+    await backend.start()
+    pids = [shard.process.pid for shard in getattr(backend, "shards", [])]
+    front0 = time.process_time()
+    workers0 = sum(cpu_seconds(pid) for pid in pids)
+    start = time.perf_counter()
+    await asyncio.gather(*(session(backend, i, rounds) for i in range(n_sessions)))
+    elapsed = time.perf_counter() - start
+    front = time.process_time() - front0
+    workers = sum(cpu_seconds(pid) for pid in pids) - workers0
+    await backend.shutdown()
+    n_commands = n_sessions * rounds * len(SCRIPT)
+    return n_commands / elapsed, front / n_commands, workers / n_commands
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    n_sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    print(f"{os.cpu_count()} cœur(s), {n_sessions} sessions x {rounds * len(SCRIPT)} commandes")
+
+    rate, front, _ = asyncio.run(measure(LocalBackend(), n_sessions, rounds))
+    print(f"{'local':>9}  {rate:9.0f} cmd/s  CPU front {front * 1e6:5.0f} µs/cmd")
+
+    base = None
+    for n in range(1, max_workers + 1):
+        rate, front, workers = asyncio.run(measure(ShardedBackend(n), n_sessions, rounds))
+        base = base or rate
+        print(
+            f"{n:>2} worker{'s' if n > 1 else ' '}  {rate:9.0f} cmd/s  x{rate / base:4.2f}  "
+            f"CPU front {front * 1e6:5.0f} µs/cmd  workers {workers * 1e6:5.0f} µs/cmd"
+        )
+
+
+if __name__ == "__main__":
+    main()
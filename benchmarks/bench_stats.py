@@ -0,0 +1,155 @@
+# bench_stats.py
+# Stats du joueur par sources (stats.py) contre le recalcul complet de
+# l'ancien Player.recalc_stats.
+#  - contrôle : séquences aléatoires (équiper, déséquiper, level up, buffs,
+#    tours qui passent), stats du joueur comparées après chaque action à la
+#    formule de référence recalculée de zéro (buff compté une fois) ;
+#  - équiper / déséquiper une arme : ancien recalcul des six emplacements
+#    contre la mise à jour d'une source ;
+#  - lecture en combat : get_attack_value + get_armor_value, ancienne
+#    lecture du dict des buffs contre attributs.
+#
+# Usage : python benchmarks/bench_stats.py [nb_sequences] [nb_actions]
+
+import os
+import random
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from item import Item
+from output import OutputSink, use_sink
+from player import Player
+
+TYPES = tuple(Player.EQUIPMENT_SLOTS)
+BUFFS = ("attack", "armor", "magic", "agility")
+
+
+def reference(player):
+    """Formule de référence, de zéro : base + équipement, buffs actifs une fois."""
+    atk, mag, arm, hp = player.base_attack, player.base_magic, player.base_armor, player.base_hp
+    for attr in Player.EQUIPMENT_SLOTS.values():
+        it = getattr(player, attr)
+        if it:
+            atk += it.attack
+            mag += it.magic
+            arm += it.armor
+            hp += it.hp
+    buff = {e.name: e.amount for e in player.effects.effects_of(player)}
+    return (atk, mag, arm, hp,
+            atk + buff.get("attack", 0), arm + buff.get("armor", 0), mag + buff.get("magic", 0))
+
+
+def observed(player):
+    return (player.attack, player.magic, player.armor, player.max_hp,
+            player.get_attack_value(), player.get_armor_value(), player.magic_value)
+
+
+def random_item(r, i):
+    return Item(f"objet_{i}", "", 1.0, type=r.choice(TYPES), attack=r.randint(0, 20),
+                magic=r.randint(0, 10), armor=r.randint(0, 10), hp=r.randint(0, 30))
+
+
+def check(sequences, actions):
+    r = random.Random(1)
+    checked = 0
+    for s in range(sequences):
+        player = Player("bench")
+        pool = [random_item(r, i) for i in range(12)]
+        for it in pool:
+            player.inventory[it.name] = it
+        for _ in range(actions):
+            op = r.random()
+            if op < 0.4:
+                player.equip_item(r.choice(pool))
+            elif op < 0.55:
+                player.unequip_slot(r.choice(TYPES))
+            elif op < 0.65:
+                player.level_up()
+            elif op < 0.85:
+                player.apply_temp_buff(r.choice(BUFFS), r.randint(1, 15), turns=r.randint(1, 4))
+            else:
+                player.tick_buffs(r.randint(1, 2))
+            assert observed(player) == reference(player), (s, observed(player), reference(player))
+            assert player.gear_stats.totals == player.gear_stats.recompute()
+            checked += 1
+    return checked
+
+
+def legacy_buffs(player):
+    """Buffs au format de l'ancien Player._temp_buffs."""
+    return {e.name: {"amount": e.amount, "turns": player.effects.remaining(player, e.name)}
+            for e in player.effects.effects_of(player)}
+
+
+def legacy_recalc(player, temp_buffs):
+    atk, mag, arm, hp_bonus = player.base_attack, player.base_magic, player.base_armor, 0
+    for it in [player.equipped_helmet, player.equipped_armor, player.equipped_other,
+               player.equipped_shield, player.equipped_weapon, player.equipped_magic]:
+        if it:
+            atk += it.attack
+            mag += it.magic
+            arm += it.armor
+            hp_bonus += it.hp
+            atk += int(temp_buffs.get("attack", {}).get("amount", 0) or 0)
+            arm += int(temp_buffs.get("armor", {}).get("amount", 0) or 0)
+            mag += int(temp_buffs.get("magic", {}).get("amount", 0) or 0)
+    player.attack, player.magic, player.armor = atk, mag, arm
+    player.max_hp = player.base_hp + hp_bonus
+    player.hp = min(player.hp, player.max_hp)
+
+
+def legacy_values(player, temp_buffs):
+    bonus = 0
+    b = temp_buffs.get("attack")
+    if b and b.get("turns", 0) > 0:
+        bonus += int(b.get("amount", 0) or 0)
+    atk = int(player.attack) + bonus
+    bonus = 0
+    b = temp_buffs.get("armor")
+    if b and b.get("turns", 0) > 0:
+        bonus += int(b.get("amount", 0) or 0)
+    return atk, int(getattr(player, "armor", 0) or 0) + bonus
+
+
+def main():
+    sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    actions = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+    with use_sink(OutputSink()):
+        checked = check(sequences, actions)
+
+        player = Player("bench")
+        for i, slot in enumerate(TYPES):
+            it = Item(f"equip_{i}", "", 1.0, type=slot, attack=5, armor=3, hp=10)
+            player.inventory[it.name] = it
+            player.equip_item(it)
+        sword = Item("epee", "", 1.0, type="weapon", attack=18)
+        player.inventory["epee"] = sword
+        player.apply_temp_buff("attack", 5, turns=3)
+
+        loops = 100_000
+        temp_buffs = legacy_buffs(player)
+
+        def old_toggle():
+            player.equipped_weapon = sword if player.equipped_weapon is not sword else None
+            legacy_recalc(player, temp_buffs)
+
+        t_old = timeit.timeit(old_toggle, number=loops) / loops
+        player.recalc_stats()
+        t_new = timeit.timeit(lambda: player.equip_item(sword), number=loops) / loops
+        t_read_old = timeit.timeit(lambda: legacy_values(player, temp_buffs), number=loops) / loops
+        t_read_new = timeit.timeit(
+            lambda: (player.get_attack_value(), player.get_armor_value()), number=loops) / loops
+
+    print(f"contrôle : {checked} actions sur {sequences} séquences, stats identiques à la référence")
+    print(f"  équiper / déséquiper, recalcul complet   {t_old * 1e6:6.2f} µs")
+    print(f"  équiper / déséquiper, une source         {t_new * 1e6:6.2f} µs")
+    print(f"  lecture en combat, dict des buffs        {t_read_old * 1e6:6.2f} µs")
+    print(f"  lecture en combat, attributs             {t_read_new * 1e6:6.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
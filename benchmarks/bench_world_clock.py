@@ -0,0 +1,183 @@
+# bench_world_clock.py
+# Horloge du monde (world_clock.py) et réapparition des monstres (respawn.py).
+#  - N minuteurs en attente, dates étalées : coût d'un tour avec le tas
+#    contre un parcours de tous les minuteurs à chaque tour ;
+#  - annulation de la moitié des minuteurs (compactage du tas) ;
+#  - réapparition : remise à neuf d'un monstre du pool contre la création
+#    d'un nouveau MonsterCharacter ;
+#  - monde de base : tous les monstres (hors boss) vaincus puis revenus ;
+#  - étages paresseux : la région d'un monstre vaincu reste chargée jusqu'à
+#    sa réapparition, puis se décharge et se recharge sans doublon ;
+#  - une mort et une autre réapparition dans le même tour : le Scheduler
+#    oublie le mort et replanifie le revenu.
+#
+# Usage : python benchmarks/bench_world_clock.py [nb_minuteurs] [nb_tours]
+
+import os
+import random
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from character import MonsterCharacter
+from content_pack import load_game, load_pack
+from game import Game
+from output import OutputSink
+from regions import build_lazy_game
+from respawn import RespawnPool
+from world_clock import WorldClock
+
+
+def noop():
+    pass
+
+
+def new_monster(room, template):
+    """Sans pool : un nouveau MonsterCharacter, butin recopié de la même façon."""
+    monster = MonsterCharacter.__new__(MonsterCharacter)
+    monster.respawn(room, template)
+    return monster
+
+
+def scan(timers, now):
+    """Ancienne approche : chaque tour relit toute la liste."""
+    due = [t for t in timers if t[0] <= now]
+    if due:
+        timers[:] = [t for t in timers if t[0] > now]
+        for t in due:
+            t[1]()
+    return len(due)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    r = random.Random(1)
+    dates = [r.randint(1, 10 * turns) for _ in range(n)]
+
+    clock = WorldClock()
+    start = time.perf_counter()
+    timers = [clock.schedule(d, noop) for d in dates]
+    t_schedule = (time.perf_counter() - start) / n
+    start = time.perf_counter()
+    ran = sum(clock.advance() for _ in range(turns))
+    t_heap = (time.perf_counter() - start) / turns
+
+    pending = [[d, noop] for d in dates]
+    start = time.perf_counter()
+    ran_scan = sum(scan(pending, now) for now in range(1, turns + 1))
+    t_scan = (time.perf_counter() - start) / turns
+    assert ran == ran_scan
+
+    start = time.perf_counter()
+    for timer in timers[::2]:
+        clock.cancel(timer)
+    t_cancel = (time.perf_counter() - start) / len(timers[::2])
+
+    print(f"{n} minuteurs, {turns} tours ({ran} échus)")
+    print(f"  planification         {t_schedule * 1e6:8.2f} µs / minuteur")
+    print(f"  tour, parcours        {t_scan * 1e3:8.3f} ms")
+    print(f"  tour, tas             {t_heap * 1e3:8.3f} ms")
+    print(f"  annulation            {t_cancel * 1e6:8.2f} µs ({len(clock)} restants)")
+
+    game = load_game("bench", seed=1)
+    game.output = OutputSink()
+    pool = game.get_respawner()
+    kills = 0
+    with game.session_output():
+        for room in game.rooms:
+            for key, char in list(room.characters.items()):
+                if isinstance(char, MonsterCharacter) and not char.is_boss:
+                    char.hp = 0
+                    del room.characters[key]
+                    pool.killed(char, room, key)
+                    char.drop_loot()
+                    kills += 1
+    game.output.drain()
+    pooled = len(pool)
+    game.clock.advance(RespawnPool.DELAY)
+    back = sum(
+        1 for (name, key) in pool.templates
+        if game.get_room_by_name(name).characters.get(key) is not None
+    )
+    print(f"monde de base : {kills} monstres vaincus, {pooled} dans le pool, {back} revenus")
+
+    lazy_respawn()
+    same_tick()
+
+    name, key = next(iter(pool.pool))
+    template = pool.templates[name, key]
+    room = game.get_room_by_name(name)
+    obj = room.characters[key]
+    loops = 20_000
+    t_reuse = timeit.timeit(lambda: obj.respawn(room, template), number=loops) / loops
+    t_new = timeit.timeit(lambda: new_monster(room, template), number=loops) / loops
+    print(f"  remise à neuf (pool)  {t_reuse * 1e6:8.2f} µs")
+    print(f"  nouvel objet          {t_new * 1e6:8.2f} µs")
+
+
+def lazy_respawn():
+    """Slime de salle_donjon_1 vaincu (comme victory_cleanup), puis le joueur s'éloigne."""
+    game = build_lazy_game(load_pack(), "bench", unload_after=3, seed=1)
+    game.output = OutputSink()
+    with game.session_output():
+        room = game.get_room_by_name("salle_donjon_1")
+        region = room.region
+        slime = room.characters.pop("slime")
+        game.get_respawner().killed(slime, room, "slime")
+        slime.drop_loot(game.locations)
+        game.player.current_room = game.get_room_by_name("village")
+        for _ in range(RespawnPool.DELAY - 1):
+            game.update_characters()
+        held = region.loaded
+        for _ in range(5):
+            game.update_characters()
+        unloaded = not region.loaded
+        game.get_room_by_name("salle_donjon_1")
+    game.output.drain()
+    back = room.characters.get("slime")
+    slimes = [c for c in game.characters if c.name == slime.name]
+    assert held and unloaded and back is not None and slimes == [back], (held, unloaded, slimes)
+    print(f"étages paresseux : {region.name} gardé chargé jusqu'à la réapparition, "
+          f"puis déchargé et rechargé ({len(slimes)} {slime.name} dans game.characters)")
+
+
+def same_tick():
+    """Deux monstres mobiles : C meurt, puis B meurt au tour où C revient."""
+    game = Game(seed=1)
+    game.setup(player_name="bench")
+    game.output = OutputSink()
+    pool = game.get_respawner()
+    pool.delay = 2
+    with game.session_output(), game.session_rng():
+        b, c = [m for m in game.characters if isinstance(m, MonsterCharacter) and not m.is_boss][:2]
+        game.update_characters()
+        scheduler = game.scheduler
+        for m in (b, c):
+            m.movable = True
+            scheduler.reschedule(m)
+
+        def kill(m):
+            room = m.current_room
+            key = next(k for k, v in room.characters.items() if v is m)
+            del room.characters[key]
+            pool.killed(m, room, key)
+
+        kill(c)
+        game.update_characters()
+        kill(b)
+        game.update_characters()
+        assert b not in scheduler.due and scheduler.due.get(c) is not None
+        for _ in range(30):
+            game.update_characters()
+    game.output.drain()
+    rooms = [r.name for r in game.rooms if any(v is b for v in r.characters.values())]
+    assert len(rooms) == 1 and b in scheduler.due, rooms
+    print("même tour : mort et réapparition, Scheduler à jour (un seul exemplaire de chaque monstre)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# bench_world_template.py
+# Compare la création de sessions : Game().setup() vs WorldTemplate.spawn().
+#
+# Usage : python benchmarks/bench_world_template.py [nb_sessions]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game
+from world_template import WorldTemplate
+
+
+def bench(label, factory, n):
+    start = time.perf_counter()
+    for i in range(n):
+        factory(f"joueur{i}")
+    elapsed = time.perf_counter() - start
+    rate = n / elapsed if elapsed > 0 else float("inf")
+    print(f"{label:<28} {n:>6} sessions  {elapsed:8.3f} s  {rate:10.1f} sessions/s")
+    return rate
+
+
+def setup_factory(name):
+    g = Game()
+    g.setup(player_name=name)
+    return g
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    template = WorldTemplate()
+
+    # Sanity : les mondes clonés sont indépendants
+    a, b = template.spawn("a"), template.spawn("b")
+    assert a.village is not b.village
+    assert a.foret.characters["gobelin"].current_room is a.foret
+    assert a.foret.characters["gobelin"] is not b.foret.characters["gobelin"]
+
+    base = bench("Game().setup()", setup_factory, n)
+    fast = bench("WorldTemplate.spawn()", template.spawn, n)
+    print(f"\nAccélération : x{fast / base:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# load_test_server.py
+# Test de charge du serveur asyncio (server.py) sur localhost.
+#  - le serveur tourne dans un processus séparé (descripteurs et CPU à part) ;
+#  - N clients se connectent, envoient leur nom, puis chacun joue la même
+#    petite séquence de commandes ; on mesure, par commande, le temps entre
+#    l'envoi de la ligne et la réception de l'invite ;
+#  - rapport p50 / p99 pour chaque palier de connexions simultanées.
+#
+# Usage : python benchmarks/load_test_server.py [paliers] [commandes_par_client]
+#   ex : python benchmarks/load_test_server.py 1000,5000,10000 5
+# Nécessite ulimit -n > nombre de connexions (+ marge).
+
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from server import PROMPT
+
+SCRIPT = ["look", "go bas", "look", "back", "check", "help", "go haut", "quests"]
+PROMPT_BYTES = PROMPT.encode()
+CONNECT_BATCH = 500
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port):
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "server.py"), "--port", str(port), "--idle", "600"],
+        stdout=subprocess.PIPE, text=True, cwd=ROOT,
+    )
+    proc.stdout.readline()  # "Serveur TBA sur ..."
+    return proc
+
+
+def cpu_seconds(pid):
+    """Temps CPU (user + sys) d'un processus, via /proc (Linux ; None ailleurs)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return float("nan")
+    k = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+async def connect(port, i):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 20)
+    await reader.readuntil(PROMPT_BYTES)
+    writer.write(f"bot{i}\n".encode())
+    await reader.readuntil(PROMPT_BYTES)
+    return reader, writer
+
+
+async def play(conn, n_commands, start, latencies, rng):
+    reader, writer = conn
+    await start.wait()
+    # étale les départs pour ne pas envoyer toutes les commandes au même instant
+    await asyncio.sleep(rng.random() * 0.5)
+    for k in range(n_commands):
+        line = SCRIPT[k % len(SCRIPT)]
+        t0 = time.perf_counter()
+        writer.write(line.encode() + b"\n")
+        await reader.readuntil(PROMPT_BYTES)
+        latencies.append(time.perf_counter() - t0)
+        await asyncio.sleep(rng.random() * 0.05)
+
+
+async def run_level(port, server_pid, n_clients, n_commands):
+    rng = random.Random(n_clients)
+    t0 = time.perf_counter()
+    conns = []
+    for base in range(0, n_clients, CONNECT_BATCH):
+        batch = range(base, min(n_clients, base + CONNECT_BATCH))
+        conns.extend(await asyncio.gather(*(connect(port, i) for i in batch)))
+    connect_time = time.perf_counter() - t0
+
+    start = asyncio.Event()
+    latencies = []
+    cpu0 = cpu_seconds(server_pid)
+    tasks = [asyncio.create_task(play(c, n_commands, start, latencies, rng)) for c in conns]
+    t1 = time.perf_counter()
+    start.set()
+    await asyncio.gather(*tasks)
+    play_time = time.perf_counter() - t1
+    cpu1 = cpu_seconds(server_pid)
+
+    for _, writer in conns:
+        writer.close()
+    await asyncio.gather(*(w.wait_closed() for _, w in conns), return_exceptions=True)
+
+    latencies.sort()
+    print(
+        f"{n_clients:>6} connexions  connexion {connect_time:6.2f} s  "
+        f"{len(latencies):>6} commandes en {play_time:6.2f} s ({len(latencies) / play_time:7.0f}/s)  "
+        f"p50 {percentile(latencies, 50) * 1e3:7.2f} ms  p99 {percentile(latencies, 99) * 1e3:8.2f} ms"
+    )
+    if cpu0 is not None and cpu1 is not None:
+        print(f"{'':>6}              CPU serveur {(cpu1 - cpu0) / len(latencies) * 1e6:6.0f} µs/commande")
+
+
+async def main(levels, n_commands):
+    port = free_port()
+    proc = start_server(port)
+    try:
+        for n in levels:
+            await run_level(port, proc.pid, n, n_commands)
+            await asyncio.sleep(1.0)  # laisse le serveur fermer les sessions
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == "__main__":
+    levels = [int(x) for x in (sys.argv[1] if len(sys.argv) > 1 else "1000,5000,10000").split(",")]
+    n_commands = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    asyncio.run(main(levels, n_commands))
@@ -0,0 +1,218 @@
+# catalog.py
+# Description: catalogue des objets (boutique, salle d'échange, récompenses).
+#
+# Le catalogue range des ItemDefinition (item.py), jamais des piles : il est
+# en lecture seule une fois construit et peut être partagé entre sessions
+# (world_template). Index secondaires :
+#   nom, type                   : dicts, O(1)
+#   prix de revente, niveau     : listes triées, plage par bisect, O(log n + k)
+#   stat (attack, armor, hp...) : liste triée par stat, construite à la première demande
+# Toutes les requêtes acceptent offset / limit : un marchand à des milliers
+# de références se parcourt page par page.
+#
+# Le stock d'un marchand (offers) est une liste ordonnée de (définition, prix
+# d'achat, libellé) ; la boutique du village est décrite par VILLAGE_SHOP.
+#
+# Exemple :
+#   catalog = game.get_catalog()
+#   catalog.new_item("potion_soin")              # Item neuf pour une récompense
+#   catalog.priced(10, 50, limit=9)              # revente entre 10 et 50 or
+#   catalog.top("attack", offset=9, limit=9)     # 2e page des meilleures armes
+#   catalog.sell_price(item)
+
+import bisect
+from operator import itemgetter
+
+from item import Item
+
+# Boutique du village : (nom, nom affiché, prix, description, type, attack, magic, armor, hp)
+VILLAGE_SHOP = (
+    ("serrated_dirk", "Serrated Dirk", 60, "Dague rapide : bon critique.", "weapon", 10, 0, 0, 0),
+    ("sheen", "Sheen", 150, "Cristal magique : augmente la magie.", "magic", 0, 3, 0, 0),
+    ("bramble_vest", "Bramble Vest", 80, "Armure épineuse : bonne défense + un peu de PV.", "armor", 0, 0, 4, 15),
+    ("zeal", "Zeal", 160, "Équipement léger : agilité / critique.", "other", 0, 0, 0, 0),
+    ("glacial_buckler", "Glacial Buckler", 100, "Bouclier : armure + PV.", "shield", 0, 0, 3, 10),
+    ("caulfields_warhammer", "Caulfield's Warhammer", 120, "Marteau lourd : bons dégâts.", "weapon", 16, 0, 0, 0),
+    ("b_f_sword", "B.F. Sword", 160, "Épée puissante : gros dégâts.", "weapon", 18, 0, 0, 0),
+)
+
+# Prix de revente des objets sans stat "vendable" : restes de monstres, et
+# objets de la boutique (moitié de leur prix de référence)
+SELL_PRICES = {
+    "reste_zombie": 8,
+    "reste_oeil": 10,
+    "reste_rat": 4,
+    "reste_champignon": 6,
+    "reste_chauve_souris": 5,
+    "b_f_sword": 260 // 2,
+    "bramble_vest": 160 // 2,
+    "caulfields_warhammer": 220 // 2,
+    "glacial_buckler": 180 // 2,
+    "serrated_dirk": 140 // 2,
+    "sheen": 150 // 2,
+    "zeal": 160 // 2,
+}
+DEFAULT_SELL_PRICE = 2
+
+# Stats indexables en plus des clés numériques de definition.stats
+STAT_ATTRS = (
+    "attack", "armor", "magic", "hp", "damage", "heal", "mana",
+    "crit_chance", "armor_phys", "armor_mag", "weight",
+)
+
+
+def sell_price(item):
+    """
+    Prix de revente d'un objet (ou d'une définition) :
+    1) stats["vendable"] si présent ; 2) SELL_PRICES ; 3) DEFAULT_SELL_PRICE.
+    """
+    vendable = item.stats.get("vendable")
+    if vendable is not None:
+        try:
+            return max(0, int(vendable))
+        except (TypeError, ValueError):
+            pass
+    return SELL_PRICES.get(item.name, DEFAULT_SELL_PRICE)
+
+
+def required_level(definition):
+    try:
+        return int(definition.stats.get("niveau_requis", 0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _stat(definition, stat):
+    if stat in STAT_ATTRS:
+        return getattr(definition, stat)
+    value = definition.stats.get(stat)
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+class _Sorted:
+    """Définitions triées par une clé numérique : keys[i] est la clé de defs[i]."""
+
+    __slots__ = ("keys", "defs")
+
+    def __init__(self, pairs):
+        pairs.sort(key=itemgetter(0))
+        self.keys = [k for k, _ in pairs]
+        self.defs = [d for _, d in pairs]
+
+    def range(self, low, high, offset, limit):
+        start = (0 if low is None else bisect.bisect_left(self.keys, low)) + offset
+        stop = len(self.keys) if high is None else bisect.bisect_right(self.keys, high)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self.defs[start:stop]
+
+    def descending(self, low, offset, limit):
+        first = 0 if low is None else bisect.bisect_left(self.keys, low)
+        stop = len(self.defs) - offset
+        start = first if limit is None else max(first, stop - limit)
+        return self.defs[start:stop][::-1] if stop > first else []
+
+
+def _page(seq, offset, limit):
+    return list(seq[offset:] if limit is None else seq[offset:offset + limit])
+
+
+class Catalog:
+    """Définitions d'objets indexées par nom, type, prix, niveau requis et stats."""
+
+    def __init__(self):
+        self.definitions = []
+        # nom -> première définition enregistrée sous ce nom (objets du monde d'abord)
+        self.by_name = {}
+        # type -> [définitions], ordre d'enregistrement
+        self.by_type = {}
+        # stock du marchand : [(définition, prix d'achat, libellé)]
+        self.offers = []
+        # index triés, (re)construits à la première requête après un ajout
+        self._by_price = None
+        self._by_level = None
+        self._by_stat = {}
+        self._known = set()
+
+    def __len__(self):
+        return len(self.definitions)
+
+    @classmethod
+    def from_game(cls, game):
+        """Objets nommés du Game (game.potion_soin...) puis boutique du village."""
+        catalog = cls()
+        for value in vars(game).values():
+            if isinstance(value, Item):
+                catalog.add(value.definition)
+        catalog.add_shop(VILLAGE_SHOP)
+        return catalog
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def add(self, definition, price=None, label=None):
+        """Enregistre definition ; price : prix d'achat si le marchand la vend."""
+        if price is not None:
+            self.offers.append((definition, price, label or definition.display_name))
+        if definition in self._known:
+            return definition
+        self._known.add(definition)
+        self.definitions.append(definition)
+        self.by_name.setdefault(definition.name, definition)
+        self.by_type.setdefault(definition.item_type, []).append(definition)
+        self._by_price = self._by_level = None
+        self._by_stat = {}
+        return definition
+
+    def add_shop(self, rows):
+        """Ajoute au stock des lignes au format de VILLAGE_SHOP."""
+        for name, display_name, price, desc, item_type, attack, magic, armor, hp in rows:
+            item = Item(name, desc, 0.1, type=item_type, attack=attack, magic=magic, armor=armor, hp=hp)
+            self.add(item.definition, price, display_name)
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def get(self, name):
+        return self.by_name.get(name)
+
+    def new_item(self, name, quantity=None):
+        """Nouvel Item de la définition name (récompenses), ou None."""
+        definition = self.by_name.get(name)
+        return None if definition is None else Item.of(definition, quantity)
+
+    def sell_price(self, item):
+        return sell_price(item)
+
+    def of_type(self, item_type, offset=0, limit=None):
+        return _page(self.by_type.get(item_type, ()), offset, limit)
+
+    def shop(self, offset=0, limit=None):
+        """Page du stock : [(définition, prix d'achat, libellé)]."""
+        return _page(self.offers, offset, limit)
+
+    def priced(self, low=None, high=None, offset=0, limit=None):
+        """Définitions dont le prix de revente est dans [low, high], du moins cher au plus cher."""
+        if self._by_price is None:
+            self._by_price = _Sorted([(sell_price(d), d) for d in self.definitions])
+        return self._by_price.range(low, high, offset, limit)
+
+    def for_level(self, level, offset=0, limit=None):
+        """Définitions utilisables au niveau level (niveau_requis <= level)."""
+        if self._by_level is None:
+            self._by_level = _Sorted([(required_level(d), d) for d in self.definitions])
+        return self._by_level.range(None, level, offset, limit)
+
+    def top(self, stat, minimum=1, offset=0, limit=None):
+        """Définitions dont stat >= minimum, de la plus forte à la plus faible."""
+        index = self._by_stat.get(stat)
+        if index is None:
+            pairs = []
+            for d in self.definitions:
+                value = _stat(d, stat)
+                if value is not None:
+                    pairs.append((value, d))
+            index = self._by_stat[stat] = _Sorted(pairs)
+        return index.descending(minimum, offset, limit)
@@ -1,9 +1,44 @@
 # Description: Character class (PNJ)
 
+import copy
+
 from room import Room
-import random
+from locations import CHARACTERS, ITEMS
+from effects import StatusEffects, REFRESH
+import output
+import rng
+from output import emit
 from typing import List, Optional, Dict
 
+# Paramètres de MonsterCharacter.__init__ -> attribut correspondant sur l'instance
+MONSTER_FIELDS = {
+    "hp": "hp_max",
+    "attack": "dmg_min",
+    "attack_max": "dmg_max",
+    "xp_reward": "xp_reward",
+    "defense": "armor_phys",
+    "armor_mag": "armor_mag",
+    "monster_type": "monster_type",
+    "weak_to": "weak_to",
+    "resist_to": "resist_to",
+    "speed": "speed",
+    "crit_chance": "crit_chance",
+    "is_boss": "is_boss",
+}
+
+# Clés internes ajoutées par MonsterCharacter à chaque pattern
+PATTERN_RUNTIME_KEYS = ("_cd_remaining",)
+
+# Effets des monstres (effects.py) : rage (permanente), renforcement (quelques tours)
+RAGE = "rage"
+BUFF = "buff"
+
+
+def _copy_loot(loot):
+    """Piles indépendantes des objets du butin (définitions partagées)."""
+    return [item.copy() for item in loot]
+
+
 def clamp(value, min_value, max_value):
     """Clamp la valeur entre min_value et max_value."""
     return max(min_value, min(value, max_value))
@@ -24,8 +59,11 @@ class Character:
             Liste de messages affichés quand on lui parle.
         movable : bool
             True si le PNJ peut se déplacer.
+        policy : politique de déplacement (scheduler.py), None = RandomWalk
     """
 
+    policy = None
+
     def __init__(self, name, description, current_room, msgs, movable=True):
         self.name = name
         self.description = description
@@ -41,21 +79,30 @@ class Character:
     def __str__(self):
         return f"{self.name} : {self.description}"
 
-    def move(self):
-        """Déplace éventuellement le PNJ dans une salle adjacente."""
+    def move(self, locations=None):
+        """
+        Déplace éventuellement le PNJ dans une salle adjacente.
+        locations : index des positions du monde (locations.py) à tenir à jour.
+        """
         if not self.movable:
             return False
 
         # 50% de chance de bouger
-        if not random.choice([True, False]):
+        r = rng.current()
+        if not r.choice([True, False]):
             return False
+        return self.wander(r, locations)
 
+    def wander(self, r, locations=None):
+        """Prend une sortie au hasard (False s'il n'y en a aucune)."""
         possible_rooms = [room for room in self.current_room.exits.values() if room is not None]
         if not possible_rooms:
             return False
+        self.relocate(r.choice(possible_rooms), locations)
+        return True
 
-        new_room = random.choice(possible_rooms)
-
+    def relocate(self, new_room, locations=None):
+        """Passe de la salle actuelle à new_room (dicts des salles et index locations)."""
         old_room = self.current_room
         key = self.name.lower()
         if key in old_room.characters:
@@ -63,7 +110,8 @@ class Character:
 
         self.current_room = new_room
         new_room.characters[key] = self
-        return True
+        if locations is not None:
+            locations.move(CHARACTERS, key, self, old_room, new_room)
 
     def get_msg(self):
         """Retourne un message du PNJ de manière cyclique."""
@@ -122,9 +170,8 @@ class MonsterCharacter(Character):
         # Loot = liste d'Item
         self.loot = list(loot) if loot else []
 
-        self.enraged = False
-
-        self.buff_turns = 0  # nombre de tours restants de buff
+        # Rage et renforcement (effects.StatusEffects), créés au premier effet
+        self.effects = None
         self.is_monster = True
         self.is_boss = is_boss
 
@@ -137,6 +184,58 @@ class MonsterCharacter(Character):
                 p_copy.setdefault("_cd_remaining", 0)
                 self.patterns.append(p_copy)
 
+    # -------------------------
+    # Réapparition (respawn.py)
+    # -------------------------
+    def spawn_args(self):
+        """
+        Paramètres de __init__ (hors salle) qui redonnent ce monstre tel que
+        défini dans _setup_characters : stats de base, butin, patterns.
+        """
+        args = {param: copy.copy(getattr(self, attr)) for param, attr in MONSTER_FIELDS.items()}
+        args.update(
+            name=self.name,
+            description=self.description,
+            msgs=list(self.msgs),
+            loot=_copy_loot(self.loot),
+            patterns=[{k: v for k, v in p.items() if k not in PATTERN_RUNTIME_KEYS} for p in self.patterns],
+            movable=self.movable,
+        )
+        return args
+
+    def respawn(self, room, args):
+        """Remet à neuf ce même objet dans room, d'après spawn_args() (butin recopié)."""
+        MonsterCharacter.__init__(
+            self, current_room=room,
+            **dict(args, loot=_copy_loot(args["loot"]), weak_to=list(args["weak_to"]),
+                   resist_to=list(args["resist_to"])),
+        )
+
+    # -------------------------
+    # Effets (effects.py)
+    # -------------------------
+    def get_effects(self):
+        if self.effects is None:
+            self.effects = StatusEffects()
+        return self.effects
+
+    @property
+    def enraged(self):
+        return self.effects is not None and self.effects.has(self, RAGE)
+
+    @property
+    def buff_turns(self):
+        """Tours restants du renforcement (0 : inactif)."""
+        return (self.effects is not None and self.effects.remaining(self, BUFF)) or 0
+
+    @property
+    def buff_active(self):
+        return self.buff_turns > 0
+
+    def tick_effects(self):
+        """Un tour de combat du monstre passe ; retourne les effets expirés."""
+        return self.effects.tick() if self.effects is not None else []
+
     # -------------------------
     # Méthodes de combat
     # -------------------------
@@ -147,12 +246,12 @@ class MonsterCharacter(Character):
         return self.hp <= 0
 
     def roll_damage(self):
-        return random.randint(self.dmg_min, self.dmg_max)
+        return rng.current().randint(self.dmg_min, self.dmg_max)
 
     def attack_player(self, player):
         dmg = self.roll_damage()
 
-        is_crit = random.random() * 100 <= self.crit_chance
+        is_crit = rng.current().random() * 100 <= self.crit_chance
         if is_crit:
             dmg = int(dmg * 1.7)
 
@@ -173,16 +272,19 @@ class MonsterCharacter(Character):
         bar = "█" * filled + "░" * empty
         return f"{self.name} : [{bar}] {self.hp}/{self.hp_max} PV"
 
-    def drop_loot(self):
-        """Dépose les objets du monstre dans la salle actuelle."""
+    def drop_loot(self, locations=None):
+        """Dépose les objets du monstre dans la salle actuelle (et dans l'index locations)."""
         if not self.loot:
             return
 
         room = self.current_room
-        print(f"\n{self.name} laisse tomber :")
+        emit(f"\n{self.name} laisse tomber :")
         for item in self.loot:
             room.inventory[item.name] = item
-            print(f"  - {item.name} : {item.description}")
+            if locations is not None:
+                locations.add(ITEMS, room, item.name, item)
+            emit(f"  - {item.name} : {item.description}")
+        output.event(output.LOOT, source=self.name, room=room.name, items=[item.name for item in self.loot])
 
         self.loot = []
 
@@ -201,6 +303,7 @@ class MonsterCharacter(Character):
 
         dmg = clamp(int(dmg), 0, 999999)
         self.hp = clamp(self.hp - dmg, 0, self.hp_max)
+        output.event(output.DAMAGE, target=self.name, amount=dmg, hp=self.hp, dmg_type=dmg_type)
         return dmg
 
     # -------------------------
@@ -208,28 +311,28 @@ class MonsterCharacter(Character):
     # -------------------------
     def decide_ai(self, player, context=None):
         context = context or {}
+        r = rng.current()
 
         if self.hp <= int(self.hp_max * 0.2):
             flee_chance = 20 + max(0, 10 - self.speed)
-            if random.randint(1, 100) <= flee_chance:
+            if r.randint(1, 100) <= flee_chance:
                 return {"action": "flee"}
 
         if not self.enraged and self.hp <= int(self.hp_max * 0.35):
-            if random.randint(1, 100) <= 40:
-                self.enraged = True
+            if r.randint(1, 100) <= 40:
+                self.get_effects().apply(self, RAGE, turns=None)
                 return {"action": "enrage"}
 
-        if self.buff_turns <= 0 and random.randint(1, 100) <= 10:
-            self.buff_turns = 2
+        if self.buff_turns <= 0 and r.randint(1, 100) <= 10:
+            self.get_effects().apply(self, BUFF, turns=2, rule=REFRESH)
             return {"action": "buff"}
 
         return {"action": "attack"}
 
     def perform_action(self, player, context=None):
+        self.tick_effects()
         dec = self.decide_ai(player, context)
         action = dec["action"]
-        if self.buff_turns > 0:
-            self.buff_turns -= 1
 
         if action == "flee":
             return {"result": "fled", "message": f"{self.name} tente de fuir !"}
@@ -267,11 +370,12 @@ class MonsterCharacter(Character):
         ]
         if not candidates:
             return self.patterns[0]
-        return random.choice(candidates)
+        return rng.current().choice(candidates)
 
     def perform_pattern(self, player, context=None):
         context = context or {}
         self.turn_counter += 1
+        self.tick_effects()
 
         for p in self.patterns:
             if p["_cd_remaining"] > 0:
@@ -287,10 +391,13 @@ class MonsterCharacter(Character):
         dmg_mult = pattern.get("dmg_mult", 1.0)
         pname = pattern.get("name", "Pattern")
 
-        dmg_base = int(random.randint(self.dmg_min, self.dmg_max) * dmg_mult)
-        is_crit = random.random() * 100 <= self.crit_chance
+        r = rng.current()
+        dmg_base = int(r.randint(self.dmg_min, self.dmg_max) * dmg_mult)
+        is_crit = r.random() * 100 <= self.crit_chance
         if is_crit:
             dmg_base = int(dmg_base * 1.7)
+        if self.buff_turns > 0:
+            dmg_base = int(dmg_base * 1.25)
 
         applied = player.take_damage(dmg_base) if hasattr(player, "take_damage") else dmg_base
 
@@ -313,7 +420,7 @@ class MonsterCharacter(Character):
             }
 
         if typ == "buff":
-            self.buff_active = True
+            self.get_effects().apply(self, BUFF, turns=pattern.get("duration", 2), rule=REFRESH)
             return {"result": "pattern_buff", "pattern": pname, "message": f"{self.name} utilise {pname} et se renforce."}
 
         return {"result": "none", "message": f"{self.name} hésite..."}
\ No newline at end of file
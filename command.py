@@ -1,4 +1,13 @@
-# This file contains the Command class.
+# This file contains the Command class and the CommandTable grammar.
+
+# The MSG0 variable is used when the command does not take any parameter.
+MSG0 = "\nLa commande '{command_word}' ne prend pas de paramètre.\n"
+# The MSG1 variable is used when the command takes 1 parameter.
+MSG1 = "\nLa commande '{command_word}' prend 1 seul paramètre.\n"
+# Other arities: show the usage from the help string.
+MSG_USAGE = "\nUsage : {command_word}{help_string}\n"
+MSG_UNKNOWN = "\nCommande '{command_word}' non reconnue. Entrez 'help' pour voir la liste des commandes disponibles.\n"
+MSG_AMBIGUOUS = "\nCommande '{command_word}' ambiguë : {candidates}.\n"
 
 class Command:
     """
@@ -9,10 +18,14 @@ class Command:
         help_string (str): The help string.
         action (function): The action to execute when the command is called.
         number_of_parameters (int): The number of parameters expected by the command.
+        max_parameters (int): The maximum number of parameters (Command.MANY: no limit).
+        aliases (tuple): Other words that run the command.
+        allow_prefix (bool): Whether a unique prefix of the word runs the command.
 
     Methods:
-        __init__(self, command_word, help_string, action, number_of_parameters) : The constructor.
+        __init__(self, command_word, help_string, action, number_of_parameters, ...) : The constructor.
         __str__(self) : The string representation of the command.
+        arity_error(self, nb_params) : The error message if nb_params is not accepted, else None.
 
     Examples:
 
@@ -29,17 +42,228 @@ class Command:
 
     """
 
+    # Unlimited number of parameters (ex: "quest <titre en plusieurs mots>").
+    MANY = -1
+
     # The constructor.
-    def __init__(self, command_word, help_string, action, number_of_parameters):
+    def __init__(self, command_word, help_string, action, number_of_parameters,
+                 max_parameters=None, aliases=(), allow_prefix=True):
         self.command_word = command_word
         self.help_string = help_string
         self.action = action
         self.number_of_parameters = number_of_parameters
+        self.max_parameters = number_of_parameters if max_parameters is None else max_parameters
+        self.aliases = tuple(aliases)
+        self.allow_prefix = allow_prefix
+
+    # The error message if the command does not accept nb_params parameters.
+    def arity_error(self, nb_params):
+        low, high = self.number_of_parameters, self.max_parameters
+        if nb_params >= low and (high == Command.MANY or nb_params <= high):
+            return None
+        if high == 0:
+            return MSG0.format(command_word=self.command_word)
+        if low == high == 1:
+            return MSG1.format(command_word=self.command_word)
+        return MSG_USAGE.format(command_word=self.command_word, help_string=self.help_string)
     
     # The string representation of the command.
     def __str__(self):
         return  self.command_word \
                 + self.help_string
-    
 
 
+class CommandTable(dict):
+    """
+    The commands of a game (game.commands) and their compiled grammar.
+
+    It behaves like the former dict {command_word: Command}. On top of that,
+    every accepted first word is compiled into one flat dict:
+    - command words and their aliases;
+    - unique prefixes ("hist" -> "history"), taken from a prefix trie of
+      the command words and aliases;
+    - shortcuts with preset arguments ("n" -> "go n", see add_shortcut),
+      which win over prefixes.
+
+    parse() then tokenizes once (str.split) and does one dict lookup. The
+    arity declared on the Command is checked there, before dispatch.
+
+    The table is read-only once built, and WorldTemplate shares it between
+    sessions: usage counters belong to the Game (Game.command_stats).
+
+    >>> table = CommandTable()
+    >>> table["history"] = Command("history", " : historique", None, 0)
+    >>> table["help"] = Command("help", " : aide", None, 0)
+    >>> table["go"] = Command("go", " <direction>", None, 1)
+    >>> table.add_shortcut("n", "go", "n")
+    >>> table.parse("  go   N ")[1]
+    ['go', 'N']
+    >>> table.parse("n")[1]
+    ['go', 'n']
+    >>> command, words, error = table.parse("hist")
+    >>> command.command_word, words, error
+    ('history', ['history'], None)
+    >>> print(table.parse("h")[2].strip())
+    Commande 'h' ambiguë : help, history.
+    >>> print(table.parse("go")[2].strip())
+    La commande 'go' prend 1 seul paramètre.
+    >>> table.stats({"history": 1}, 1)
+    {'hits': {'history': 1, 'help': 0, 'go': 0}, 'misses': 1}
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shortcuts = {}
+        self._grammar = None
+        self._ambiguous = {}
+
+    def __setitem__(self, command_word, command):
+        super().__setitem__(command_word, command)
+        self._grammar = None
+
+    def __delitem__(self, command_word):
+        super().__delitem__(command_word)
+        self._grammar = None
+
+    def add_shortcut(self, word, command_word, *args):
+        """The single word `word` runs `command_word *args` (ex: "nord" -> "go nord")."""
+        self.shortcuts[word.lower()] = (command_word, tuple(args))
+        self._grammar = None
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _compile(self):
+        # Every game builds the same table: the word -> command layout is
+        # compiled once per signature and shared, only the Command objects
+        # belong to this table.
+        signature = (
+            tuple((c.command_word, c.aliases, c.allow_prefix, c.number_of_parameters, c.max_parameters)
+                  for c in self.values()),
+            tuple(self.shortcuts.items()),
+        )
+        compiled = _compiled.get(signature)
+        if compiled is None:
+            compiled = _compiled[signature] = self._compile_layout()
+        layout, self._ambiguous = compiled
+        self._grammar = {word: (self[command_word],) + rest for word, (command_word, rest) in layout.items()}
+        return self._grammar
+
+    def _compile_layout(self):
+        # word -> command_word ; ambiguous prefixes apart
+        grammar = {}
+        for command in self.values():
+            grammar[command.command_word.lower()] = command
+            for alias in command.aliases:
+                grammar[alias.lower()] = command
+
+        # Prefix trie of the command words and aliases (not the shortcuts:
+        # "ba" must not mean "bas")
+        trie = {}
+        for word, command in grammar.items():
+            if not command.allow_prefix:
+                continue
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {"": []})
+                node[""].append(word)
+
+        prefixes = {}
+        ambiguous = {}
+        stack = [("", trie)]
+        while stack:
+            prefix, node = stack.pop()
+            for char, child in node.items():
+                if char == "":
+                    continue
+                key = prefix + char
+                stack.append((key, child))
+                if key in grammar:
+                    continue
+                targets = {grammar[w].command_word: grammar[w] for w in child[""]}
+                if len(targets) == 1:
+                    prefixes[key] = next(iter(targets.values()))
+                else:
+                    ambiguous[key] = sorted(targets)
+        grammar.update(prefixes)
+
+        layout = {word: _entry(command, word, ()) for word, command in grammar.items()}
+        for word, (command_word, args) in self.shortcuts.items():
+            if command_word in self:
+                layout[word] = _entry(self[command_word], word, args)
+                ambiguous.pop(word, None)
+        return layout, ambiguous
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def parse(self, command_string):
+        """
+        Returns (command, list_of_words, error).
+
+        list_of_words starts with the canonical command word, followed by the
+        preset arguments of a shortcut and the typed arguments. error is None
+        or the message to print; command is None if no command matched.
+        """
+        grammar = self._grammar or self._compile()
+        words = command_string.split()
+        try:
+            command, head, low, high = grammar[words[0]]
+        except (IndexError, KeyError):
+            return self._parse_other(grammar, words)
+        # exact command word: head is None, words are kept as typed
+        if head is not None:
+            words[0:1] = head
+        nb_params = len(words) - 1
+        if low <= nb_params <= high:
+            return command, words, None
+        return command, words, command.arity_error(nb_params)
+
+    def _parse_other(self, grammar, words):
+        # Empty input, other casing, ambiguous prefix or unknown word
+        if not words:
+            return None, words, None
+        first = words[0]
+        word = first.lower()
+        entry = grammar.get(word)
+        if entry is None:
+            candidates = self._ambiguous.get(word)
+            if candidates:
+                return None, words, MSG_AMBIGUOUS.format(command_word=first, candidates=", ".join(candidates))
+            return None, words, MSG_UNKNOWN.format(command_word=first)
+        command, head, low, high = entry
+        words[0:1] = (word,) if head is None else head
+        nb_params = len(words) - 1
+        if low <= nb_params <= high:
+            return command, words, None
+        return command, words, command.arity_error(nb_params)
+
+    def stats(self, hits, misses=0):
+        """Hits per command (most used first) from a {command_word: count} mapping, and misses."""
+        counts = sorted(((word, hits.get(word, 0)) for word in self), key=lambda h: -h[1])
+        return {"hits": dict(counts), "misses": misses}
+
+
+def _entry(command, word, preset):
+    """
+    Compiled grammar entry for `word`, without the Command: bounds are
+    resolved once (MANY -> no limit), and head is what replaces the typed
+    word (None when it already is the command word).
+    """
+    high = command.max_parameters
+    if high == Command.MANY:
+        high = float("inf")
+    low = command.number_of_parameters
+    if preset:
+        head = (command.command_word,) + tuple(preset)
+    elif word != command.command_word:
+        head = (command.command_word,)
+    else:
+        head = None
+    return command.command_word, (head, low, high)
+
+
+# (command signatures, shortcuts) -> (layout, ambiguous prefixes), shared by all tables
+_compiled = {}
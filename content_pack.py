@@ -0,0 +1,440 @@
+# content_pack.py
+# Description: content pack (données du monde) compilé depuis Game._setup_*,
+# puis rechargé en une seule lecture pour construire un Game.
+#
+# Usage :
+#   python content_pack.py compile [chemin]   -> régénère content/world.json
+
+import json
+import os
+import sys
+
+from room import Room
+from item import Item, ItemDefinition
+from character import Character, MonsterCharacter, MONSTER_FIELDS, PATTERN_RUNTIME_KEYS
+from quest import Quest
+from game import Game
+
+PACK_VERSION = 1
+DEFAULT_PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content", "world.json")
+
+# Régions chargées à la demande (regions.py) : nom -> attributs Game des salles.
+# Les salles absentes de cette table (village, forêt, capitale, sous-sol...)
+# forment la surface, toujours construite.
+DUNGEON_REGIONS = {
+    "donjon_1": ("donjon_1", "donjon_1_chambre", "donjon_1_tunnel", "salle_exploration"),
+    "donjon_2": ("donjon_2", "donjon_2_salle_1", "donjon_2_salle_2", "donjon_2_salle_3"),
+    "donjon_3": (
+        "d3_depart", "d3_arrivee", "d3_s1", "d3_s2", "d3_s3", "d3_s4", "d3_s5", "d3_s6",
+        "d3_s7", "d3_s8", "d3_s9", "d3_s10", "d3_s11", "d3_s12", "d3_s13", "d3_s14", "d3_s15",
+    ),
+    "donjon_4": ("donjon_4", "donjon_4_salle_1", "donjon_4_salle_2", "donjon_4_salle_3"),
+    "donjon_5": ("donjon_5", "donjon_5_salle_1", "donjon_5_salle_2", "donjon_5_salle_3"),
+    "donjon_boss": ("donjon_boss",),
+}
+
+
+class ContentPackError(Exception):
+    """Le monde ne peut pas être compilé/chargé (donnée non sérialisable, version...)."""
+
+
+# =========================================================
+# COMPILATION : Game déjà construit -> dict JSON
+# =========================================================
+
+class _Compiler:
+    def __init__(self, game):
+        self.game = game
+        self.room_index = {id(r): i for i, r in enumerate(game.rooms)}
+        self.item_defs = []
+        self.item_def_index = {}
+        self.items = []
+        self.item_index = {}
+        self.characters = []
+        self.char_index = {}
+
+    def room_ref(self, room):
+        if room is None:
+            return None
+        try:
+            return self.room_index[id(room)]
+        except KeyError:
+            raise ContentPackError(f"Salle '{room.name}' absente de game.rooms")
+
+    def item_ref(self, item):
+        """Index de l'instance ; les définitions identiques sont partagées."""
+        idx = self.item_index.get(id(item))
+        if idx is None:
+            definition = {
+                "name": item.name,
+                "description": item.description,
+                "weight": item.weight,
+                "display_name": item.display_name,
+                "item_type": item.item_type,
+                "quantity": item.quantity,
+                # déjà normalisées via Item._KEY_MAP par Item.__init__
+                "stats": dict(item.stats),
+            }
+            key = json.dumps(definition, sort_keys=True, ensure_ascii=False)
+            def_idx = self.item_def_index.get(key)
+            if def_idx is None:
+                def_idx = len(self.item_defs)
+                self.item_def_index[key] = def_idx
+                self.item_defs.append(definition)
+            idx = len(self.items)
+            self.item_index[id(item)] = idx
+            self.items.append(def_idx)
+        return idx
+
+    def char_ref(self, char):
+        idx = self.char_index.get(id(char))
+        if idx is None:
+            idx = len(self.characters)
+            self.char_index[id(char)] = idx
+            self.characters.append(None)
+            self.characters[idx] = self.compile_character(char)
+        return idx
+
+    def compile_character(self, char):
+        data = {
+            "name": char.name,
+            "description": char.description,
+            "room": self.room_ref(char.current_room),
+            "msgs": list(char.msgs),
+            "movable": char.movable,
+        }
+        if isinstance(char, MonsterCharacter):
+            data["monster"] = {param: getattr(char, attr) for param, attr in MONSTER_FIELDS.items()}
+            data["loot"] = [self.item_ref(it) for it in char.loot]
+            patterns = []
+            for p in char.patterns:
+                if any(callable(v) for v in p.values()):
+                    raise ContentPackError(f"Pattern non sérialisable pour {char.name} : {p.get('name')}")
+                patterns.append({k: v for k, v in p.items() if k not in PATTERN_RUNTIME_KEYS})
+            data["patterns"] = patterns
+        return data
+
+    def compile(self):
+        game = self.game
+        pack = {"version": PACK_VERSION}
+
+        pack["rooms"] = [[r.name, r.description] for r in game.rooms]
+        pack["exits"] = [[[d, self.room_ref(t)] for d, t in r.exits.items()] for r in game.rooms]
+
+        # Ordre stable : personnages de game.characters d'abord, puis ceux
+        # uniquement placés dans une salle (ex: marchand_ambulant).
+        for c in game.characters:
+            self.char_ref(c)
+        pack["room_characters"] = [[[k, self.char_ref(c)] for k, c in r.characters.items()] for r in game.rooms]
+        pack["room_items"] = [[[k, self.item_ref(it)] for k, it in r.inventory.items()] for r in game.rooms]
+        pack["game_characters"] = [self.char_ref(c) for c in game.characters]
+
+        # Références nommées sur Game (game.village, game.potion_soin, game.marchand_ambulant...)
+        attrs = {"rooms": {}, "items": {}, "characters": {}}
+        for attr, value in vars(game).items():
+            if isinstance(value, Room) and id(value) in self.room_index:
+                attrs["rooms"][attr] = self.room_index[id(value)]
+            elif isinstance(value, Item):
+                attrs["items"][attr] = self.item_ref(value)
+            elif isinstance(value, Character):
+                attrs["characters"][attr] = self.char_ref(value)
+        pack["attrs"] = attrs
+
+        pack["regions"] = {
+            region: [attrs["rooms"][attr] for attr in room_attrs if attr in attrs["rooms"]]
+            for region, room_attrs in DUNGEON_REGIONS.items()
+        }
+
+        quests = []
+        for q in game.player.quest_manager.quests:
+            if isinstance(q.reward, Item):
+                reward = {"item": self.item_ref(q.reward)}
+            elif q.reward is None:
+                reward = None
+            else:
+                reward = {"text": str(q.reward)}
+            quests.append({
+                "title": q.title,
+                "description": q.description,
+                "objectives": list(q.objectives),
+                "reward": reward,
+                "xp_reward": q.xp_reward,
+                "category": q.category,
+            })
+        pack["quests"] = quests
+
+        pack["dialogues"] = game.dialogues
+        pack["player"] = {
+            "room": self.room_ref(game.player.current_room),
+            "max_weight": game.player.max_weight,
+        }
+
+        pack["item_defs"] = self.item_defs
+        pack["items"] = self.items
+        pack["characters"] = self.characters
+        return pack
+
+
+def compile_pack(game=None):
+    """
+    Compile les définitions de Game._setup_* en content pack (dict JSON).
+    Si game est None, un Game est construit via setup().
+    """
+    if game is None:
+        game = Game()
+        game.setup(player_name="compiler")
+    return _Compiler(game).compile()
+
+
+def save_pack(pack, path=DEFAULT_PACK_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(pack, f, ensure_ascii=False, separators=(",", ":"))
+
+
+# =========================================================
+# CHARGEMENT : content pack -> Game
+# =========================================================
+
+class ContentPack:
+    """
+    Content pack chargé en mémoire.
+
+    data : dict JSON tel que produit par compile_pack().
+    Les définitions d'objets (item.ItemDefinition, une par définition
+    distincte) sont construites une seule fois ; chaque Game reçoit ensuite
+    des piles (Item) qui les partagent.
+    """
+
+    def __init__(self, data):
+        if data.get("version") != PACK_VERSION:
+            raise ContentPackError(f"Version de content pack non supportée : {data.get('version')}")
+        self.data = data
+        self._item_defs = None
+        # fichier d'origine (load_pack), None pour un pack construit en mémoire
+        self.path = None
+
+    def __reduce__(self):
+        # Un pack lu depuis un fichier n'est pas copié avec le Game picklé
+        # (migration de session) : le processus qui le reçoit le relit une
+        # fois, via le cache de load_pack().
+        if self.path is not None:
+            return load_pack, (self.path,)
+        return ContentPack, (self.data,)
+
+    def item_definitions(self):
+        if self._item_defs is None:
+            get = ItemDefinition.get
+            self._item_defs = [
+                get(d["name"], d["description"], d["weight"], d["display_name"],
+                    d["item_type"], d["quantity"], d["stats"])
+                for d in self.data["item_defs"]
+            ]
+        return self._item_defs
+
+    def new_item(self, item_idx):
+        """Nouvelle instance indépendante de l'objet n° item_idx du pack."""
+        return Item.of(self.item_definitions()[self.data["items"][item_idx]])
+
+
+_pack_cache = {}
+
+
+def load_pack(path=DEFAULT_PACK_PATH):
+    """Lit le content pack en une seule lecture (mis en cache par chemin + mtime)."""
+    mtime = os.path.getmtime(path)
+    cached = _pack_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        pack = ContentPack(json.loads(f.read()))
+    pack.path = path
+    _pack_cache[path] = (mtime, pack)
+    return pack
+
+
+class WorldBuilder:
+    """
+    Construit les objets d'un content pack à la demande, avec mémo par index :
+    une salle, un objet ou un personnage n'est créé qu'une fois, même s'il est
+    référencé depuis plusieurs endroits (sorties, loot, récompenses...).
+
+    room(i) crée une salle "coquille" (nom + description) ; fill_room(i)
+    y branche ses sorties, objets et personnages. regions.py ne remplit que
+    les régions visitées ; build_game() passe par build_all(), sans mémo.
+    """
+
+    def __init__(self, pack):
+        self.pack = pack
+        self.data = pack.data
+        self.rooms = [None] * len(self.data["rooms"])
+        self.items = [None] * len(self.data["items"])
+        self.characters = [None] * len(self.data["characters"])
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["data"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.data = self.pack.data
+
+    def room(self, i):
+        room = self.rooms[i]
+        if room is None:
+            name, description = self.data["rooms"][i]
+            room = self.rooms[i] = Room(name, description)
+        return room
+
+    def item(self, i):
+        item = self.items[i]
+        if item is None:
+            item = self.items[i] = self.pack.new_item(i)
+        return item
+
+    def character(self, i):
+        char = self.characters[i]
+        if char is not None:
+            return char
+        d = self.data["characters"][i]
+        room = self.room(d["room"]) if d["room"] is not None else None
+        monster = d.get("monster")
+        if monster is None:
+            char = Character(d["name"], d["description"], room, d["msgs"], movable=d["movable"])
+        else:
+            char = MonsterCharacter(
+                d["name"], d["description"], room, d["msgs"],
+                loot=[self.item(j) for j in d["loot"]],
+                patterns=d["patterns"],
+                movable=d["movable"],
+                **monster,
+            )
+        self.characters[i] = char
+        return char
+
+    def fill_room(self, i, room_items=None, room_characters=None):
+        """
+        Branche sorties, objets et personnages (références précalculées).
+        room_items / room_characters : listes [clé, index] remplaçant celles
+        du pack (état sauvegardé d'une région déchargée).
+        """
+        data = self.data
+        if room_items is None:
+            room_items = data["room_items"][i]
+        if room_characters is None:
+            room_characters = data["room_characters"][i]
+        room = self.room(i)
+        room_of = self.room
+        room.exits = {d: (room_of(j) if j is not None else None) for d, j in data["exits"][i]}
+        room.inventory = {k: self.item(j) for k, j in room_items}
+        chars = {k: self.character(j) for k, j in room_characters}
+        # un PNJ a pu entrer dans la coquille avant son remplissage
+        chars.update(room.characters)
+        room.characters = chars
+        return room
+
+    def build_all(self):
+        """
+        Construit tout le pack d'un coup : objets, salles et personnages en
+        une passe chacun, puis sorties et placements, sans les accesseurs
+        mémoïsés (monde complet de build_game). Retourne les salles.
+        """
+        data = self.data
+        definitions = self.pack.item_definitions()
+        of = Item.of
+        items = self.items = [of(definitions[d]) for d in data["items"]]
+        rooms = self.rooms = [Room(name, description) for name, description in data["rooms"]]
+
+        characters = self.characters = []
+        for d in data["characters"]:
+            room = rooms[d["room"]] if d["room"] is not None else None
+            monster = d.get("monster")
+            if monster is None:
+                char = Character(d["name"], d["description"], room, d["msgs"], movable=d["movable"])
+            else:
+                char = MonsterCharacter(
+                    d["name"], d["description"], room, d["msgs"],
+                    loot=[items[j] for j in d["loot"]],
+                    patterns=d["patterns"],
+                    movable=d["movable"],
+                    **monster,
+                )
+            characters.append(char)
+
+        for room, exits, room_items, room_characters in zip(
+                rooms, data["exits"], data["room_items"], data["room_characters"]):
+            room.exits = {d: (rooms[j] if j is not None else None) for d, j in exits}
+            if room_items:
+                room.inventory = {k: items[j] for k, j in room_items}
+            if room_characters:
+                room.characters = {k: characters[j] for k, j in room_characters}
+        return rooms
+
+    def new_game(self, seed=None, directions=None):
+        """Game avec commandes, objets nommés et dialogues (ni salles ni joueur)."""
+        game = Game(seed, directions)
+        game._setup_commands()
+        for attr, i in self.data["attrs"]["items"].items():
+            setattr(game, attr, self.item(i))
+        game.dialogues = self.data["dialogues"]
+        return game
+
+    def setup_player(self, game, player_name=None):
+        """Joueur et quêtes ; les salles de surface doivent déjà exister."""
+        data = self.data
+        game._setup_player(player_name)
+        game.player.current_room = self.room(data["player"]["room"])
+        game.player.max_weight = data["player"]["max_weight"]
+
+        qm = game.player.quest_manager
+        for d in data["quests"]:
+            reward = d["reward"]
+            if reward is not None:
+                reward = self.item(reward["item"]) if "item" in reward else reward["text"]
+            qm.add_quest(Quest(
+                d["title"], d["description"], list(d["objectives"]), reward, d["xp_reward"],
+                d.get("category", Quest.DEFAULT_CATEGORY),
+            ))
+
+
+def build_game(pack, player_name=None, seed=None, directions=None):
+    """
+    Construit un Game complet depuis un content pack (sans exécuter _setup_*) ;
+    seed : voir rng.py ; directions : jeu de directions du monde (directions.py).
+    """
+    if not isinstance(pack, ContentPack):
+        pack = ContentPack(pack)
+    builder = WorldBuilder(pack)
+    data = pack.data
+
+    rooms = builder.build_all()
+    characters = builder.characters
+    game = builder.new_game(seed, directions)
+    game.rooms = list(rooms)
+    game.characters = [characters[i] for i in data["game_characters"]]
+
+    attrs = data["attrs"]
+    for attr, i in attrs["rooms"].items():
+        setattr(game, attr, rooms[i])
+    for attr, i in attrs["characters"].items():
+        setattr(game, attr, characters[i])
+
+    game._register_directions()
+    builder.setup_player(game, player_name)
+    return game
+
+
+def load_game(player_name=None, path=DEFAULT_PACK_PATH, seed=None, directions=None):
+    """Raccourci : lit (ou réutilise) le content pack et construit un Game."""
+    return build_game(load_pack(path), player_name, seed, directions)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "compile":
+        out = sys.argv[2] if len(sys.argv) >= 3 else DEFAULT_PACK_PATH
+        save_pack(compile_pack(), out)
+        print(f"Content pack écrit : {out}")
+    else:
+        print("Usage : python content_pack.py compile [chemin]")
@@ -0,0 +1,111 @@
+# directions.py
+# Description: jeux de directions propres à chaque monde (game.directions).
+#
+# Un DirectionSet est immuable : les saisies reconnues ("n", "nord",
+# "monter"...) vers le nom canonique ("N", "haut"), et les noms de sortie
+# numérotés (codes entiers utilisés par room_store.RoomStore). Les mondes
+# partagent le même objet sans verrou ; ajouter des directions en crée
+# un nouveau (copie à l'écriture), les codes déjà attribués restant
+# inchangés.
+#
+# Exemple : labyrinthe généré avec des diagonales
+#   diagonals = DEFAULT_DIRECTIONS.with_aliases({"ne": "NE", "nord-est": "NE"})
+#   game = Game(directions=diagonals)
+
+from types import MappingProxyType
+
+
+class DirectionSet:
+    """Saisies -> noms canoniques, et noms de sortie -> codes entiers."""
+
+    __slots__ = ("aliases", "names", "codes", "_codes", "_inputs", "_input_codes")
+
+    def __init__(self, aliases, names=()):
+        # aliases : saisie en minuscules -> nom canonique
+        self.aliases = MappingProxyType(dict(aliases))
+        ordered = list(names)
+        for name in self.aliases.values():
+            if name not in ordered:
+                ordered.append(name)
+        self.names = tuple(ordered)
+        self._codes = {name: code for code, name in enumerate(self.names)}
+        self.codes = MappingProxyType(self._codes)
+        # saisies déjà normalisées : alias et noms canoniques
+        inputs = dict(self.aliases)
+        inputs.update((name, name) for name in self.aliases.values())
+        self._inputs = inputs
+        self._input_codes = {word: self._codes[name] for word, name in inputs.items()}
+
+    def __setattr__(self, attr, value):
+        if hasattr(self, attr):
+            raise AttributeError(f"DirectionSet est immuable ({attr})")
+        object.__setattr__(self, attr, value)
+
+    def __reduce__(self):
+        return DirectionSet, (dict(self.aliases), self.names)
+
+    def __contains__(self, name):
+        return name in self.codes
+
+    def __repr__(self):
+        return f"<DirectionSet {', '.join(self.names)}>"
+
+    def normalize(self, direction):
+        """
+        Nom canonique d'une saisie ('n', 'Nord', 'U' -> 'N', 'N', 'haut'),
+        None si elle n'est pas reconnue.
+        """
+        if not isinstance(direction, str):
+            return None
+        name = self._inputs.get(direction)
+        if name is not None:
+            return name
+        return self.aliases.get(direction.strip().lower())
+
+    def code(self, name):
+        """Code entier d'un nom de sortie (None s'il n'est pas dans le jeu)."""
+        return self._codes.get(name)
+
+    # ------------------------------------------------------------------
+    # Copie à l'écriture
+    # ------------------------------------------------------------------
+
+    def including(self, names):
+        """Jeu comprenant aussi ces noms de sortie ; self s'ils y sont tous déjà."""
+        extra = [name for name in dict.fromkeys(names) if name not in self.codes]
+        if not extra:
+            return self
+        return DirectionSet(self.aliases, self.names + tuple(extra))
+
+    def with_aliases(self, aliases):
+        """Jeu avec des saisies en plus (ou redéfinies), ex: {"ne": "NE"}."""
+        merged = dict(self.aliases)
+        merged.update((word.lower(), name) for word, name in aliases.items())
+        return DirectionSet(merged, self.names)
+
+
+# Directions du jeu de base, partagées par tous les mondes qui n'en
+# déclarent pas d'autres.
+DEFAULT_DIRECTIONS = DirectionSet({
+    "n": "N",
+    "nord": "N",
+
+    "s": "S",
+    "sud": "S",
+
+    "e": "E",
+    "est": "E",
+
+    "o": "O",
+    "ouest": "O",
+
+    "u": "haut",
+    "up": "haut",
+    "haut": "haut",
+    "monter": "haut",
+
+    "d": "bas",
+    "down": "bas",
+    "bas": "bas",
+    "descendre": "bas",
+})
@@ -0,0 +1,151 @@
+# effects.py
+# Description: effets temporaires (buffs, rage...) des joueurs et des monstres.
+#
+# Les effets actifs sont rangés dans une roue de minuteurs : des paniers
+# indexés par tour d'expiration. Un tour (tick) ne lit que le panier du tour
+# courant : rien à faire quand aucun effet n'expire, quel que soit le
+# nombre d'effets en cours. Appliquer, prolonger ou retirer un effet coûte
+# O(1) ; une entrée devenue obsolète (effet prolongé ou retiré) est ignorée
+# quand son panier est vidé.
+#
+# Une roue peut servir à plusieurs cibles (raid, monde partagé) : un effet
+# est identifié par (cible, nom). Chaque joueur et chaque monstre a par
+# défaut la sienne, avancée à chacun de ses tours de combat.
+#
+# Règles de cumul quand l'effet est déjà actif :
+#   MAX     : garde le plus fort montant et la plus longue durée (buffs du joueur)
+#   REFRESH : remplace le montant, repart pour turns tours
+#   STACK   : ajoute le montant (jusqu'à max_stacks cumuls), repart pour turns tours
+# turns=None : effet permanent, jusqu'à remove() (rage d'un monstre).
+#
+# Exemple :
+#   effects = StatusEffects()
+#   effects.apply(player, "attack", 5, turns=3)
+#   effects.amount(player, "attack")      # 5
+#   expired = effects.tick()              # [] puis, au 3e tour, [<Effect attack>]
+
+MAX = "max"
+REFRESH = "refresh"
+STACK = "stack"
+
+
+class Effect:
+    """Effet actif : montant, cumuls et tour d'expiration (None : permanent)."""
+
+    __slots__ = ("target", "name", "amount", "stacks", "expires")
+
+    def __init__(self, target, name, amount, expires):
+        self.target = target
+        self.name = name
+        self.amount = amount
+        self.stacks = 1
+        self.expires = expires
+
+    def __repr__(self):
+        return f"<Effect {self.name} {self.amount}>"
+
+
+class StatusEffects:
+    """Effets actifs par (cible, nom) et paniers par tour d'expiration."""
+
+    def __init__(self):
+        self.now = 0
+        # (cible, nom) -> Effect
+        self.active = {}
+        # tour d'expiration -> [Effect]
+        self.buckets = {}
+
+    def __len__(self):
+        return len(self.active)
+
+    def _schedule(self, effect, turns):
+        if turns is None:
+            effect.expires = None
+            return
+        effect.expires = self.now + max(1, int(turns))
+        self.buckets.setdefault(effect.expires, []).append(effect)
+
+    # ------------------------------------------------------------------
+    # Effets
+    # ------------------------------------------------------------------
+
+    def apply(self, target, name, amount=0, turns=1, rule=MAX, max_stacks=None):
+        """Applique (ou cumule, selon rule) l'effet name sur target ; retourne l'Effect."""
+        key = (target, name)
+        effect = self.active.get(key)
+        if effect is None:
+            effect = self.active[key] = Effect(target, name, amount, None)
+            self._schedule(effect, turns)
+            return effect
+
+        if rule == MAX:
+            effect.amount = max(effect.amount, amount)
+            if effect.expires is not None and (turns is None or self.now + turns > effect.expires):
+                self._schedule(effect, turns)
+        else:
+            if rule == STACK:
+                if max_stacks is None or effect.stacks < max_stacks:
+                    effect.amount += amount
+                    effect.stacks += 1
+            else:
+                effect.amount = amount
+            self._schedule(effect, turns)
+        return effect
+
+    def get(self, target, name):
+        return self.active.get((target, name))
+
+    def has(self, target, name):
+        return (target, name) in self.active
+
+    def amount(self, target, name, default=0):
+        effect = self.active.get((target, name))
+        return default if effect is None else effect.amount
+
+    def remaining(self, target, name):
+        """Tours restants (None : permanent ou absent)."""
+        effect = self.active.get((target, name))
+        if effect is None or effect.expires is None:
+            return None
+        return effect.expires - self.now
+
+    def remove(self, target, name):
+        """Retire l'effet (son entrée de panier sera ignorée) ; retourne l'Effect ou None."""
+        return self.active.pop((target, name), None)
+
+    def effects_of(self, target):
+        return [e for (t, _), e in self.active.items() if t is target]
+
+    # ------------------------------------------------------------------
+    # Temps
+    # ------------------------------------------------------------------
+
+    def tick(self, n=1):
+        """Avance de n tours ; retourne les effets expirés, dans l'ordre d'expiration."""
+        start = self.now
+        buckets = self.buckets
+        if n == 1:
+            # cas courant : un seul panier à regarder
+            self.now = start + 1
+            if self.now not in buckets:
+                return []
+            due = (self.now,)
+        else:
+            self.now += max(0, int(n))
+            if not buckets:
+                return []
+            if self.now - start <= len(buckets):
+                due = [t for t in range(start + 1, self.now + 1) if t in buckets]
+            else:
+                due = sorted(t for t in buckets if t <= self.now)
+
+        expired = []
+        active = self.active
+        for t in due:
+            for effect in buckets.pop(t):
+                key = (effect.target, effect.name)
+                # entrée obsolète : effet prolongé (autre panier) ou retiré
+                if effect.expires == t and active.get(key) is effect:
+                    del active[key]
+                    expired.append(effect)
+        return expired
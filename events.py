@@ -0,0 +1,177 @@
+# events.py
+# Description: bus d'événements du domaine (un par Game : game.events).
+#
+# Le moteur publie ce qui s'est passé (le joueur s'est déplacé, a obtenu un
+# objet, a tué un monstre, a parlé à un PNJ) ; les quêtes, le scénario
+# (story.py) ou la télémétrie s'abonnent à un type d'événement, pour une
+# cible précise ou pour toutes. publish() ne parcourt que les abonnés
+# concernés : deux recherches dans un dict, puis leurs handlers.
+#
+# À ne pas confondre avec output.event() : les événements de sortie sont
+# destinés au client (texte + événements d'une commande), ceux-ci restent
+# dans le moteur.
+#
+# Exemple :
+#   game.events.subscribe(PlayerMoved, on_village, target="village")
+#   game.events.publish(PlayerMoved(player, origin, room, "N"))
+
+from collections import Counter
+
+from output import emit
+
+
+class DomainEvent:
+    """Événement du domaine ; target : nom de la cible, clé des abonnements."""
+
+    __slots__ = ()
+
+    @property
+    def target(self):
+        return None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class PlayerMoved(DomainEvent):
+    """Le joueur est entré dans room (cible : nom de la salle)."""
+
+    __slots__ = ("player", "origin", "room", "direction")
+
+    def __init__(self, player, origin, room, direction):
+        self.player = player
+        self.origin = origin
+        self.room = room
+        self.direction = direction
+
+    @property
+    def target(self):
+        return self.room.name
+
+
+class ItemObtained(DomainEvent):
+    """Un objet est entré dans l'inventaire du joueur (cible : nom de l'objet)."""
+
+    __slots__ = ("player", "item", "quantity")
+
+    def __init__(self, player, item, quantity):
+        self.player = player
+        self.item = item
+        self.quantity = quantity
+
+    @property
+    def target(self):
+        return self.item.name
+
+
+class MonsterKilled(DomainEvent):
+    """Le joueur a vaincu un monstre (cible : nom du monstre)."""
+
+    __slots__ = ("player", "monster")
+
+    def __init__(self, player, monster):
+        self.player = player
+        self.monster = monster
+
+    @property
+    def target(self):
+        return self.monster.name
+
+
+class NpcTalkedTo(DomainEvent):
+    """Le joueur a parlé à un PNJ (cible : clé du PNJ dans la salle, ex: "marchand_ambulant")."""
+
+    __slots__ = ("player", "npc_key")
+
+    def __init__(self, player, npc_key):
+        self.player = player
+        self.npc_key = npc_key
+
+    @property
+    def target(self):
+        return self.npc_key
+
+
+EVENT_TYPES = (PlayerMoved, ItemObtained, MonsterKilled, NpcTalkedTo)
+
+
+class EventBus:
+    """
+    Abonnements par (type d'événement, cible).
+
+    Pour un événement, les abonnés de toutes les cibles (target=None)
+    passent d'abord, puis ceux de sa cible, chacun dans l'ordre
+    d'abonnement. L'erreur d'un abonné est affichée et n'empêche pas les
+    suivants (comme les anciens try/except autour des quêtes).
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self.published = 0
+
+    def subscribe(self, event_type, handler, target=None):
+        """handler(event) ; retourne l'abonnement (pour unsubscribe)."""
+        key = (event_type, target)
+        handlers = self._handlers.get(key)
+        if handlers is None:
+            handlers = self._handlers[key] = []
+        handlers.append(handler)
+        return key, handler
+
+    def unsubscribe(self, subscription):
+        key, handler = subscription
+        handlers = self._handlers.get(key)
+        if handlers is None or handler not in handlers:
+            return False
+        handlers.remove(handler)
+        if not handlers:
+            del self._handlers[key]
+        return True
+
+    def subscribers(self, event_type, target=None):
+        return list(self._handlers.get((event_type, target), ()))
+
+    def publish(self, event):
+        self.published += 1
+        event_type = type(event)
+        handlers = self._handlers.get((event_type, None))
+        if handlers:
+            self._dispatch(handlers, event)
+        target = event.target
+        if target is not None:
+            handlers = self._handlers.get((event_type, target))
+            if handlers:
+                self._dispatch(handlers, event)
+
+    @staticmethod
+    def _dispatch(handlers, event):
+        # copie : un abonné peut se désabonner pendant l'envoi
+        for handler in tuple(handlers):
+            try:
+                handler(event)
+            except Exception as e:
+                name = getattr(handler, "__qualname__", repr(handler))
+                emit(f"\n[ERREUR {type(event).__name__}] {name}({event.target}) -> {e}\n")
+
+
+class Telemetry:
+    """Compte les événements publiés, par type et par cible."""
+
+    def __init__(self, bus=None):
+        self.counts = Counter()
+        if bus is not None:
+            self.attach(bus)
+
+    def attach(self, bus):
+        for event_type in EVENT_TYPES:
+            bus.subscribe(event_type, self.record)
+
+    def record(self, event):
+        self.counts[type(event).__name__, event.target] += 1
+
+    def by_type(self):
+        totals = Counter()
+        for (name, _), n in self.counts.items():
+            totals[name] += n
+        return dict(totals)
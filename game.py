@@ -1,28 +1,49 @@
 # game.py
 # Description: Game class
 
+import sys
+from collections import Counter
+
 from room import Room
+from directions import DEFAULT_DIRECTIONS
+from room_index import RoomRegistry
 from player import Player
-from command import Command
+from command import Command, CommandTable
 from actions import Actions
 from item import Item
 from character import Character, MonsterCharacter
 from quest import Quest
+import output
+from output import emit, CommandResult, use_sink
+from rng import GameRandom, use_rng
+from events import EventBus
+from navigation import Navigation
+from locations import LocationIndex
+from scheduler import Scheduler
+from world_clock import WorldClock
+from respawn import RespawnPool
+from catalog import Catalog
+import story
 
 DEBUG = True
 
 
 class Game:
     # Constructor
-    def __init__(self):
+    def __init__(self, seed=None, directions=None):
         self.finished = False
         self.rooms = []
-        self.commands = {}
-        self.player = None
+        self.commands = CommandTable()
         self.characters = []
-        self.gui = None
         self.dialogues = {}
-        
+        # Étages du donjon construits à la demande (regions.RegionManager), sinon None
+        self.regions = None
+        # Définitions d'objets indexées (catalog.py) : boutique, échange, récompenses
+        self.catalog = None
+        # Directions de ce monde (directions.DirectionSet, immuable) : saisies
+        # reconnues et noms de sortie ; un monde peut avoir les siennes
+        self.directions = directions or DEFAULT_DIRECTIONS
+        self.reset_session_state(seed)
 
         # PNJ qui suit le joueur (ex: le marchand)
         self.following_npc = None
@@ -39,6 +60,39 @@ class Game:
         # le mage a-t-il déjà intervenu dans ce combat spécial ?
         self.mage_already_intervened = False
 
+    def reset_session_state(self, seed=None):
+        """
+        (Re)crée l'état propre à une session : joueur, sorties, aléatoire,
+        journaux, index et minuteurs. WorldTemplate ne clone jamais ces
+        attributs (ils sont relevés ici) et appelle cette méthode sur
+        chaque nouvelle session : tout nouvel état par session va ici.
+        """
+        self.player = None
+        self.gui = None
+        # Sortie de la session (output.OutputSink) ; None = sys.stdout
+        self.output = None
+        # Aléatoire de la session (voir rng.py) : graine None = tirée au hasard
+        self.rng = GameRandom(seed)
+        # Commandes jouées, dans l'ordre, si start_recording() a été appelé :
+        # avec la graine, de quoi rejouer la partie (rng.replay). None par
+        # défaut : une session longue (serveur, bot) ne garde rien
+        self.command_log = None
+        # Commandes reconnues de cette session (mot de commande -> nombre) et
+        # saisies non reconnues ; la table des commandes, elle, est partagée
+        self.command_hits = Counter()
+        self.command_misses = 0
+        # Bus des événements du domaine (events.py) ; abonnés branchés par _setup_events()
+        self.events = EventBus()
+        # Plus courts chemins entre salles (navigation.py), construits au premier "goto"
+        self.navigation = None
+        # Salle de chaque personnage et objet au sol (locations.py), construit au premier "where"/"find"
+        self.locations = None
+        # Réveil des PNJ mobiles tour par tour (scheduler.py), créé au premier tour
+        self.scheduler = None
+        # Temps du monde et minuteurs (world_clock.py) ; monstres vaincus à faire revenir (respawn.py)
+        self.clock = WorldClock()
+        self.respawner = None
+
 
     # Setup the game
     def setup(self, player_name=None):
@@ -55,7 +109,7 @@ class Game:
 
     def _setup_commands(self):
         self.commands["help"] = Command("help", " : afficher cette aide", Actions.help, 0)
-        self.commands["quit"] = Command("quit", " : quitter le jeu", Actions.quit, 0)
+        self.commands["quit"] = Command("quit", " : quitter le jeu", Actions.quit, 0, allow_prefix=False)
         self.commands["go"] = Command(
             "go",
             " <direction> : se déplacer (N, S, E, O, haut, bas)",
@@ -67,11 +121,15 @@ class Game:
         self.commands["look"] = Command("look", " : observer la pièce", Actions.look, 0)
         self.commands["take"] = Command("take", " <objet> : prendre un objet", Actions.take, 1)
         self.commands["drop"] = Command("drop", " <objet> : déposer un objet", Actions.drop, 1)
-        self.commands["check"] = Command("check", " : afficher l'inventaire", Actions.check, 0)
+        self.commands["check"] = Command("check", " : afficher l'inventaire", Actions.check, 0, aliases=("inventaire",))
         self.commands["talk"] = Command("talk", " <personnage> : parler à un personnage", Actions.talk, 1)
         self.commands["quests"] = Command("quests", " : afficher la liste des quêtes", Actions.quests, 0)
-        self.commands["quest"] = Command("quest", " <titre> : afficher les détails d'une quête", Actions.quest, 1)
-        self.commands["activate"] = Command("activate", " <titre> : activer une quête", Actions.activate, 1)
+        self.commands["quest"] = Command(
+            "quest", " <titre> : afficher les détails d'une quête", Actions.quest, 1, Command.MANY
+        )
+        self.commands["activate"] = Command(
+            "activate", " <titre> : activer une quête", Actions.activate, 1, Command.MANY
+        )
         self.commands["rewards"] = Command("rewards", " : afficher vos récompenses", Actions.rewards, 0)
         self.commands["fight"] = Command(
             "fight",
@@ -81,11 +139,24 @@ class Game:
         )
         self.commands["teleport"] = Command(
             "teleport",
-            " <nom_salle> : téléporte le joueur vers une salle spécifiée",
+            " [entité] <nom_salle> : téléporte le joueur (ou un PNJ présent) vers une salle spécifiée",
             Actions.teleport,
             1,
+            2,
         )
         self.commands["activateall"] = Command("activateall", " : activer toutes les quêtes", Actions.activateall, 0)
+        self.commands["goto"] = Command(
+            "goto", " <salle> : aller jusqu'à une salle par le plus court chemin", Actions.goto, 1
+        )
+        self.commands["where"] = Command("where", " <entité> : salle où se trouve un PNJ ou un monstre", Actions.where, 1)
+        # pas de préfixe : "f" / "fi" restent à fight
+        self.commands["find"] = Command(
+            "find", " <objet> : salles où un objet est posé", Actions.find, 1, allow_prefix=False
+        )
+
+        # Raccourcis de déplacement : "n", "nord", "haut"... -> "go <direction>"
+        for word in self.directions.aliases:
+            self.commands.add_shortcut(word, "go", word)
 
 
     def _setup_rooms(self):
@@ -1679,8 +1750,11 @@ class Game:
 
     def _register_directions(self):
         for room in self.rooms:
-            for direction in room.exits.keys():
-                Room.register_direction(direction)
+            self.register_directions(room.exits)
+
+    def register_directions(self, names):
+        """Ajoute des noms de sortie au jeu de directions de ce monde (copie à l'écriture)."""
+        self.directions = self.directions.including(names)
 
     def _setup_player(self, player_name=None):
         if not player_name:
@@ -1693,13 +1767,68 @@ class Game:
         self.player.current_room = self.maison_haut
         self.player.max_weight = 16
         self.player.game = self
+        self._setup_events()
+
+    def _setup_events(self):
+        """Nouveau bus d'événements : quêtes du joueur, puis scénario (story.py)."""
+        self.events = EventBus()
+        self.player.quest_manager.subscribe(self.events)
+        story.subscribe(self.events)
+
+    # game.rooms est une RoomRegistry : toute liste affectée est indexée par nom
+    @property
+    def rooms(self):
+        return self.__dict__["rooms"]
+
+    @rooms.setter
+    def rooms(self, rooms):
+        self.__dict__["rooms"] = RoomRegistry(rooms)
+
+    def get_navigation(self):
+        """Graphe de navigation : sorties du content pack si les régions sont paresseuses."""
+        if self.navigation is None:
+            if self.regions is not None:
+                self.navigation = Navigation.from_pack(self.regions.data)
+            else:
+                self.navigation = Navigation.from_rooms(self.rooms)
+        return self.navigation
+
+    def get_catalog(self):
+        if self.catalog is None:
+            self.catalog = Catalog.from_game(self)
+        return self.catalog
+
+    def get_respawner(self):
+        if self.respawner is None:
+            self.respawner = RespawnPool(self)
+        return self.respawner
+
+    def get_scheduler(self):
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
+        return self.scheduler
+
+    def get_locations(self):
+        """
+        Index des positions (personnages, monstres, objets au sol) des salles
+        construites ; les étages non chargés passent par regions.locate().
+        """
+        if self.locations is None:
+            self.locations = LocationIndex.from_rooms(self.rooms)
+        return self.locations
 
     def get_room_by_name(self, room_name):
-        room_name = room_name.lower().replace("-", "_")
-        for room in self.rooms:
-            if room.name.lower().replace("-", "_") == room_name:
-                return room
-        return None
+        room = self.rooms.get(room_name)
+        if room is None and self.regions is not None:
+            return self.regions.find_room(room_name)
+        return room
+
+    def resolve_room(self, room_name):
+        """Comme get_room_by_name, mais tolère les fautes de frappe (salle_donjon1, chateu...)."""
+        if self.regions is not None:
+            # toutes les salles du pack, chargées ou non
+            return self.regions.resolve_room(room_name)
+        return self.rooms.resolve(room_name)
 
     def _setup_quests(self):
         quete_ancien = Quest(
@@ -1725,6 +1854,7 @@ class Game:
                 damage=14,
             ),
             xp_reward=20,
+            category="secondaire",
         )
         self.player.quest_manager.add_quest(quete_foret)
 
@@ -1744,6 +1874,7 @@ class Game:
                 bonus={"gold": 300},
             ),
             xp_reward=20,
+            category="secondaire",
         )
 
         self.player.quest_manager.add_quest(quete_escorte_marchand)
@@ -1764,6 +1895,7 @@ class Game:
                 armor=2,
             ),
             xp_reward=20,
+            category="secondaire",
         )
         self.player.quest_manager.add_quest(quete_marchand)
 
@@ -1801,10 +1933,14 @@ class Game:
         self.player.quest_manager.add_quest(quete_boss)
 
     def update_characters(self):
-        for c in self.characters:
-            moved = c.move()
-            if DEBUG and moved:
-                print(f"DEBUG: {c.name} s'est déplacé dans {c.current_room.name}")
+        if self.regions is not None:
+            self.regions.tick(self.player.current_room)
+        # un tour de plus : minuteurs échus (réapparitions...), puis les PNJ
+        # dont le tour est venu
+        self.clock.advance()
+        for c in self.get_scheduler().tick(self.characters, self.locations):
+            if DEBUG:
+                emit(f"DEBUG: {c.name} s'est déplacé dans {c.current_room.name}")
 
     def play(self):
         self.setup()
@@ -1819,38 +1955,75 @@ class Game:
             self.game_over()
 
     def game_over(self):
-        print("\nGAME OVER")
-        print("Votre aventure s'arrête ici.\n")
+        output.event(output.GAME_OVER, player=self.player.name)
+        emit("\nGAME OVER")
+        emit("Votre aventure s'arrête ici.\n")
         self.finished = True
 
     def process_command(self, command_string):
-        if not command_string:
-            print()
-            return
+        """
+        Exécute une commande et retourne un CommandResult (texte + événements).
+
+        Sans self.output, le texte est aussi écrit sur sys.stdout au fil de
+        l'eau (comportement terminal). Avec un OutputSink, rien ne passe par
+        sys.stdout : le texte est recopié dans output.stream s'il existe.
+        """
+        echo = sys.stdout if self.output is None else self.output.stream
+        result = CommandResult(command_string, echo)
+        if self.command_log is not None:
+            self.command_log.append(command_string)
+        with use_sink(result), use_rng(self.rng):
+            # Un seul passage : découpage, recherche (alias, raccourcis, préfixes) et arité
+            command, list_of_words, error = self.commands.parse(command_string)
+            if command is not None:
+                result.command = command.command_word
+                if error is None:
+                    self.command_hits[command.command_word] += 1
+            elif error is not None:
+                self.command_misses += 1
+            if error is not None:
+                output.event(output.ERROR, message=error.strip())
+                emit(error)
+                result.ok = False
+            elif command is None:
+                emit()
+            else:
+                result.ok = command.action(self, list_of_words, command.number_of_parameters)
+        return result
+
+    def start_recording(self):
+        """
+        Garde les commandes jouées dans self.command_log (pour rng.replay) ;
+        à appeler avant la première commande. Retourne le journal.
+        """
+        if self.command_log is None:
+            self.command_log = []
+        return self.command_log
 
-        list_of_words = command_string.split(" ")
-        command_word = list_of_words[0]
+    def command_stats(self):
+        """Commandes jouées dans cette session (les plus utilisées d'abord) et saisies non reconnues."""
+        return self.commands.stats(self.command_hits, self.command_misses)
 
-        if command_word not in self.commands:
-            print(
-                f"\nCommande '{command_word}' non reconnue. Entrez 'help' pour voir la liste des commandes disponibles.\n"
-            )
-            return
+    def session_output(self):
+        """Contexte où emit() écrit dans la sortie de cette session (hors commande)."""
+        return use_sink(self.output)
 
-        command = self.commands[command_word]
-        command.action(self, list_of_words, command.number_of_parameters)
+    def session_rng(self):
+        """Contexte où les tirages (combat, PNJ) utilisent self.rng (hors commande)."""
+        return use_rng(self.rng)
 
     def print_welcome(self):
-        print(f"\nBienvenue {self.player.name} dans ce jeu d'aventure !")
-        print("Entrez 'help' si vous avez besoin d'aide.")
-        print(self.player.current_room.get_long_description())
+        emit(f"\nBienvenue {self.player.name} dans ce jeu d'aventure !")
+        emit("Entrez 'help' si vous avez besoin d'aide.")
+        emit(self.player.current_room.get_long_description())
 
     def check_end_game(self):
         qm = getattr(self.player, "quest_manager", None)
         if qm is None:
             return
         # gagné seulement si toutes les quêtes de la liste sont terminées
-        if all(q.is_completed for q in qm.quests) and qm.quests:
-            print("\nFélicitations ! Tu as terminé toutes les quêtes !")
-            print("Tu as gagné le jeu !\n")
+        if qm.all_quests_completed():
+            output.event(output.GAME_WON, player=self.player.name)
+            emit("\nFélicitations ! Tu as terminé toutes les quêtes !")
+            emit("Tu as gagné le jeu !\n")
             self.finished = True
\ No newline at end of file
@@ -0,0 +1,151 @@
+# inventory.py
+# Description: inventaire du joueur avec totaux tenus à jour.
+#
+# Inventory est un dict {nom: Item} (comme avant) qui garde à chaque
+# écriture le poids total (poids unitaire x quantité de chaque pile) et le
+# nombre d'objets (somme des quantités) ; len() donne le nombre
+# d'emplacements. Les contrôles de capacité (take, add_item, achat en
+# boutique) ne reparcourent plus l'inventaire.
+#
+# Les quantités changent par add() / remove() ; après avoir modifié
+# item.quantity à la main, appeler refresh(nom).
+#
+# Exemple :
+#   inv = Inventory()
+#   inv.add(Item("potion_soin", "", 0.5, quantity=3))
+#   inv.weight, inv.count, len(inv)    # 1.5, 3, 1
+#   inv.remove("potion_soin", 2)
+
+
+def _quantity(item):
+    return int(getattr(item, "quantity", 1) or 1)
+
+
+def stack_weight(item):
+    """Poids d'une pile : poids unitaire x quantité."""
+    return getattr(item, "weight", 0) * _quantity(item)
+
+
+class Inventory(dict):
+    """dict {nom: Item} avec poids total (weight) et nombre d'objets (count)."""
+
+    __slots__ = ("_weight", "count", "_parts")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._weight = 0
+        self.count = 0
+        # nom -> (poids, quantité) comptés dans les totaux
+        self._parts = {}
+        for name, item in self.items():
+            self._track(name, item)
+
+    def __reduce__(self):
+        return Inventory, (dict(self),)
+
+    @property
+    def weight(self):
+        # arrondi : les ajouts / retraits successifs de flottants dérivent
+        return round(self._weight, 9)
+
+    # ------------------------------------------------------------------
+    # Totaux
+    # ------------------------------------------------------------------
+
+    def _track(self, name, item):
+        w, q = stack_weight(item), _quantity(item)
+        self._parts[name] = (w, q)
+        self._weight += w
+        self.count += q
+
+    def _untrack(self, name):
+        part = self._parts.pop(name, None)
+        if part is not None:
+            self._weight -= part[0]
+            self.count -= part[1]
+            if not self._parts:
+                self._weight = 0
+                self.count = 0
+
+    def refresh(self, name):
+        """Recompte la pile name (quantité modifiée hors de l'inventaire)."""
+        self._untrack(name)
+        if name in self:
+            self._track(name, self[name])
+
+    def fits(self, item, max_weight):
+        """La pile item tient-elle sous max_weight ?"""
+        return self._weight + stack_weight(item) <= max_weight
+
+    # ------------------------------------------------------------------
+    # Piles
+    # ------------------------------------------------------------------
+
+    def add(self, item):
+        """Ajoute item, empilé sur la pile du même nom ; retourne la quantité ajoutée."""
+        q_add = _quantity(item)
+        existing = self.get(item.name)
+        if existing is not None:
+            existing.quantity = _quantity(existing) + q_add
+            self.refresh(item.name)
+        else:
+            item.quantity = q_add
+            self[item.name] = item
+        return q_add
+
+    def remove(self, name, qty=1):
+        """
+        Retire qty objets de la pile name ; retourne la pile (None si
+        absente), retirée de l'inventaire si elle est vide.
+        """
+        item = self.get(name)
+        if item is None:
+            return None
+        qty = int(qty or 1)
+        current_q = _quantity(item)
+        if current_q > qty:
+            item.quantity = current_q - qty
+            self.refresh(name)
+            return item
+        return self.pop(name, None)
+
+    # ------------------------------------------------------------------
+    # Écritures du dict
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, key, value):
+        self._untrack(key)
+        super().__setitem__(key, value)
+        self._track(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._untrack(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        self._untrack(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._untrack(key)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._parts.clear()
+        self._weight = 0
+        self.count = 0
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
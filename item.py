@@ -1,8 +1,106 @@
 # item.py
+#
+# Un objet est une pile (Item, __slots__ : définition, quantité, durabilité)
+# qui pointe vers une ItemDefinition partagée et immuable : nom, poids,
+# stats normalisées et attributs dérivés (dégâts, armure, soin...). Les
+# définitions sont internées : Item("noyau", ...) répété pour chaque monstre
+# ne normalise les stats qu'une fois et partage la même définition.
+
+from types import MappingProxyType
+
+class ItemDefinition:
+    """
+    Définition partagée d'un objet (voir l'en-tête du module) : stats
+    normalisées (MappingProxy en lecture seule) et attributs dérivés.
+    Construite par ItemDefinition.get(), jamais modifiée ensuite.
+    """
+
+    __slots__ = (
+        "name", "display_name", "description", "weight", "item_type", "quantity", "stats",
+        "damage", "durability", "crit_chance", "armor_phys", "armor_mag", "bonus",
+        "heal", "mana", "attack", "armor", "magic", "hp", "_args",
+    )
+
+    # clé des paramètres de création -> définition (partagée par tous les mondes)
+    _interned = {}
+
+    def __init__(self, name, description, weight, display_name, item_type, quantity, stats):
+        set_ = object.__setattr__
+        set_(self, "name", name)
+        set_(self, "display_name", display_name or name)
+        set_(self, "stats", MappingProxyType(stats))
+
+        # Attributs dérivés de stats (anciennement Item._apply_stats)
+        set_(self, "description", stats.get("description", description))
+        set_(self, "item_type", stats.get("type", item_type))
+        set_(self, "quantity", stats.get("quantity", quantity))
+
+        # Règle demandée : tous les équipements = 1 kg
+        if self.item_type in Item._EQUIPMENT_TYPES:
+            set_(self, "weight", 1)
+        else:
+            set_(self, "weight", stats.get("weight", weight))
+
+        set_(self, "damage", int(stats.get("damage", 0) or 0))
+        set_(self, "durability", int(stats.get("durability", 0) or 0))
+        set_(self, "crit_chance", float(stats.get("crit_chance", 0) or 0))
+
+        set_(self, "armor_phys", int(stats.get("armor_phys", 0) or 0))
+        set_(self, "armor_mag", int(stats.get("armor_mag", 0) or 0))
+
+        bonus = stats.get("bonus", {})
+        set_(self, "bonus", {} if bonus is None else bonus)
+
+        set_(self, "heal", int(stats.get("heal", 0) or 0))
+        set_(self, "mana", int(stats.get("mana", 0) or 0))
+
+        # attack / armor : valeur explicite, sinon dégâts / armure physique
+        set_(self, "attack", int(stats.get("attack", 0) or 0) or self.damage)
+        set_(self, "armor", int(stats.get("armor", 0) or 0) or self.armor_phys)
+        set_(self, "magic", int(stats.get("magic", 0) or 0))
+        set_(self, "hp", int(stats.get("hp", 0) or 0))
+        # paramètres de création, pour ré-interner après pickle
+        set_(self, "_args", (name, description, weight, display_name, item_type, quantity))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"ItemDefinition est immuable ({attr})")
+
+    def __reduce__(self):
+        # ré-internée à la lecture (pickle, sharding)
+        return ItemDefinition.get, self._args + (dict(self.stats),)
+
+    def __repr__(self):
+        return f"<ItemDefinition {self.name}>"
+
+    @classmethod
+    def get(cls, name, description, weight=0.0, display_name=None, item_type=None, quantity=1, stats=None):
+        """Définition partagée pour ces paramètres (stats déjà normalisées)."""
+        stats = dict(stats) if stats else {}
+        key = ("stats", name, description, _freeze(weight), display_name, item_type, _freeze(quantity), _freeze(stats))
+        definition = cls._interned.get(key)
+        if definition is None:
+            definition = cls._interned.setdefault(
+                key, cls(name, description, weight, display_name, item_type, quantity, stats)
+            )
+        return definition
+
+
+def _freeze(value):
+    """
+    Clé hashable d'une valeur de stats (dicts et listes compris) ; le type
+    en fait partie : 1, 1.0 et True ne s'affichent pas pareil.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value),) + tuple(_freeze(v) for v in value)
+    return (type(value), value)
+
 
 class Item:
     """
-    Représente un objet manipulable par le joueur.
+    Représente un objet manipulable par le joueur (une pile : définition
+    partagée + quantité et durabilité propres).
 
     Attributs :
         name : str
@@ -39,8 +137,12 @@ class Item:
           armure_phys/armor_phys, armure_mag/armor_mag, quantité/quantity, type/item_type, etc.
         - Des propriétés attack/armor/magic/hp sont exposées pour compatibilité future
           avec l'interface graphique, sans casser ton modèle actuel.
+        - Seules quantity et durability s'écrivent ; les autres attributs (et
+          stats, en lecture seule) viennent de item.definition.
     """
 
+    __slots__ = ("definition", "quantity", "durability")
+
     ARMES = {}
     UTILISABLES = {}
     EQUIPEMENT = {}
@@ -99,77 +201,72 @@ class Item:
     }
 
     def __init__(self, name, description, weight=0.0, display_name=None, item_type=None, quantity=1, **kwargs):
-        self.name = name 
-        self.stats = {}   
-                      
-        self.display_name = display_name or name  # nom affiché
-        self.description = description
-        self.weight = weight
-    
+        # Paramètres déjà vus : définition internée, sans refaire la fusion
+        # des registres ni la normalisation des kwargs
+        key = (name, description, _freeze(weight), display_name, item_type, _freeze(quantity), _freeze(kwargs))
+        definition = ItemDefinition._interned.get(key)
+        if definition is None:
+            stats = {}
+            for cat in [Item.ARMES, Item.UTILISABLES, Item.EQUIPEMENT, Item.ARTEFACTS, Item.MONSTER_ITEMS]:
+                if name in cat:
+                    stats.update(cat[name])
+
+            for k, v in kwargs.items():
+                stats[Item._KEY_MAP.get(k, k)] = v
+
+            definition = ItemDefinition.get(name, description, weight, display_name, item_type, quantity, stats)
+            ItemDefinition._interned[key] = definition
+
+        self.definition = definition
+        self.quantity = definition.quantity
+        self.durability = definition.durability
+
+    @classmethod
+    def from_stats(cls, name, description, weight=0.0, display_name=None, item_type=None, quantity=1, stats=None):
+        """
+        Construit un objet à partir de stats DÉJÀ normalisées (clés de _KEY_MAP,
+        registres déjà fusionnés), par exemple depuis un content pack.
+        Évite la fusion des registres et la normalisation des kwargs.
+        """
+        return cls.of(ItemDefinition.get(name, description, weight, display_name, item_type, quantity, stats))
+
+    @classmethod
+    def of(cls, definition, quantity=None):
+        """Nouvelle pile d'une définition existante."""
+        item = cls.__new__(cls)
+        item.definition = definition
+        item.quantity = definition.quantity if quantity is None else quantity
+        item.durability = definition.durability
+        return item
+
+    def copy(self):
+        """Pile indépendante, même définition, même quantité et durabilité."""
+        item = Item.of(self.definition, self.quantity)
+        item.durability = self.durability
+        return item
+
+    def __getstate__(self):
+        return {"definition": self.definition, "quantity": self.quantity, "durability": self.durability}
+
+    def __setstate__(self, state):
+        self.definition = state["definition"]
+        self.quantity = state["quantity"]
+        self.durability = state["durability"]
 
-        for cat in [Item.ARMES, Item.UTILISABLES, Item.EQUIPEMENT, Item.ARTEFACTS, Item.MONSTER_ITEMS]:
-            if name in cat:
-                self.stats.update(cat[name])
-
-        normalized_kwargs = {}
-        for k, v in kwargs.items():
-            key = Item._KEY_MAP.get(k, k)
-            normalized_kwargs[key] = v
+    def __str__(self):
+        qte_str = f" x{self.quantity}" if self.item_type in ["potion", "munition"] and self.quantity > 1 else ""
+        return f"{self.display_name}{qte_str} : {self.description} ({self.weight} kg)"
 
-        self.stats.update(normalized_kwargs)
 
-        self.description = self.stats.get("description", description)
-        self.item_type = self.stats.get("type", item_type)
-        self.quantity = self.stats.get("quantity", quantity)
+def _delegate(attr):
+    return property(lambda item: getattr(item.definition, attr), doc=f"definition.{attr}")
 
-        # Règle demandée : tous les équipements = 1 kg
-        if self.item_type in Item._EQUIPMENT_TYPES:
-            self.weight = 1
-        else:
-            if "weight" in self.stats:
-                self.weight = self.stats["weight"]
-            else:
-                self.weight = weight
-
-        self.damage = int(self.stats.get("damage", 0) or 0)
-        self.durability = int(self.stats.get("durability", 0) or 0)
-        self.crit_chance = float(self.stats.get("crit_chance", 0) or 0)
-
-        self.armor_phys = int(self.stats.get("armor_phys", 0) or 0)
-        self.armor_mag = int(self.stats.get("armor_mag", 0) or 0)
-
-        self.bonus = self.stats.get("bonus", {})
-        if self.bonus is None:
-            self.bonus = {}
-
-        self.heal = int(self.stats.get("heal", 0) or 0)
-        self.mana = int(self.stats.get("mana", 0) or 0)
-
-        self._attack = int(self.stats.get("attack", 0) or 0)
-        self._armor = int(self.stats.get("armor", 0) or 0)
-        self._magic = int(self.stats.get("magic", 0) or 0)
-        self._hp = int(self.stats.get("hp", 0) or 0)
-
-    @property
-    def attack(self):
-        if self._attack:
-            return self._attack
-        return self.damage
-
-    @property
-    def armor(self):
-        if self._armor:
-            return self._armor
-        return self.armor_phys
-
-    @property
-    def magic(self):
-        return self._magic
-
-    @property
-    def hp(self):
-        return self._hp
 
-    def __str__(self):
-        qte_str = f" x{self.quantity}" if self.item_type in ["potion", "munition"] and self.quantity > 1 else ""
-        return f"{self.display_name}{qte_str} : {self.description} ({self.weight} kg)"
\ No newline at end of file
+# Attributs lus dans la définition partagée
+for _attr in (
+    "name", "display_name", "description", "weight", "item_type", "stats",
+    "damage", "crit_chance", "armor_phys", "armor_mag", "bonus", "heal", "mana",
+    "attack", "armor", "magic", "hp",
+):
+    setattr(Item, _attr, _delegate(_attr))
+del _attr
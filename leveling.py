@@ -0,0 +1,55 @@
+# leveling.py
+# Description: table d'XP par niveau et montée de plusieurs niveaux d'un coup.
+#
+# XP_TABLE[niveau] : XP pour passer au niveau suivant (50 x 1.4^(niveau-1),
+# arrondi), calculée une fois jusqu'à LEVEL_CAP. XP_TOTAL[niveau] : XP
+# cumulée pour atteindre ce niveau depuis le niveau 1. Un gros gain d'XP
+# (simulations, commandes d'admin) se résout par une recherche dichotomique
+# dans XP_TOTAL au lieu d'une boucle niveau par niveau.
+#
+# Exemple :
+#   level, xp = levels_after(1, 10_000)       # niveau atteint, XP restante
+#   Player.gain_xp(10_000)                    # un seul level up groupé
+
+import bisect
+
+XP_BASE = 50
+XP_GROWTH = 1.4
+LEVEL_CAP = 100
+
+# Gains de stats de base par niveau (attribut du Player -> gain)
+LEVEL_GAINS = {"base_attack": 5, "base_magic": 2, "base_armor": 1, "base_hp": 20}
+
+
+def xp_formula(level):
+    return int(round(XP_BASE * (XP_GROWTH ** (level - 1))))
+
+
+# indice 0 inutilisé : XP_TABLE[niveau]
+XP_TABLE = [0] + [xp_formula(level) for level in range(1, LEVEL_CAP + 1)]
+
+# XP_TOTAL[niveau] = somme de XP_TABLE[1:niveau]
+XP_TOTAL = [0, 0]
+for _level in range(1, LEVEL_CAP):
+    XP_TOTAL.append(XP_TOTAL[-1] + XP_TABLE[_level])
+del _level
+
+
+def xp_required(level):
+    """XP pour passer de level à level + 1."""
+    if 1 <= level <= LEVEL_CAP:
+        return XP_TABLE[level]
+    return xp_formula(level)
+
+
+def levels_after(level, xp):
+    """
+    (niveau atteint, XP restante) pour un joueur de niveau level qui a xp
+    points d'XP en cours : même résultat que de retirer xp_required() tant
+    que possible, sans dépasser LEVEL_CAP.
+    """
+    if level >= LEVEL_CAP or xp < xp_required(level):
+        return level, xp
+    total = XP_TOTAL[level] + xp
+    final = min(bisect.bisect_right(XP_TOTAL, total) - 1, LEVEL_CAP)
+    return final, total - XP_TOTAL[final]
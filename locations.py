@@ -0,0 +1,120 @@
+# locations.py
+# Description: index des entités du monde -> salle (commandes "where" et "find").
+#
+# Deux tables, tenues à jour à chaque déplacement connu (Character.move,
+# escorte du marchand, teleport, take/drop, butin des monstres, régions
+# chargées ou déchargées) :
+#   characters : mot -> {salle: clé dans room.characters}  (PNJ et monstres)
+#   items      : mot -> {salle: clé dans room.inventory}   (objets au sol)
+# Le mot est la clé du dict de la salle et le nom de l'entité en minuscules.
+# Une entrée est vérifiée à la lecture (une recherche dans la salle) : ce
+# qui a quitté une salle sans passer par l'index (monstre vaincu dans
+# l'interface...) est retiré au passage.
+#
+# Exemple :
+#   locations = game.get_locations()
+#   locations.where("ancien")    # [(maison_ancien, <Character ancien>)]
+#   locations.find("pomme")      # [(maison_bas, <Item pomme>)]
+
+CHARACTERS = "characters"
+ITEMS = "inventory"
+
+
+def _words(key, entity):
+    """Mots sous lesquels l'entité est indexée : clé et nom, en minuscules."""
+    words = [key.lower()]
+    name = getattr(entity, "name", None)
+    if isinstance(name, str) and name.lower() != words[0]:
+        words.append(name.lower())
+    return words
+
+
+class LocationIndex:
+    """Salle(s) de chaque personnage, monstre et objet posé au sol."""
+
+    def __init__(self):
+        self.characters = {}
+        self.items = {}
+
+    @classmethod
+    def from_rooms(cls, rooms):
+        index = cls()
+        for room in rooms:
+            index.add_room(room)
+        return index
+
+    def _table(self, kind):
+        return self.characters if kind == CHARACTERS else self.items
+
+    # ------------------------------------------------------------------
+    # Mise à jour
+    # ------------------------------------------------------------------
+
+    def add(self, kind, room, key, entity):
+        """entity est entrée dans getattr(room, kind) sous la clé key."""
+        table = self._table(kind)
+        for word in _words(key, entity):
+            places = table.get(word)
+            if places is None:
+                table[word] = {room: key}
+            else:
+                places[room] = key
+
+    def discard(self, kind, room, key, entity):
+        """entity a quitté room (sans effet si elle n'y était pas indexée)."""
+        table = self._table(kind)
+        for word in _words(key, entity):
+            places = table.get(word)
+            if places is not None and places.get(room) == key:
+                del places[room]
+                if not places:
+                    del table[word]
+
+    def move(self, kind, key, entity, old_room, new_room):
+        if old_room is not None:
+            self.discard(kind, old_room, key, entity)
+        if new_room is not None:
+            self.add(kind, new_room, key, entity)
+
+    def add_room(self, room):
+        for key, char in room.characters.items():
+            self.add(CHARACTERS, room, key, char)
+        for key, item in room.inventory.items():
+            self.add(ITEMS, room, key, item)
+
+    def remove_room(self, room):
+        for key, char in room.characters.items():
+            self.discard(CHARACTERS, room, key, char)
+        for key, item in room.inventory.items():
+            self.discard(ITEMS, room, key, item)
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def lookup(self, kind, name):
+        """[(salle, entité)] pour ce nom (clé ou nom de l'entité, casse ignorée)."""
+        table = self._table(kind)
+        word = name.strip().lower()
+        places = table.get(word)
+        if not places:
+            return []
+        found = []
+        stale = []
+        for room, key in places.items():
+            entity = getattr(room, kind).get(key)
+            if entity is not None and word in _words(key, entity):
+                found.append((room, entity))
+            else:
+                stale.append(room)
+        for room in stale:
+            del places[room]
+        if not places:
+            del table[word]
+        return found
+
+    def where(self, name):
+        return self.lookup(CHARACTERS, name)
+
+    def find(self, name):
+        return self.lookup(ITEMS, name)
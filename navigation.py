@@ -0,0 +1,161 @@
+# navigation.py
+# Description: plus courts chemins entre salles (commande "goto").
+#
+# Le graphe est tenu par noms de salles : sorties des salles construites
+# (Game.rooms) ou, pour un monde à régions paresseuses, sorties du content
+# pack (les étages non chargés restent atteignables).
+#
+# Pour chaque destination demandée, un parcours en largeur sur le graphe
+# inversé calcule une table {salle: (distance, direction, salle suivante)} ;
+# elle est gardée en cache et sert ensuite à tous les trajets vers cette
+# destination. update_room() applique un changement de sorties aux tables
+# en cache : un raccourci est propagé sur place, une sortie supprimée
+# n'invalide que les tables qui l'empruntaient.
+#
+# Exemple :
+#   nav = Navigation.from_rooms(game.rooms)
+#   nav.route("village", "rue_capitale")   # [("S", "foret"), ("E", "foret_sombre"), ...]
+
+from collections import deque
+
+from room_index import NameIndex
+
+
+class Navigation:
+    """Graphe des sorties par noms de salles, tables de prochain pas par destination."""
+
+    def __init__(self, exits=None):
+        # nom -> [(direction, nom cible)] ; entrées : nom -> [(nom source, direction)]
+        self.exits = {}
+        self.entries = {}
+        # destination -> {nom: (distance, direction, nom suivant)}
+        self.tables = {}
+        self._names = None
+        for name, pairs in (exits or {}).items():
+            self.update_room(name, pairs)
+
+    @classmethod
+    def from_rooms(cls, rooms):
+        nav = cls()
+        for room in rooms:
+            nav.update_room(room)
+        return nav
+
+    @classmethod
+    def from_pack(cls, data):
+        """Graphe complet d'un content pack (salles chargées ou non)."""
+        names = [name for name, _ in data["rooms"]]
+        return cls({
+            names[i]: [(d, names[j] if j is not None else None) for d, j in exits]
+            for i, exits in enumerate(data["exits"])
+        })
+
+    # ------------------------------------------------------------------
+    # Mise à jour
+    # ------------------------------------------------------------------
+
+    def update_room(self, room, pairs=None):
+        """
+        (Ré)enregistre les sorties d'une salle : room est une Room (sorties
+        lues dans room.exits) ou un nom accompagné de pairs [(direction, nom)].
+        """
+        if pairs is None:
+            name = room.name
+            pairs = [(d, t.name) for d, t in room.exits.items() if t is not None]
+        else:
+            name = room
+            pairs = [(d, t) for d, t in pairs if t is not None]
+        old = self.exits.get(name, [])
+        if old == pairs:
+            return
+        if name not in self.exits:
+            self._names = None
+        self.exits[name] = pairs
+        self.entries.setdefault(name, [])
+
+        removed = [edge for edge in old if edge not in pairs]
+        added = [edge for edge in pairs if edge not in old]
+        for d, target in removed:
+            self.entries[target].remove((name, d))
+        for d, target in added:
+            if target not in self.entries:
+                self.entries[target] = []
+                self.exits.setdefault(target, [])
+                self._names = None
+            self.entries[target].append((name, d))
+
+        for destination, table in list(self.tables.items()):
+            step = table.get(name)
+            if step is not None and (step[1], step[2]) in removed:
+                # la table passait par la sortie supprimée : recalcul à la demande
+                del self.tables[destination]
+                continue
+            for d, target in added:
+                self._shortcut(table, name, d, target)
+
+    def _shortcut(self, table, name, direction, target):
+        """Nouvelle sortie name -> target : propage les distances raccourcies."""
+        reached = table.get(target)
+        if reached is None:
+            return
+        distance = reached[0] + 1
+        step = table.get(name)
+        if step is not None and step[0] <= distance:
+            return
+        table[name] = (distance, direction, target)
+        queue = deque([name])
+        while queue:
+            node = queue.popleft()
+            distance = table[node][0] + 1
+            for source, d in self.entries[node]:
+                step = table.get(source)
+                if step is None or distance < step[0]:
+                    table[source] = (distance, d, node)
+                    queue.append(source)
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def table(self, destination):
+        """Table de prochain pas vers destination (parcours en largeur inversé, en cache)."""
+        table = self.tables.get(destination)
+        if table is None:
+            table = {destination: (0, None, None)}
+            queue = deque([destination])
+            entries = self.entries
+            while queue:
+                node = queue.popleft()
+                distance = table[node][0] + 1
+                for source, d in entries.get(node, ()):
+                    if source not in table:
+                        table[source] = (distance, d, node)
+                        queue.append(source)
+            self.tables[destination] = table
+        return table
+
+    def route(self, origin, destination):
+        """[(direction, salle atteinte), ...] de origin à destination ; None si inaccessible."""
+        table = self.table(destination)
+        if origin not in table:
+            return None
+        path = []
+        node = origin
+        while node != destination:
+            _, direction, node = table[node]
+            path.append((direction, node))
+        return path
+
+    def distance(self, origin, destination):
+        step = self.table(destination).get(origin)
+        return None if step is None else step[0]
+
+    def find(self, name):
+        """Nom de salle connu le plus proche de name (exact, puis tolérant aux fautes)."""
+        if name in self.exits:
+            return name
+        if self._names is None:
+            self._names = NameIndex()
+            for node in self.exits:
+                self._names.add(node, node)
+        return self._names.get(name) or self._names.resolve(name)
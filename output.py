@@ -0,0 +1,155 @@
+# output.py
+# Description: sortie du moteur par session (texte + événements typés).
+#
+# Le moteur écrit avec emit() au lieu de print(). Sans sink actif, emit()
+# se comporte exactement comme print() (terminal, doctests, redirect_stdout).
+# Avec un sink actif (contextvar, donc propre à chaque thread / tâche asyncio),
+# le texte et les événements vont dans le buffer de la session, sans
+# toucher à sys.stdout.
+#
+# Exemple :
+#   game.output = OutputSink()           # mode bufferisé
+#   result = game.process_command("go S")
+#   result.text, result.events
+
+import contextvars
+import sys
+from contextlib import contextmanager
+
+# --- Types d'événements ------------------------------------------------
+MOVED = "moved"
+ITEM_OBTAINED = "item_obtained"
+ITEM_DROPPED = "item_dropped"
+OBJECTIVE_COMPLETED = "objective_completed"
+QUEST_ACTIVATED = "quest_activated"
+QUEST_COMPLETED = "quest_completed"
+DAMAGE = "damage"
+LOOT = "loot"
+XP_GAINED = "xp_gained"
+LEVEL_UP = "level_up"
+TELEPORTED = "teleported"
+TALKED = "talked"
+GAME_OVER = "game_over"
+GAME_WON = "game_won"
+ERROR = "error"
+
+_current_sink = contextvars.ContextVar("tba_output_sink", default=None)
+
+
+class Event:
+    """Événement typé : kind (constante ci-dessus) + données simples (str, int...)."""
+
+    __slots__ = ("kind", "data")
+
+    def __init__(self, kind, data):
+        self.kind = kind
+        self.data = data
+
+    def to_dict(self):
+        return {"kind": self.kind, **self.data}
+
+    def __eq__(self, other):
+        return isinstance(other, Event) and (self.kind, self.data) == (other.kind, other.data)
+
+    def __repr__(self):
+        return f"Event({self.kind!r}, {self.data!r})"
+
+
+class OutputSink:
+    """
+    Sortie d'une session.
+
+    stream : objet avec write(str) qui reçoit le texte au fil de l'eau
+    (ex: widget Tkinter). Sans stream, le texte est gardé jusqu'à drain().
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.chunks = []
+        self.events = []
+
+    def write(self, text):
+        if self.stream is not None:
+            self.stream.write(text)
+        else:
+            self.chunks.append(text)
+
+    def record(self, event):
+        self.events.append(event)
+
+    def drain(self):
+        """Retourne (texte, événements) accumulés depuis le dernier drain()."""
+        text = "".join(self.chunks)
+        events = self.events
+        self.chunks = []
+        self.events = []
+        return text, events
+
+
+class CommandResult(OutputSink):
+    """
+    Résultat d'une commande (Game.process_command) : tout le texte produit
+    et les événements, dans l'ordre. echo reçoit aussi le texte au fil de
+    l'eau (sys.stdout en mode terminal, None en mode bufferisé).
+    """
+
+    def __init__(self, command_string, echo=None):
+        super().__init__(echo)
+        self.command_string = command_string
+        self.command = None
+        self.ok = None
+
+    def write(self, text):
+        self.chunks.append(text)
+        if self.stream is not None:
+            self.stream.write(text)
+
+    @property
+    def text(self):
+        return "".join(self.chunks)
+
+    def of_kind(self, kind):
+        return [e for e in self.events if e.kind == kind]
+
+    def to_dict(self):
+        return {
+            "command": self.command,
+            "ok": self.ok,
+            "text": self.text,
+            "events": [e.to_dict() for e in self.events],
+        }
+
+
+def emit(*values, sep=" ", end="\n"):
+    """print() vers le sink de la session courante (ou sys.stdout sans sink)."""
+    sink = _current_sink.get()
+    if sink is None:
+        sys.stdout.write(sep.join(map(str, values)) + end)
+    else:
+        sink.write(sep.join(map(str, values)) + end)
+
+
+def event(kind, **data):
+    """Enregistre un événement typé dans le sink courant (ignoré sans sink)."""
+    sink = _current_sink.get()
+    if sink is not None:
+        sink.record(Event(kind, data))
+
+
+def current_sink():
+    return _current_sink.get()
+
+
+@contextmanager
+def use_sink(sink):
+    """Active sink pour le bloc (None : retour à sys.stdout)."""
+    token = _current_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _current_sink.reset(token)
+
+
+def bind_sink(sink):
+    """Active sink pour le reste du contexte courant (ex: boucle Tkinter du thread principal)."""
+    _current_sink.set(sink)
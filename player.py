@@ -1,8 +1,15 @@
 # player.py
 
-from room import Room
+from directions import DEFAULT_DIRECTIONS
 from item import Item
+from inventory import Inventory
+from stats import StatEngine, item_vector, stat_vector
+from effects import StatusEffects
+from leveling import LEVEL_GAINS, levels_after, xp_required
 from quest import QuestManager
+import output
+from output import emit
+from events import PlayerMoved, ItemObtained
 
 
 class Player:
@@ -16,6 +23,16 @@ class Player:
     - XP / niveaux
     """
 
+    # type d'objet -> attribut de l'emplacement d'équipement
+    EQUIPMENT_SLOTS = {
+        "helmet": "equipped_helmet",
+        "armor": "equipped_armor",
+        "other": "equipped_other",
+        "shield": "equipped_shield",
+        "weapon": "equipped_weapon",
+        "magic": "equipped_magic",
+    }
+
     def __init__(self, name):
         self.name = name
         self.current_room = None
@@ -25,8 +42,9 @@ class Player:
         self.game = None
 
         # ===== INVENTAIRE =====
-        self.inventory = {}          # {nom_item: Item}
+        self.inventory = Inventory()  # {nom_item: Item}, poids et quantités totalisés
         self.max_weight = 16
+        self.max_slots = 25
 
         # ===== QUÊTES =====
         self.move_count = 0
@@ -48,11 +66,14 @@ class Player:
         self.xp_to_next = self.xp_required_for_level(self.level)
 
         # ===== STATS ACTUELLES =====
-        self.attack = self.base_attack
-        self.magic = self.base_magic
-        self.armor = self.base_armor
-        self.max_hp = self.base_hp
-        self.hp = self.max_hp
+        # Vecteurs de stats par source (stats.py) : base + emplacements d'une
+        # part, buffs temporaires de l'autre ; publiés en attributs par
+        # _apply_stats (attack, armor... et attack_value / armor_value, buffs compris)
+        self.gear_stats = StatEngine()
+        self.buff_stats = StatEngine()
+        self.gear_stats.set("base", self._base_vector())
+        self.hp = self.base_hp
+        self._apply_stats()
 
         # ===== ÉQUIPEMENT =====
         self.equipped_helmet = None
@@ -69,44 +90,57 @@ class Player:
         self.mana = self.max_mana
 
         # ===== BUFFS TEMPORAIRES (consommables) =====
-        # ex: potion_force => +atk pendant X tours
-        # structure : {"attack": {"amount": 5, "turns": 3}, ...}
-        self._temp_buffs = {}
+        # ex: potion_force => +atk pendant X tours ; effets nommés par stat
+        # ("attack", "armor"...) dans la roue de minuteurs (effects.py)
+        self.effects = StatusEffects()
+
 
+    def publish(self, event):
+        """Publie un événement sur le bus du Game ; sans Game, seules les quêtes du joueur le reçoivent."""
+        game = self.game
+        if game is not None:
+            game.events.publish(event)
+        elif self.quest_manager is not None:
+            self.quest_manager.on_event(event)
 
     # =========================================================
     # DÉPLACEMENTS
     # =========================================================
 
-    def move(self, direction):
-        normalized = Room.normalize_direction(direction)
+    def move(self, direction, describe=True):
+        directions = self.game.directions if self.game is not None else DEFAULT_DIRECTIONS
+        normalized = directions.normalize(direction)
         if normalized is None:
-            print("\nDirection non reconnue.\n")
+            emit("\nDirection non reconnue.\n")
             return False
 
-        next_room = self.current_room.get_exit(normalized)
+        next_room = self.current_room.get_exit(normalized, directions)
         if next_room is None:
-            print("\nAucune sortie dans cette direction.\n")
+            emit("\nAucune sortie dans cette direction.\n")
             return False
 
         self.history.append(self.current_room)
         self.current_room = next_room
         self.move_count += 1
 
-        print(self.current_room.get_long_description())
-
-        if self.quest_manager is not None:
-            self.quest_manager.check_action_objectives("aller", self.current_room.name)
+        output.event(output.MOVED, origin=self.history[-1].name, room=next_room.name, direction=normalized)
+        if describe:
+            emit(self.current_room.get_long_description())
 
+        self.publish(PlayerMoved(self, self.history[-1], next_room, normalized))
         return True
 
     def back(self):
         if not self.history:
-            print("\nImpossible de revenir en arrière.\n")
+            emit("\nImpossible de revenir en arrière.\n")
             return False
 
+        origin = self.current_room
         self.current_room = self.history.pop()
-        print(self.current_room.get_long_description())
+        if self.current_room.region is not None:
+            self.current_room.region.ensure_loaded()
+        output.event(output.MOVED, origin=origin.name, room=self.current_room.name, direction="back")
+        emit(self.current_room.get_long_description())
         return True
 
     def get_history(self):
@@ -123,7 +157,14 @@ class Player:
     # =========================================================
 
     def get_current_weight(self):
-        return sum(item.weight for item in self.inventory.values())
+        return self.inventory.weight
+
+    def can_carry(self, item):
+        """La pile item (poids x quantité) tient-elle sous max_weight ?"""
+        return self.inventory.fits(item, self.max_weight)
+
+    def is_inventory_full(self):
+        return len(self.inventory) >= self.max_slots
 
     def get_inventory(self):
         if not self.inventory:
@@ -145,43 +186,26 @@ class Player:
         return s
 
     def add_item(self, item):
-        if self.get_current_weight() + item.weight > self.max_weight:
-            print("\nVous portez trop de choses.\n")
+        if not self.can_carry(item):
+            emit("\nVous portez trop de choses.\n")
             return False
 
-        # quantité par défaut
-        q_add = int(getattr(item, "quantity", 1) or 1)
-
         # ✅ STACK
-        if item.name in self.inventory:
-            existing = self.inventory[item.name]
-            existing.quantity = int(getattr(existing, "quantity", 1) or 1) + q_add
-            print(f"\nVous obtenez {item.name} x{q_add} (total: x{existing.quantity}).\n")
+        stacked = item.name in self.inventory
+        q_add = self.inventory.add(item)
+        if stacked:
+            emit(f"\nVous obtenez {item.name} x{q_add} (total: x{self.inventory[item.name].quantity}).\n")
         else:
-            item.quantity = q_add
-            self.inventory[item.name] = item
-            print(f"\nVous obtenez {item.name} x{item.quantity}.\n")
-
-        if hasattr(self, "quest_manager") and self.quest_manager is not None:
-            self.quest_manager.check_action_objectives("obtenir", item.name)
+            emit(f"\nVous obtenez {item.name} x{q_add}.\n")
+        output.event(output.ITEM_OBTAINED, item=item.name, quantity=q_add)
 
+        self.publish(ItemObtained(self, item, q_add))
         return True
 
 
 
     def remove_item(self, item_name, qty=1):
-        item = self.inventory.get(item_name)
-        if item is None:
-            return None
-
-        qty = int(qty or 1)
-        current_q = int(getattr(item, "quantity", 1) or 1)
-
-        if current_q > qty:
-            item.quantity = current_q - qty
-            return item
-        else:
-            return self.inventory.pop(item_name, None)
+        return self.inventory.remove(item_name, qty)
 
 
 
@@ -192,36 +216,33 @@ class Player:
     # ÉQUIPEMENT & STATS
     # =========================================================
 
-    def recalc_stats(self):
-        atk = self.base_attack
-        mag = self.base_magic
-        arm = self.base_armor
-        hp_bonus = 0
-
-        for it in [
-            self.equipped_helmet,
-            self.equipped_armor,
-            self.equipped_other,
-            self.equipped_shield,
-            self.equipped_weapon,
-            self.equipped_magic,
-        ]:
-            if it:
-                atk += it.attack
-                mag += it.magic
-                arm += it.armor
-                hp_bonus += it.hp
-                # Buffs temporaires (consommables)
-                atk += int(self._temp_buffs.get("attack", {}).get("amount", 0) or 0)
-                arm += int(self._temp_buffs.get("armor", {}).get("amount", 0) or 0)
-                mag += int(self._temp_buffs.get("magic", {}).get("amount", 0) or 0)
-
+    def _base_vector(self):
+        return (self.base_attack, self.base_magic, self.base_armor, self.base_hp)
 
+    def _apply_stats(self):
+        """Publie les totaux des sources en attributs (lus tels quels en combat)."""
+        atk, mag, arm, hp = self.gear_stats.totals
+        b_atk, b_mag, b_arm, _ = self.buff_stats.totals
         self.attack = atk
         self.magic = mag
         self.armor = arm
-        self.max_hp = self.base_hp + hp_bonus
-        self.hp = min(self.hp, self.max_hp)
+        self.max_hp = hp
+        self.hp = min(self.hp, hp)
+        # buffs comptés une seule fois, quel que soit l'équipement
+        self.attack_value = atk + b_atk
+        self.magic_value = mag + b_mag
+        self.armor_value = arm + b_arm
+        self.gear_stats.dirty = self.buff_stats.dirty = False
+
+    def recalc_stats(self):
+        """Relit toutes les sources (base, six emplacements, buffs) ; equip et
+        level_up ne mettent à jour que la source qui change."""
+        self.gear_stats.set("base", self._base_vector())
+        for slot, attr in self.EQUIPMENT_SLOTS.items():
+            self.gear_stats.set(slot, item_vector(getattr(self, attr)))
+        for effect in self.effects.effects_of(self):
+            self.buff_stats.set(effect.name, stat_vector(effect.name, effect.amount))
+        self._apply_stats()
         # Mana : même logique que HP
         self.max_mana = max(0, int(getattr(self, "base_mana", 0) or 0))
         self.mana = min(int(getattr(self, "mana", self.max_mana) or 0), self.max_mana)
@@ -232,21 +253,12 @@ class Player:
             return False
 
         if item.name not in self.inventory:
-            print("\nObjet absent de l'inventaire.\n")
+            emit("\nObjet absent de l'inventaire.\n")
             return False
 
-        slot_map = {
-            "helmet": "equipped_helmet",
-            "armor": "equipped_armor",
-            "other": "equipped_other",
-            "shield": "equipped_shield",
-            "weapon": "equipped_weapon",
-            "magic": "equipped_magic",
-        }
-
-        slot = slot_map.get(item.item_type)
+        slot = self.EQUIPMENT_SLOTS.get(item.item_type)
         if slot is None:
-            print("\nObjet non équipable.\n")
+            emit("\nObjet non équipable.\n")
             return False
 
         current = getattr(self, slot)
@@ -255,25 +267,18 @@ class Player:
         else:
             setattr(self, slot, item)
 
-        self.recalc_stats()
+        self.gear_stats.set(item.item_type, item_vector(getattr(self, slot)))
+        self._apply_stats()
         return True
     
     def unequip_slot(self, slot_name: str):
-        slot_map = {
-            "helmet": "equipped_helmet",
-            "armor": "equipped_armor",
-            "other": "equipped_other",
-            "shield": "equipped_shield",
-            "weapon": "equipped_weapon",
-            "magic": "equipped_magic",
-        }
-
-        attr = slot_map.get(slot_name)
+        attr = self.EQUIPMENT_SLOTS.get(slot_name)
         if not attr:
             return False
 
         setattr(self, attr, None)
-        self.recalc_stats()
+        self.gear_stats.remove(slot_name)
+        self._apply_stats()
         return True
 
 
@@ -286,19 +291,11 @@ class Player:
     
     def get_attack_value(self):
         """Retourne l'attaque effective (attaque + buffs temporaires)."""
-        bonus = 0
-        b = self._temp_buffs.get("attack")
-        if b and b.get("turns", 0) > 0:
-            bonus += int(b.get("amount", 0) or 0)
-        return int(self.attack) + bonus
+        return self.attack_value
 
     def get_armor_value(self):
         """Retourne l'armure effective (armure + buffs temporaires)."""
-        bonus = 0
-        b = self._temp_buffs.get("armor")
-        if b and b.get("turns", 0) > 0:
-            bonus += int(b.get("amount", 0) or 0)
-        return int(getattr(self, "armor", 0) or 0) + bonus
+        return self.armor_value
 
     def apply_temp_buff(self, stat: str, amount: int, turns: int = 3):
         """Applique (ou prolonge) un buff temporaire."""
@@ -306,25 +303,20 @@ class Player:
         if turns <= 0 or amount == 0:
             return
 
-        cur = self._temp_buffs.get(stat)
-        if cur and cur.get("turns", 0) > 0:
-            cur["amount"] = max(int(cur.get("amount", 0) or 0), int(amount))
-            cur["turns"] = max(int(cur.get("turns", 0) or 0), int(turns))
-        else:
-            self._temp_buffs[stat] = {"amount": int(amount), "turns": int(turns)}
+        # déjà actif : plus fort montant, plus longue durée
+        effect = self.effects.apply(self, stat, int(amount), int(turns))
+        if self.buff_stats.set(stat, stat_vector(stat, effect.amount)):
+            self._apply_stats()
 
     def tick_buffs(self, n: int = 1):
         """Décrémente la durée des buffs (à appeler à la fin d'un tour)."""
         n = max(0, int(n))
         if n == 0:
             return
-        to_del = []
-        for k, v in self._temp_buffs.items():
-            v["turns"] = int(v.get("turns", 0) or 0) - n
-            if v["turns"] <= 0:
-                to_del.append(k)
-        for k in to_del:
-            self._temp_buffs.pop(k, None)
+        for effect in self.effects.tick(n):
+            self.buff_stats.remove(effect.name)
+        if self.buff_stats.dirty:
+            self._apply_stats()
 
     def is_consumable(self, item) -> bool:
         if item is None:
@@ -388,8 +380,8 @@ class Player:
             self.apply_temp_buff("agility", boost_agi, turns=turns_for_buffs)
             parts.append(f"AGI +{boost_agi} ({turns_for_buffs} tours)")
 
-        # retire l'objet (consommé)
-        self.inventory.pop(item_name, None)
+        # retire un exemplaire (le reste de la pile reste dans l'inventaire)
+        self.inventory.remove(item_name)
 
         msg = f"✅ Tu consommes {getattr(item, 'display_name', item_name)}"
         msg += (" : " + ", ".join(parts)) if parts else "."
@@ -431,37 +423,42 @@ class Player:
             self.hp -= real
             if self.hp < 0:
                 self.hp = 0
+            output.event(output.DAMAGE, target=self.name, amount=real, hp=self.hp, dmg_type=dmg_type)
             return real
 
 
     def xp_required_for_level(self, level):
-        base = 50
-        growth = 1.4
-        return int(round(base * (growth ** (level - 1))))
+        return xp_required(level)
 
     def gain_xp(self, amount):
         self.xp += amount
-        print(f"\n Vous gagnez {amount} XP.")
+        emit(f"\n Vous gagnez {amount} XP.")
+        output.event(output.XP_GAINED, amount=amount)
 
-        while self.xp >= self.xp_to_next:
-            self.xp -= self.xp_to_next
-            self.level_up()
+        # tous les niveaux gagnés d'un coup (leveling.py)
+        level, self.xp = levels_after(self.level, self.xp)
+        if level > self.level:
+            self.level_up(level - self.level)
 
-    def level_up(self):
-        self.level += 1
-        self.base_hp += 20
-        self.base_attack += 5
-        self.base_magic += 2
-        self.base_armor += 1
+    def level_up(self, levels=1):
+        """Monte de levels niveaux : stats de base, un seul recalcul et un seul message."""
+        if levels <= 0:
+            return
+        self.level += levels
+        for attr, gain in LEVEL_GAINS.items():
+            setattr(self, attr, getattr(self, attr) + gain * levels)
 
         self.xp_to_next = self.xp_required_for_level(self.level)
-        self.recalc_stats()
+        self.gear_stats.set("base", self._base_vector())
+        self._apply_stats()
         self.hp = self.max_hp
 
-        print(
+        output.event(output.LEVEL_UP, level=self.level, levels=levels)
+        emit(
             "\n=== LEVEL UP ===\n"
-            f"Niveau {self.level}\n"
-            "ATK +5 | MAG +2 | ARM +1 | PV +20\n"
+            f"Niveau {self.level}" + (f" (+{levels})" if levels > 1 else "") + "\n"
+            f"ATK +{LEVEL_GAINS['base_attack'] * levels} | MAG +{LEVEL_GAINS['base_magic'] * levels}"
+            f" | ARM +{LEVEL_GAINS['base_armor'] * levels} | PV +{LEVEL_GAINS['base_hp'] * levels}\n"
         )
 
     # =========================================================
@@ -494,32 +491,19 @@ class Player:
                 self.rewards.append(getattr(reward, "name", str(reward)))
                 return False
 
-        # 2) Si c'est une string : on essaie de récupérer l'Item depuis game (self.game.potion_soin, etc.)
+        # 2) Si c'est une string : exemplaire neuf de la définition du catalogue (game.get_catalog())
         item_obj = None
         g = getattr(self, "game", None)
-        if g is not None:
-            item_obj = getattr(g, str(reward), None)
+        if g is not None and callable(getattr(g, "get_catalog", None)):
+            item_obj = g.get_catalog().new_item(str(reward))
 
-        # 3) Si on a un Item connu du jeu, on en fabrique un exemplaire “neuf”
-        if item_obj is not None and hasattr(item_obj, "name"):
+        # 3) Si on a un Item connu du jeu, on l'ajoute
+        if item_obj is not None:
             try:
-                from item import Item
-                cloned = Item(
-                    item_obj.name,
-                    getattr(item_obj, "description", ""),
-                    getattr(item_obj, "weight", 0.0),
-                    item_type=getattr(item_obj, "item_type", None),
-                    quantity=getattr(item_obj, "quantity", 1),
-                    **getattr(item_obj, "stats", {}),
-                )
-                return self.add_item(cloned)
+                return self.add_item(item_obj)
             except Exception:
-                # si clone échoue, on tente d'ajouter l'objet tel quel
-                try:
-                    return self.add_item(item_obj)
-                except Exception:
-                    self.rewards.append(str(reward))
-                    return False
+                self.rewards.append(str(reward))
+                return False
 
         # 4) Sinon : on crée un item “quest” générique
         try:
@@ -533,10 +517,10 @@ class Player:
 
     def show_rewards(self):
         if not self.rewards:
-            print("\nAucune récompense.\n")
+            emit("\nAucune récompense.\n")
         else:
-            print("\nRécompenses :")
+            emit("\nRécompenses :")
             for r in self.rewards:
-                print(f"  - {r}")
-            print()
+                emit(f"  - {r}")
+            emit()
 
@@ -1,8 +1,42 @@
+from collections import Counter
+
 from item import Item
+import output
+from output import emit
+from events import PlayerMoved, ItemObtained, MonsterKilled, NpcTalkedTo
 
 
 """ Define the Quest class"""
 
+# Connectors accepted between the verb and the target of an objective, in the
+# order check_action_objective tries them ("" = "verb target").
+OBJECTIVE_CONNECTORS = ("", "avec", "le", "la", "à")
+
+
+def objective_keys(objective):
+    """
+    Return the (verb, target) event keys that complete an objective, each
+    with the rank of its variant in Quest.check_action_objective.
+
+    Examples:
+
+    >>> objective_keys("parler avec garde")
+    [(('parler', 'avec garde'), 0), (('parler', 'garde'), 1)]
+    >>> objective_keys("aller village")
+    [(('aller', 'village'), 0)]
+    >>> objective_keys("explorer")
+    [(('explorer', None), 0)]
+    """
+    verb, sep, rest = objective.partition(" ")
+    if not sep:
+        return [((objective, None), 0)]
+    keys = [((verb, rest), 0)]
+    for rank, connector in enumerate(OBJECTIVE_CONNECTORS[1:], 1):
+        head, sep, target = rest.partition(" ")
+        if sep and head == connector:
+            keys.append(((verb, target), rank))
+    return keys
+
 class Quest:
     """
     This class represents a quest in the game. A quest has a title, description,
@@ -15,10 +49,12 @@ class Quest:
         is_completed (bool): Whether the quest is completed.
         is_active (bool): Whether the quest is currently active.
         reward (str): Optional reward for completing the quest.
+        category (str): Quest category ("principale", "secondaire"...).
     """
 
+    DEFAULT_CATEGORY = "principale"
 
-    def __init__(self, title, description, objectives=None, reward=None, xp_reward=0):
+    def __init__(self, title, description, objectives=None, reward=None, xp_reward=0, category=DEFAULT_CATEGORY):
         """
         Initialize a new quest.
         
@@ -27,6 +63,7 @@ class Quest:
             description (str): The description of the quest.
             objectives (list): List of objectives (default: empty list).
             reward (str): Optional reward description.
+            category (str): Category counted by the QuestTracker.
             
         Examples:
         
@@ -48,6 +85,21 @@ class Quest:
         self.is_active = False
         self.reward = reward
         self.xp_reward = int(xp_reward or 0)
+        self.category = category
+        # QuestTracker of the manager holding the quest (set by add_quest)
+        self.tracker = None
+
+    @property
+    def status(self):
+        """
+        "inactive", "active" or "completed".
+
+        >>> Quest("Idle", "Nothing yet").status
+        'inactive'
+        """
+        if self.is_completed:
+            return "completed"
+        return "active" if self.is_active else "inactive"
 
 
     def activate(self):
@@ -68,8 +120,11 @@ class Quest:
         True
         """
         self.is_active = True
-        print(f"\n🗡️  Nouvelle quête activée: {self.title}")
-        print(f"📝 {self.description}\n")
+        if self.tracker is not None:
+            self.tracker.update(self)
+        output.event(output.QUEST_ACTIVATED, quest=self.title)
+        emit(f"\n🗡️  Nouvelle quête activée: {self.title}")
+        emit(f"📝 {self.description}\n")
 
 
     def complete_objective(self, objective, player=None):
@@ -98,7 +153,8 @@ class Quest:
         """
         if objective in self.objectives and objective not in self.completed_objectives:
             self.completed_objectives.append(objective)
-            print(f"✅ Objectif accompli: {objective}")
+            output.event(output.OBJECTIVE_COMPLETED, quest=self.title, objective=objective)
+            emit(f"✅ Objectif accompli: {objective}")
 
             # Check if all objectives are completed
             if len(self.completed_objectives) == len(self.objectives):
@@ -130,7 +186,10 @@ class Quest:
         """
         if not self.is_completed:
             self.is_completed = True
-            print(f"\n🏆 Quête terminée: {self.title}")
+            if self.tracker is not None:
+                self.tracker.update(self)
+            output.event(output.QUEST_COMPLETED, quest=self.title, xp=self.xp_reward)
+            emit(f"\n🏆 Quête terminée: {self.title}")
             # XP de quête
             if player and self.xp_reward > 0 and callable(getattr(player, "gain_xp", None)):
                 player.gain_xp(self.xp_reward)
@@ -139,23 +198,23 @@ class Quest:
             if self.reward and player:
                 r = self.reward
 
-                # Si reward est une string, on tente de récupérer un item du Game (player.game.<nom>)
+                # Si reward est une string, on tente de créer l'item du catalogue (player.game.get_catalog())
                 if isinstance(r, str):
                     g = getattr(player, "game", None)
-                    if g is not None and hasattr(g, r):
-                        r = getattr(g, r)
+                    if g is not None and callable(getattr(g, "get_catalog", None)):
+                        r = g.get_catalog().new_item(r) or r
 
                 rname = getattr(r, "name", str(r))
-                print(f"🎁 Récompense: {rname}")
+                emit(f"🎁 Récompense: {rname}")
 
                 # Si on a bien un Item, on l'ajoute
                 if hasattr(r, "weight") and callable(getattr(player, "add_item", None)):
                     player.add_item(r)
                 else:
-                    print(f"[WARN] Reward non ajoutée car ce n'est pas un Item: {self.reward}")
+                    emit(f"[WARN] Reward non ajoutée car ce n'est pas un Item: {self.reward}")
 
 
-            print()
+            emit()
 
 
     def get_status(self):
@@ -406,6 +465,93 @@ class Quest:
         return self.get_status()
 
 
+class QuestTracker:
+    """
+    Quest counters by (category, status), kept up to date by the quests
+    themselves (Quest.activate, Quest.complete_quest).
+
+    End-of-game and progress checks read the counters instead of scanning
+    every quest.
+
+    Examples:
+
+    >>> tracker = QuestTracker()
+    >>> main = Quest("Main", "Main story", ["x"])
+    >>> side = Quest("Side", "Side story", ["y"], category="secondaire")
+    >>> tracker.add(main)
+    >>> tracker.add(side)
+    >>> main.complete_quest() # doctest: +NORMALIZE_WHITESPACE
+    <BLANKLINE>
+    🏆 Quête terminée: Main
+    <BLANKLINE>
+    >>> tracker.count("completed"), tracker.count("inactive", "secondaire")
+    (1, 1)
+    >>> tracker.all_completed()
+    False
+    >>> tracker.progress()
+    {'principale': 100.0, 'secondaire': 0.0}
+    >>> tracker.percent()
+    50.0
+    """
+
+    STATUSES = ("inactive", "active", "completed")
+
+    def __init__(self):
+        self.counts = Counter()      # (category, status) -> quests
+        self.by_status = Counter()   # status -> quests
+        self.by_category = Counter() # category -> quests
+        self._status = {}            # quest -> status currently counted
+
+    def add(self, quest):
+        """Start tracking a quest (counted under its current status)."""
+        if quest in self._status:
+            return
+        quest.tracker = self
+        status = quest.status
+        self._status[quest] = status
+        self.counts[quest.category, status] += 1
+        self.by_status[status] += 1
+        self.by_category[quest.category] += 1
+
+    def update(self, quest):
+        """Move a tracked quest to its new status."""
+        old = self._status.get(quest)
+        new = quest.status
+        if old is None or old == new:
+            return
+        self._status[quest] = new
+        self.counts[quest.category, old] -= 1
+        self.counts[quest.category, new] += 1
+        self.by_status[old] -= 1
+        self.by_status[new] += 1
+
+    def count(self, status, category=None):
+        if category is None:
+            return self.by_status[status]
+        return self.counts[category, status]
+
+    def total(self, category=None):
+        if category is None:
+            return len(self._status)
+        return self.by_category[category]
+
+    def all_completed(self):
+        """True if there is at least one quest and all of them are completed."""
+        total = len(self._status)
+        return total > 0 and self.by_status["completed"] == total
+
+    def percent(self, category=None):
+        """Completion percentage (of all quests, or of one category)."""
+        total = self.total(category)
+        if not total:
+            return 0.0
+        return 100.0 * self.count("completed", category) / total
+
+    def progress(self):
+        """Completion percentage per category."""
+        return {category: self.percent(category) for category in self.by_category}
+
+
 class QuestManager:
     """
     This class manages all quests in the game.
@@ -413,6 +559,7 @@ class QuestManager:
     Attributes:
         quests (list): List of all quests in the game.
         active_quests (list): List of currently active quests.
+        tracker (QuestTracker): Completion counters of the quests.
         player: Reference to the player object.
     """
 
@@ -434,8 +581,19 @@ class QuestManager:
         """
         self.quests = []
         self.active_quests = []
+        self.tracker = QuestTracker()
         self.player = player
 
+    @property
+    def active_quests(self):
+        return self._active_quests
+
+    @active_quests.setter
+    def active_quests(self, quests):
+        self._active_quests = quests
+        # (verb, target) -> {quest: [(rank, objective), ...]}, rebuilt on the next check
+        self._index = None
+
 
     def add_quest(self, quest):
         """
@@ -455,6 +613,7 @@ class QuestManager:
         'Quest 1'
         """
         self.quests.append(quest)
+        self.tracker.add(quest)
 
 
     def activate_quest(self, quest_title):
@@ -488,6 +647,8 @@ class QuestManager:
                 quest.activate()
                 if quest not in self.active_quests:
                     self.active_quests.append(quest)
+                    if self._index is not None:
+                        self._index_quest(quest)
                 return True
         return False
 
@@ -596,11 +757,46 @@ class QuestManager:
 
         if getattr(self, "_in_reward", False):
             return
-        for quest in self.active_quests[:]:
-            quest.check_action_objective(action, target, self.player)
+        index = self._index if self._index is not None else self._build_index()
+        # One lookup: only the quests waiting on (action, target) are visited
+        waiting = index.get((action, target or None))
+        if not waiting:
+            return
+        for quest, candidates in list(waiting.items()):
+            if not quest.is_completed:
+                # same choice as check_action_objective: first variant that completes
+                for _, objective in sorted(candidates):
+                    if quest.complete_objective(objective, self.player):
+                        break
             if quest.is_completed:
                 if quest in self.active_quests:
                     self.active_quests.remove(quest)
+                self._unindex_quest(quest)
+
+    def _build_index(self):
+        self._index = {}
+        for quest in self.active_quests:
+            self._index_quest(quest)
+        return self._index
+
+    def _index_quest(self, quest):
+        index = self._index
+        for objective in quest.objectives:
+            if objective in quest.completed_objectives:
+                continue
+            for key, rank in objective_keys(objective):
+                waiting = index.get(key)
+                if waiting is None:
+                    waiting = index[key] = {}
+                waiting.setdefault(quest, []).append((rank, objective))
+
+    def _unindex_quest(self, quest):
+        index = self._index
+        for objective in quest.objectives:
+            for key, _ in objective_keys(objective):
+                waiting = index.get(key)
+                if waiting is not None and waiting.pop(quest, None) is not None and not waiting:
+                    del index[key]
 
 
 
@@ -736,13 +932,13 @@ class QuestManager:
         <BLANKLINE>
         """
         if not self.quests:
-            print("\nAucune quête disponible.\n")
+            emit("\nAucune quête disponible.\n")
             return
 
-        print("\n📋 Liste des quêtes:")
+        emit("\n📋 Liste des quêtes:")
         for quest in self.quests:
-            print(f"  {quest.get_status()}")
-        print()
+            emit(f"  {quest.get_status()}")
+        emit()
 
 
     def show_quest_details(self, quest_title, current_counts=None):
@@ -773,16 +969,53 @@ class QuestManager:
         """
         quest = self.get_quest_by_title(quest_title)
         if quest:
-            print(quest.get_details(current_counts))
+            emit(quest.get_details(current_counts))
         else:
-            print(f"\nQuête '{quest_title}' non trouvée.\n")
+            emit(f"\nQuête '{quest_title}' non trouvée.\n")
             
     def all_quests_completed(self):
         """Retourne True si toutes les quêtes du jeu sont terminées."""
-        if not self.quests:
-            return False
-        return all(q.is_completed for q in self.quests)
+        return self.tracker.all_completed()
     
+    # Objective verb checked for each domain event (see events.py)
+    EVENT_VERBS = {
+        PlayerMoved: "aller",
+        ItemObtained: "obtenir",
+        MonsterKilled: "tuer",
+        NpcTalkedTo: "parler",
+    }
+
+    def subscribe(self, bus):
+        """
+        Register the quest checks on a game's event bus.
+
+        Examples:
+
+        >>> from events import EventBus
+        >>> bus = EventBus()
+        >>> manager = QuestManager()
+        >>> manager.subscribe(bus)
+        >>> quest = Quest("Talk", "Talk to the king", ["parler avec roi"])
+        >>> manager.add_quest(quest)
+        >>> manager.activate_quest("Talk") # doctest: +NORMALIZE_WHITESPACE
+        <BLANKLINE>
+        🗡️  Nouvelle quête activée: Talk
+        📝 Talk to the king
+        <BLANKLINE>
+        True
+        >>> bus.publish(NpcTalkedTo(None, "roi")) # doctest: +NORMALIZE_WHITESPACE
+        ✅ Objectif accompli: parler avec roi
+        <BLANKLINE>
+        🏆 Quête terminée: Talk
+        <BLANKLINE>
+        """
+        for event_type in self.EVENT_VERBS:
+            bus.subscribe(event_type, self.on_event)
+
+    def on_event(self, event):
+        """Check the objectives matching a domain event ("aller <room>", "tuer <monster>"...)."""
+        self.check_action_objectives(self.EVENT_VERBS[type(event)], event.target)
+
     def check_action(self, action, target=None):
         # Alias compat : certains endroits appellent encore check_action(...)
         return self.check_action_objectives(action, target)
@@ -0,0 +1,395 @@
+# regions.py
+# Description: construction paresseuse des étages du donjon.
+#
+# Seule la "surface" (village, forêt, capitale, sous-sol) est construite au
+# démarrage d'une session. Les salles d'un étage sont d'abord de simples
+# coquilles (nom + description) ; la région entière (sorties, monstres,
+# objets) est matérialisée la première fois qu'une sortie y mène via
+# Room.get_exit(). Une région où plus personne ne passe peut être déchargée.
+#
+# Exemple :
+#   from content_pack import load_pack
+#   from regions import build_lazy_game
+#   game = build_lazy_game(load_pack(), "Alice", unload_after=50)
+
+import weakref
+
+from room_index import NameIndex
+from content_pack import ContentPack, WorldBuilder
+from locations import CHARACTERS, ITEMS
+
+# locations.CHARACTERS / ITEMS -> liste correspondante du pack et de l'état sauvegardé
+_PACK_LISTS = {CHARACTERS: "room_characters", ITEMS: "room_items"}
+_SNAPSHOT_LISTS = {CHARACTERS: "chars", ITEMS: "items"}
+
+
+def _placement_words(key, name):
+    """Mots de recherche d'une entité placée (comme locations.py) : clé et nom, en minuscules."""
+    return {key.lower(), name.lower()}
+
+
+class RegionLayout:
+    """
+    Découpage statique d'un content pack en régions, calculé une seule fois
+    par pack puis partagé par toutes les sessions.
+    """
+
+    def __init__(self, data):
+        self.names = list(data.get("regions", {}))
+        self.rooms = [list(data["regions"][name]) for name in self.names]
+        self.room_region = [None] * len(data["rooms"])
+        for r, room_ids in enumerate(self.rooms):
+            for i in room_ids:
+                self.room_region[i] = r
+        self.surface_rooms = [i for i, r in enumerate(self.room_region) if r is None]
+
+        # Un personnage appartient à la région de la salle où il est placé,
+        # à défaut à celle de sa current_room.
+        self.char_region = [None] * len(data["characters"])
+        for j, d in enumerate(data["characters"]):
+            if d["room"] is not None:
+                self.char_region[j] = self.room_region[d["room"]]
+        for i, chars in enumerate(data["room_characters"]):
+            for _, j in chars:
+                self.char_region[j] = self.room_region[i]
+        self.characters = [[] for _ in self.names]
+        for j, r in enumerate(self.char_region):
+            if r is not None:
+                self.characters[r].append(j)
+
+        self.surface_game_chars = []
+        self.game_chars = [[] for _ in self.names]
+        for j in data["game_characters"]:
+            r = self.char_region[j]
+            (self.surface_game_chars if r is None else self.game_chars[r]).append(j)
+
+        # Objets propres à une région : posés dans ses salles ou portés par
+        # ses habitants, et référencés nulle part ailleurs.
+        owners = {}
+        for i, items in enumerate(data["room_items"]):
+            for _, j in items:
+                owners.setdefault(j, set()).add(self.room_region[i])
+        for j, d in enumerate(data["characters"]):
+            for k in d.get("loot", ()):
+                owners.setdefault(k, set()).add(self.char_region[j])
+        for j in data["attrs"]["items"].values():
+            owners.setdefault(j, set()).add(None)
+        for d in data["quests"]:
+            if d["reward"] is not None and "item" in d["reward"]:
+                owners.setdefault(d["reward"]["item"], set()).add(None)
+        self.items = [[] for _ in self.names]
+        for j, regions in owners.items():
+            if len(regions) == 1:
+                r = next(iter(regions))
+                if r is not None:
+                    self.items[r].append(j)
+
+        attrs = data["attrs"]
+        self.surface_room_attrs = []
+        self.room_attrs = [[] for _ in self.names]
+        for attr, i in attrs["rooms"].items():
+            r = self.room_region[i]
+            (self.surface_room_attrs if r is None else self.room_attrs[r]).append((attr, i))
+        self.surface_char_attrs = []
+        self.char_attrs = [[] for _ in self.names]
+        for attr, j in attrs["characters"].items():
+            r = self.char_region[j]
+            (self.surface_char_attrs if r is None else self.char_attrs[r]).append((attr, j))
+
+        # where / find sur les étages non chargés : mot -> [(région, salle, index)]
+        # d'après le placement du pack
+        self.placements = {}
+        for kind, lists in _PACK_LISTS.items():
+            table = self.placements[kind] = {}
+            for i, entries in enumerate(data[lists]):
+                r = self.room_region[i]
+                if r is None:
+                    continue
+                for key, j in entries:
+                    for word in _placement_words(key, self.entity(data, kind, j)["name"]):
+                        table.setdefault(word, []).append((r, i, j))
+
+        # toutes les salles du pack, chargées ou non -> index
+        self.room_names = NameIndex()
+        for i, (name, _) in enumerate(data["rooms"]):
+            self.room_names.add(name, i)
+
+
+    @staticmethod
+    def entity(data, kind, j):
+        """Données du pack du personnage (dict du personnage) ou de l'objet (sa définition) n° j."""
+        if kind == CHARACTERS:
+            return data["characters"][j]
+        return data["item_defs"][data["items"][j]]
+
+
+_layouts = weakref.WeakKeyDictionary()
+
+
+def region_layout(pack):
+    layout = _layouts.get(pack)
+    if layout is None:
+        layout = _layouts[pack] = RegionLayout(pack.data)
+    return layout
+
+
+class Region:
+    """Un étage du donjon dans une session : index r du RegionLayout + état."""
+
+    def __init__(self, manager, r):
+        layout = manager.layout
+        self.manager = manager
+        self.name = layout.names[r]
+        self.rooms = layout.rooms[r]
+        self.characters = layout.characters[r]
+        self.items = layout.items[r]
+        self.game_chars = layout.game_chars[r]
+        self.room_attrs = layout.room_attrs[r]
+        self.char_attrs = layout.char_attrs[r]
+        self.loaded = False
+        self.last_seen = 0
+        self.load_count = 0
+        # état sauvegardé au déchargement : {"items": {...}, "chars": {...}, "game_chars": [...]}
+        self.snapshot = None
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.manager.load(self)
+
+    def __repr__(self):
+        state = "chargée" if self.loaded else "non chargée"
+        return f"<Region {self.name} ({len(self.rooms)} salles, {state})>"
+
+
+class RegionManager(WorldBuilder):
+    """
+    WorldBuilder qui ne remplit que les régions visitées.
+
+    unload_after : nombre de déplacements du joueur (tick()) sans présence
+    dans une région avant de la décharger ; None = jamais.
+    """
+
+    def __init__(self, pack, unload_after=None):
+        super().__init__(pack)
+        self.layout = layout = region_layout(pack)
+        self.unload_after = unload_after
+        self.game = None
+        self.tick_count = 0
+        self.region_list = [Region(self, r) for r in range(len(layout.names))]
+        self.regions = dict(zip(layout.names, self.region_list))
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["layout"]
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.layout = region_layout(self.pack)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def room(self, i):
+        room = self.rooms[i]
+        if room is None:
+            room = super().room(i)
+            r = self.layout.room_region[i]
+            if r is not None:
+                room.region = self.region_list[r]
+        return room
+
+    def build(self, player_name=None, seed=None):
+        """Construit la surface et le joueur ; les régions restent des coquilles."""
+        layout = self.layout
+        game = self.new_game(seed)
+        game.regions = self
+        self.game = game
+
+        game.rooms = [self.fill_room(i) for i in layout.surface_rooms]
+        game.characters = [self.character(j) for j in layout.surface_game_chars]
+        for attr, i in layout.surface_room_attrs:
+            setattr(game, attr, self.room(i))
+        for attr, j in layout.surface_char_attrs:
+            setattr(game, attr, self.character(j))
+
+        game._register_directions()
+        self.setup_player(game, player_name)
+        return game
+
+    # ------------------------------------------------------------------
+    # Chargement / déchargement
+    # ------------------------------------------------------------------
+
+    def load(self, region):
+        game = self.game
+        snapshot = region.snapshot
+        new_rooms = []
+        for i in region.rooms:
+            if snapshot is None:
+                room = self.fill_room(i)
+            else:
+                room = self.fill_room(i, snapshot["items"][i], snapshot["chars"][i])
+            new_rooms.append(room)
+            game.register_directions(room.exits)
+        game.rooms.extend(new_rooms)
+        if game.locations is not None:
+            for room in new_rooms:
+                game.locations.add_room(room)
+
+        game_chars = region.game_chars if snapshot is None else snapshot["game_chars"]
+        game.characters.extend(self.character(j) for j in game_chars)
+
+        for attr, i in region.room_attrs:
+            setattr(game, attr, self.rooms[i])
+        for attr, j in region.char_attrs:
+            # un boss tué avant le déchargement ne revient pas (les autres
+            # monstres sont revenus : unload attend leurs réapparitions)
+            if snapshot is None or self.characters[j] is not None:
+                setattr(game, attr, self.character(j))
+
+        region.snapshot = None
+        region.loaded = True
+        region.last_seen = self.tick_count
+        region.load_count += 1
+
+    def unload(self, region):
+        """
+        Décharge une région et ne garde que son état (qui reste où).
+        Retourne False (et ne fait rien) si la région ne peut pas être
+        reconstruite fidèlement : joueur ou escorte présents, objet ou
+        personnage venu d'ailleurs, monstre blessé, réapparition en attente.
+        """
+        if not region.loaded:
+            return False
+        game = self.game
+        rooms = [self.rooms[i] for i in region.rooms]
+        room_ids = {id(room) for room in rooms}
+
+        respawner = game.respawner
+        if respawner is not None and any(respawner.pending(room) for room in rooms):
+            return False
+
+        if id(game.player.current_room) in room_ids:
+            return False
+        npc = game.following_npc
+        if npc is not None and id(npc.current_room) in room_ids:
+            return False
+
+        own_chars = {}
+        for j in region.characters:
+            char = self.characters[j]
+            if char is not None:
+                own_chars[id(char)] = j
+        known_items = {id(item): j for j, item in enumerate(self.items) if item is not None}
+
+        snap_items = {}
+        snap_chars = {}
+        for i, room in zip(region.rooms, rooms):
+            items = []
+            for key, item in room.inventory.items():
+                j = known_items.get(id(item))
+                if j is None:
+                    return False
+                items.append([key, j])
+            chars = []
+            for key, char in room.characters.items():
+                j = own_chars.get(id(char))
+                if j is None:
+                    return False
+                if getattr(char, "hp", None) != getattr(char, "hp_max", None):
+                    return False
+                chars.append([key, j])
+            snap_items[i] = items
+            snap_chars[i] = chars
+
+        game_chars = [own_chars[id(c)] for c in game.characters if id(c) in own_chars]
+        region.snapshot = {"items": snap_items, "chars": snap_chars, "game_chars": game_chars}
+
+        # Les salles restent des coquilles : les sorties voisines et
+        # l'historique du joueur continuent de pointer dessus.
+        for room in rooms:
+            if game.locations is not None:
+                game.locations.remove_room(room)
+            room.exits = {}
+            room.inventory = {}
+            room.characters = {}
+        game.rooms = [room for room in game.rooms if id(room) not in room_ids]
+        game.characters = [c for c in game.characters if id(c) not in own_chars]
+        for attr, _ in region.char_attrs:
+            game.__dict__.pop(attr, None)
+        for j in region.characters:
+            self.characters[j] = None
+        for j in region.items:
+            self.items[j] = None
+
+        region.loaded = False
+        return True
+
+    def tick(self, current_room):
+        """Appelé à chaque déplacement du joueur (Game.update_characters)."""
+        self.tick_count += 1
+        here = getattr(current_room, "region", None)
+        if here is not None:
+            here.last_seen = self.tick_count
+        if self.unload_after is None:
+            return
+        for region in self.regions.values():
+            if region.loaded and region is not here and self.tick_count - region.last_seen > self.unload_after:
+                self.unload(region)
+
+    def find_room(self, room_name):
+        """Salle d'une région par son nom exact (la région est chargée au besoin)."""
+        i = self.layout.room_names.get(room_name)
+        if i is None or self.layout.room_region[i] is None:
+            return None
+        return self._materialize(i)
+
+    def resolve_room(self, room_name):
+        """Salle la plus proche de room_name (voir NameIndex.resolve), chargée au besoin."""
+        i = self.layout.room_names.resolve(room_name)
+        if i is None:
+            return None
+        return self._materialize(i)
+
+    def _materialize(self, i):
+        r = self.layout.room_region[i]
+        if r is not None:
+            self.region_list[r].ensure_loaded()
+        return self.rooms[i]
+
+    def locate(self, kind, name):
+        """
+        Personnages (kind = locations.CHARACTERS) ou objets au sol (ITEMS)
+        nommés name sur les étages non chargés, que LocationIndex ne voit
+        pas : placement du pack, ou état sauvegardé d'une région déchargée.
+        Retourne [(nom de salle, données du pack de l'entité)].
+        """
+        layout = self.layout
+        data = self.data
+        word = name.lower()
+        found = []
+        for r, i, j in layout.placements[kind].get(word, ()):
+            region = self.region_list[r]
+            if not region.loaded and region.snapshot is None:
+                found.append((i, j))
+        lists = _SNAPSHOT_LISTS[kind]
+        for region in self.region_list:
+            if region.loaded or region.snapshot is None:
+                continue
+            for i, entries in region.snapshot[lists].items():
+                for key, j in entries:
+                    if word in _placement_words(key, layout.entity(data, kind, j)["name"]):
+                        found.append((i, j))
+        return [(data["rooms"][i][0], layout.entity(data, kind, j)) for i, j in found]
+
+    def loaded_regions(self):
+        return [name for name, region in self.regions.items() if region.loaded]
+
+
+def build_lazy_game(pack, player_name=None, unload_after=None, seed=None):
+    """Comme content_pack.build_game(), mais les étages du donjon sont construits à la demande."""
+    if not isinstance(pack, ContentPack):
+        pack = ContentPack(pack)
+    return RegionManager(pack, unload_after).build(player_name, seed)
@@ -0,0 +1,106 @@
+# respawn.py
+# Description: réapparition des monstres vaincus, au fil de l'horloge du monde.
+#
+# Un monstre vaincu (victory_cleanup de l'interface) n'est pas jeté : à sa
+# première mort, ses paramètres de création sont relevés
+# (MonsterCharacter.spawn_args : stats de _setup_characters, butin, patterns)
+# et l'objet lui-même rejoint un pool. Au bout de delay tours (world_clock),
+# un objet du pool est remis à neuf et replacé dans sa salle : pas de
+# nouvelle allocation de MonsterCharacter. Les boss ne reviennent pas.
+#
+# Un monstre vaincu quitte game.characters et le Scheduler (plus de tour
+# de PNJ pour lui) et y revient avec sa réapparition. Tant qu'une réapparition est en
+# attente dans une salle, sa région ne peut pas être déchargée
+# (RegionManager.unload) : le monstre revient toujours dans une salle
+# chargée, et l'état sauvegardé au déchargement reste complet.
+#
+# Exemple :
+#   game.get_respawner().killed(monster, room, "slime")
+#   game.clock.advance(RespawnPool.DELAY)   # slime est de retour
+
+from locations import CHARACTERS
+from output import emit
+
+
+class RespawnPool:
+    """Modèles et monstres en attente de réapparition, par modèle."""
+
+    # Tours avant qu'un monstre vaincu réapparaisse
+    DELAY = 50
+
+    def __init__(self, game, delay=None):
+        self.game = game
+        self.delay = self.DELAY if delay is None else delay
+        # modèle (salle, clé) -> paramètres de création
+        self.templates = {}
+        # modèle -> [(monstre vaincu réutilisable, présent dans game.characters)]
+        self.pool = {}
+        # nom de salle -> réapparitions en attente
+        self.waiting = {}
+
+    def __len__(self):
+        return sum(len(monsters) for monsters in self.pool.values())
+
+    def pending(self, room):
+        """Nombre de réapparitions en attente dans room."""
+        return self.waiting.get(room.name, 0)
+
+    def killed(self, monster, room, key):
+        """
+        Enregistre la mort de monster (retiré de room.characters[key]) et
+        planifie son retour. À appeler avant drop_loot (le butin fait partie
+        du modèle). Retourne le Timer, ou None si le monstre ne revient pas.
+        """
+        if getattr(monster, "is_boss", False):
+            return None
+        template = (room.name, key)
+        if template not in self.templates:
+            self.templates[template] = monster.spawn_args()
+        game = self.game
+        characters = game.characters
+        for i, char in enumerate(characters):
+            if char is monster:
+                del characters[i]
+                listed = True
+                break
+        else:
+            listed = False
+        # Scheduler.sync ne voit que la taille de la liste : une mort et une
+        # réapparition dans le même tour passeraient inaperçues
+        if game.scheduler is not None:
+            game.scheduler.remove(monster)
+        self.pool.setdefault(template, []).append((monster, listed))
+        self.waiting[room.name] = self.waiting.get(room.name, 0) + 1
+        return game.clock.schedule(self.delay, self.respawn, room, key)
+
+    def respawn(self, room, key):
+        """Replace un monstre du pool dans room (plus tard si la place est prise)."""
+        template = (room.name, key)
+        monsters = self.pool.get(template)
+        if not monsters:
+            return None
+        if key in room.characters:
+            self.game.clock.schedule(self.delay, self.respawn, room, key)
+            return None
+
+        monster, listed = monsters.pop()
+        self._done(room)
+        monster.respawn(room, self.templates[template])
+        room.characters[key] = monster
+        game = self.game
+        if listed:
+            game.characters.append(monster)
+            if game.scheduler is not None:
+                game.scheduler.add(monster)
+        if game.locations is not None:
+            game.locations.add(CHARACTERS, room, key, monster)
+        if game.player is not None and game.player.current_room is room:
+            emit(f"\n{monster.name} réapparaît.\n")
+        return monster
+
+    def _done(self, room):
+        count = self.waiting[room.name] - 1
+        if count:
+            self.waiting[room.name] = count
+        else:
+            del self.waiting[room.name]
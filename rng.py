@@ -0,0 +1,107 @@
+# rng.py
+# Description: aléatoire par session, reproductible.
+#
+# Chaque Game possède son générateur (game.rng, graine game.rng.initial_seed).
+# Comme pour la sortie (output.py), le générateur actif est porté par une
+# contextvar : Game.process_command() l'active, et les personnages tirent
+# avec current() (déplacements, dégâts, IA, patterns). Sans générateur
+# actif, current() retourne le module random (ancien comportement).
+#
+# Une partie se rejoue à l'identique depuis sa graine et game.command_log.
+# Le journal est désactivé par défaut (une session de serveur ou de bot ne
+# garde pas toutes ses commandes) : game.start_recording() l'active, avant
+# la première commande.
+#   game.start_recording()
+#   ...
+#   game2 = replay(lambda seed: build_game(load_pack(), "Hero", seed=seed),
+#                  game.rng.initial_seed, game.command_log)
+#
+# Simulations parallèles : derive_seed(graine, "sim", i) donne la graine de
+# la i-ème simulation, quel que soit le processus qui l'exécute.
+
+import contextvars
+import hashlib
+import random
+from contextlib import contextmanager
+
+_current_rng = contextvars.ContextVar("tba_rng", default=None)
+
+
+def derive_seed(seed, *path):
+    """
+    Graine d'un flux enfant : sha256 de la graine parente et du chemin.
+    Stable entre processus et versions (pas de hash() de Python).
+
+    >>> derive_seed(42, "sim", 0) == derive_seed(42, "sim", 0)
+    True
+    >>> derive_seed(42, "sim", 0) == derive_seed(42, "sim", 1)
+    False
+    """
+    digest = hashlib.sha256(repr((seed,) + path).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class GameRandom(random.Random):
+    """
+    random.Random qui garde sa graine et sait dériver des flux enfants.
+
+    >>> a, b = GameRandom(7), GameRandom(7)
+    >>> [a.randint(1, 100) for _ in range(5)] == [b.randint(1, 100) for _ in range(5)]
+    True
+    >>> a.child("combat").initial_seed == b.child("combat").initial_seed != a.child("loot").initial_seed
+    True
+    """
+
+    def seed(self, a=None, version=2):
+        # graine None : tirée au hasard, mais connue (rejouable)
+        if a is None:
+            a = random.SystemRandom().getrandbits(64)
+        self.initial_seed = a
+        super().seed(a, version)
+
+    def child(self, *path):
+        """Nouveau flux indépendant, déterminé par la graine de celui-ci et path."""
+        return GameRandom(derive_seed(self.initial_seed, *path))
+
+    def __reduce__(self):
+        # random.Random ne pickle que son état interne : on garde aussi la graine
+        return GameRandom, (self.initial_seed,), self.getstate()
+
+
+def current():
+    """Générateur de la session courante (module random s'il n'y en a pas)."""
+    return _current_rng.get() or random
+
+
+@contextmanager
+def use_rng(rng):
+    """Active rng pour le bloc (None : retour au module random)."""
+    token = _current_rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _current_rng.reset(token)
+
+
+def bind_rng(rng):
+    """Active rng pour le reste du contexte courant (ex: boucle Tkinter)."""
+    _current_rng.set(rng)
+
+
+def replay(new_game, seed, commands):
+    """
+    Rejoue commands dans new_game(seed) (un Game neuf construit avec cette
+    graine) ; retourne le Game, dans l'état exact de la partie d'origine,
+    journal compris (il peut être rejoué à son tour).
+    Sans sortie de session, le texte est gardé dans un OutputSink.
+    """
+    from output import OutputSink
+
+    game = new_game(seed)
+    game.start_recording()
+    if game.output is None:
+        game.output = OutputSink()
+    for command_string in commands:
+        game.process_command(command_string)
+        game.check_game_over()
+    return game
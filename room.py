@@ -1,5 +1,145 @@
 # Define the Room class.
 
+from collections.abc import MutableMapping
+
+from directions import DEFAULT_DIRECTIONS
+
+
+class VersionedDict(dict):
+    """
+    dict des salles (sorties, objets, personnages) : version augmente à
+    chaque modification, ce qui invalide les textes en cache de la salle.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __reduce__(self):
+        return VersionedDict, (dict(self),)
+
+    def __setitem__(self, key, value):
+        self.version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.version += 1
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.version += 1
+        return super().__ior__(other)
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self.version += 1
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+
+
+class _Unallocated(MutableMapping):
+    """
+    inventory / characters d'une salle vide : se comporte comme un dict
+    vide et n'alloue le vrai dict de la salle qu'à la première écriture.
+    """
+
+    __slots__ = ("room", "slot")
+
+    def __init__(self, room, slot):
+        self.room = room
+        self.slot = slot
+
+    def _dict(self):
+        return getattr(self.room, self.slot)
+
+    def __getitem__(self, key):
+        d = self._dict()
+        if d is None:
+            raise KeyError(key)
+        return d[key]
+
+    def __setitem__(self, key, value):
+        d = self._dict()
+        if d is None:
+            d = VersionedDict()
+            setattr(self.room, self.slot, d)
+        d[key] = value
+
+    def __delitem__(self, key):
+        d = self._dict()
+        if d is None:
+            raise KeyError(key)
+        del d[key]
+
+    def __iter__(self):
+        return iter(self._dict() or ())
+
+    def __len__(self):
+        d = self._dict()
+        return 0 if d is None else len(d)
+
+    def __repr__(self):
+        return repr(self._dict() or {})
+
+
+class _FrozenExits(MutableMapping):
+    """
+    Sorties d'une salle gelée dans un RoomStore (room_store.py), lues dans
+    ses tableaux. Une écriture rend à la salle un dict de sorties ordinaire.
+    """
+
+    __slots__ = ("room",)
+
+    def __init__(self, room):
+        self.room = room
+
+    def __getitem__(self, name):
+        room = self.room
+        code = room._store.directions.code(name)
+        if code is None or room._store.find(room._exits, code) < 0:
+            raise KeyError(name)
+        return room._store.exit(room._exits, code)
+
+    def __iter__(self):
+        room = self.room
+        names = room._store.directions.names
+        return (names[code] for code in room._store.codes_of(room._exits))
+
+    def __len__(self):
+        room = self.room
+        return len(room._store.codes_of(room._exits))
+
+    def _thaw(self):
+        room = self.room
+        room.exits = dict(self)
+        return room._exits
+
+    def __setitem__(self, name, target):
+        self._thaw()[name] = target
+
+    def __delitem__(self, name):
+        del self._thaw()[name]
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class Room:
 
     """
@@ -16,6 +156,9 @@ class Room:
     exits : dict[str, Room]
         Un dictionnaire associant une direction (str) à un objet Room
         correspondant à la sortie dans cette direction.
+    region : Region | None
+        Étage chargé à la demande (regions.py) ; None pour une salle
+        construite normalement.
 
     Méthodes :
     init(name, description)
@@ -29,92 +172,171 @@ class Room:
 
     Exceptions :
     Aucune.
-    """
-
-    # Ensemble des directions valides (rempli automatiquement depuis la map)
-    VALID_DIRECTIONS = set()
 
-    # Dictionnaire pour normaliser les directions saisies par le joueur
-    # vers une forme canonique (N, S, E, O, "haut", "bas", etc.)
-    DIRECTION_MAP = {
-        "n": "N",
-        "nord": "N",
+    Représentation compacte (__slots__) : inventory et characters ne sont
+    alloués qu'à la première écriture, et les sorties peuvent être gelées
+    dans un RoomStore (room_store.py) ; les attributs s'utilisent toujours
+    comme des dict.
 
-        "s": "S",
-        "sud": "S",
-
-        "e": "E",
-        "est": "E",
-
-        "o": "O",
-        "ouest": "O",
+    Les textes affichés (sorties, description longue, objets, personnages)
+    sont gardés en cache avec la version des dict dont ils dépendent
+    (VersionedDict) : tant que la salle ne change pas, look et go ne
+    recomposent rien.
+    """
 
-        "u": "haut",
-        "up": "haut",
-        "haut": "haut",
-        "monter": "haut",
+    __slots__ = ("name", "description", "region", "_exits", "_store", "_inventory", "_characters", "_render")
 
-        "d": "bas",
-        "down": "bas",
-        "bas": "bas",
-        "descendre": "bas",
-    }
+    # Saisies du jeu de base -> forme canonique (N, S, E, O, "haut", "bas"),
+    # en lecture seule ; chaque monde a son propre jeu : game.directions
+    # (directions.py)
+    DIRECTION_MAP = DEFAULT_DIRECTIONS.aliases
 
     # Define the constructor. 
     def __init__(self, name, description):
         self.name = name
         self.description = description
-        self.exits = {}
-        self.inventory = {}
-        self.characters = {}
+        # Région paresseuse à laquelle appartient la salle (voir regions.py)
+        self.region = None
+        # dict {direction: Room}, ou ligne du RoomStore _store
+        self._exits = {}
+        self._store = None
+        self._inventory = None
+        self._characters = None
+        # textes en cache : {"exits": (version, texte), ...} ; None = rien en cache
+        self._render = None
+
+    @property
+    def exits(self):
+        if self._store is None:
+            return self._exits
+        return _FrozenExits(self)
+
+    @exits.setter
+    def exits(self, exits):
+        self._exits = exits if type(exits) is VersionedDict else VersionedDict(exits)
+        self._store = None
+        self._render = None
+
+    @property
+    def inventory(self):
+        inventory = self._inventory
+        return inventory if inventory is not None else _Unallocated(self, "_inventory")
+
+    @inventory.setter
+    def inventory(self, inventory):
+        self._inventory = _allocated(inventory)
+        self._render = None
+
+    @property
+    def characters(self):
+        characters = self._characters
+        return characters if characters is not None else _Unallocated(self, "_characters")
+
+    @characters.setter
+    def characters(self, characters):
+        self._characters = _allocated(characters)
+        self._render = None
+
+    def compact(self):
+        """Libère inventory / characters redevenus vides."""
+        if not self._inventory:
+            self._inventory = None
+        if not self._characters:
+            self._characters = None
+        self._render = None
+
+    # Pickle (migration de session) et ClonePlan (world_template.py) :
+    # état sous forme de dict, sorties gelées recopiées en dict.
+    def __getstate__(self):
+        return {
+            "name": self.name,
+            "description": self.description,
+            "region": self.region,
+            "exits": dict(self.exits),
+            "inventory": self._inventory,
+            "characters": self._characters,
+        }
+
+    def __setstate__(self, state):
+        self.name = state["name"]
+        self.description = state["description"]
+        self.region = state["region"]
+        self.exits = state["exits"]
+        self.inventory = state["inventory"]
+        self.characters = state["characters"]
 
     @staticmethod
-    def normalize_direction(direction):
+    def normalize_direction(direction, directions=DEFAULT_DIRECTIONS):
         """
         Prend une direction entrée par le joueur (ex: 'n', 'Nord', 'ouest', 'U')
         et la renvoie sous forme normalisée (ex: 'N', 'O', 'haut', 'bas').
         Retourne None si la direction n'est pas reconnue.
+        directions : jeu de directions du monde (game.directions).
         """
-        if not isinstance(direction, str):
-            return None
-        d = direction.strip().lower()
-        return Room.DIRECTION_MAP.get(d, None)
-
-    @classmethod
-    def register_direction(cls, direction):
-        """
-        Enregistre une direction comme valide dans l'ensemble global
-        des directions possibles.
-        Appelée depuis la construction de la map (game.setup).
-        """
-        cls.VALID_DIRECTIONS.add(direction)
+        return directions.normalize(direction)
 
     # Define the get_exit method.
-    def get_exit(self, direction):
-
-        # Normaliser la direction avant de chercher dans le dictionnaire
-        normalized = Room.normalize_direction(direction)
-        if normalized is None:
-            return None
+    def get_exit(self, direction, directions=None):
 
-        # Return the room in the given direction if it exists.
-        if normalized in self.exits.keys():
-            return self.exits[normalized]
+        # Saisie -> sortie, avec le jeu de directions du monde (par défaut
+        # celui du RoomStore pour une salle gelée, sinon celui de base)
+        store = self._store
+        if store is None:
+            directions = directions or DEFAULT_DIRECTIONS
+            normalized = directions._inputs.get(direction) or directions.normalize(direction)
+            room = self._exits.get(normalized) if normalized is not None else None
         else:
-            return None
+            # saisie connue du jeu du store -> code en une recherche
+            frozen = store.directions
+            code = None
+            if directions is None or directions is frozen:
+                code = frozen._input_codes.get(direction)
+            if code is None:
+                code = frozen._codes.get((directions or frozen).normalize(direction))
+            room = store.exit(self._exits, code)
+        # Salle d'un étage pas encore construit (regions.py) : on le charge
+        if room is not None and room.region is not None:
+            room.region.ensure_loaded()
+        return room
     
+    # ------------------------------------------------------------------
+    # Textes affichés, en cache
+    # ------------------------------------------------------------------
+
+    def _cached(self, kind, version):
+        render = self._render
+        if render is not None:
+            entry = render.get(kind)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+        return None
+
+    def _store_render(self, kind, version, text):
+        if self._render is None:
+            self._render = {}
+        self._render[kind] = (version, text)
+        return text
+
+    def _exits_version(self):
+        # sorties gelées (RoomStore) : immuables, une écriture les dégèle
+        return self._exits.version if self._store is None else -1
+
     # Return a string describing the room's exits.
     def get_exit_string(self):
-        exit_string = "Sorties: " 
-        for exit in self.exits.keys():
-            if self.exits.get(exit) is not None:
-                exit_string += exit + ", "
-        exit_string = exit_string.strip(", ")
-        return exit_string
+        version = self._exits_version()
+        text = self._cached("exits", version)
+        if text is None:
+            names = [exit for exit, room in self.exits.items() if room is not None]
+            text = self._store_render("exits", version, ("Sorties: " + ", ".join(names)).strip(", "))
+        return text
 
     # Return a long description of this room including exits.
     def get_long_description(self):
-        return f"\nVous êtes {self.description}\n\n{self.get_exit_string()}\n"
+        key = (self._exits_version(), self.description)
+        text = self._cached("long", key)
+        if text is None:
+            text = self._store_render("long", key, f"\nVous êtes {self.description}\n\n{self.get_exit_string()}\n")
+        return text
     
     def get_inventory(self):
         """
@@ -126,10 +348,46 @@ class Room:
               "La pièce contient :"
                  - nom : description (x kg)
         """
-        if not self.inventory:
+        inventory = self._inventory
+        if not inventory:
             return "\nIl n'y a rien ici.\n"
 
-        s = "\nLa pièce contient :\n"
-        for item in self.inventory.values():
-            s += f"    - {item}\n"
-        return s
+        text = self._cached("inventory", inventory.version)
+        if text is None:
+            lines = "".join(f"    - {item}\n" for item in inventory.values())
+            text = self._store_render("inventory", inventory.version, "\nLa pièce contient :\n" + lines)
+        return text
+
+    def get_characters_description(self):
+        """
+        Personnages puis monstres présents, tels qu'affichés par look
+        ("" si la salle est vide).
+        """
+        characters = self._characters
+        if not characters:
+            return ""
+
+        text = self._cached("characters", characters.version)
+        if text is None:
+            pnjs = []
+            monstres = []
+            for c in characters.values():
+                if getattr(c, "is_monster", False):
+                    monstres.append(f"    - {c.name} : {c.description}\n")
+                else:
+                    pnjs.append(f"    - {c}\n")
+            text = ""
+            if pnjs:
+                text += "\nPersonnages présents :\n" + "".join(pnjs) + "\n"
+            if monstres:
+                text += "\nMonstres présents :\n" + "".join(monstres) + "\n"
+            text = self._store_render("characters", characters.version, text)
+        return text
+
+
+def _allocated(mapping):
+    """dict à garder dans la salle, ou None s'il est vide."""
+    if not mapping:
+        return None
+    return mapping if type(mapping) is VersionedDict else VersionedDict(mapping)
+
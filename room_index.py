@@ -0,0 +1,346 @@
+# room_index.py
+# Description: index des salles par nom, tenu à jour à chaque ajout/retrait.
+#
+#  - recherche exacte en O(1) sur le nom normalisé (minuscules, "-" -> "_"),
+#    identique à l'ancien parcours de Game.get_room_by_name ;
+#  - résolution tolérante aux fautes : forme compacte sans "_" ni espace
+#    ("salle_donjon1" -> "salle_donjon_1"), préfixe unique, puis trigrammes
+#    départagés par difflib.
+
+import bisect
+import difflib
+from collections import Counter
+
+
+def normalize_name(name):
+    """Clé exacte : même normalisation que Game.get_room_by_name."""
+    return name.lower().replace("-", "_")
+
+
+def compact_name(name):
+    """Clé tolérante : sans séparateurs (salle_donjon_1 == salledonjon1 == "salle donjon 1")."""
+    return name.lower().replace("-", "").replace("_", "").replace(" ", "")
+
+
+def trigrams(key):
+    padded = f"^{key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Associe des noms à des valeurs (salles, index de salles...).
+
+    get(name)      -> valeur du nom normalisé exact, ou None
+    resolve(name)  -> exact, puis compact, puis préfixe unique, puis
+                      plus proche voisin (ratio difflib >= cutoff)
+    suggest(name)  -> noms les plus proches, pour les messages d'erreur
+
+    En cas de doublon, le premier nom ajouté l'emporte (comme l'ancien
+    parcours linéaire de game.rooms).
+    """
+
+    # Nombre max d'entrées de listes de trigrammes parcourues par requête
+    # floue : les trigrammes les plus rares sont lus en premier.
+    SCAN_BUDGET = 3000
+    CANDIDATES = 16
+
+    def __init__(self):
+        self._exact = {}
+        self._compact = {}
+        # nom compact -> [premier nom ajouté, nombre de valeurs]
+        self._names = {}
+        # trigrammes : slot -> clé compacte (None si retirée)
+        self._slots = []
+        self._slot_of = {}
+        self._grams = {}
+        self._dead = 0
+        # clés compactes triées pour la recherche par préfixe (reconstruite à la demande)
+        self._sorted = None
+
+    def __len__(self):
+        return len(self._exact)
+
+    # ------------------------------------------------------------------
+    # Mise à jour
+    # ------------------------------------------------------------------
+
+    def add(self, name, value):
+        _push(self._exact, normalize_name(name), value)
+        key = compact_name(name)
+        _push(self._compact, key, value)
+        entry = self._names.get(key)
+        if entry is None:
+            self._names[key] = [name, 1]
+            self._add_slot(key)
+            self._sorted = None
+        else:
+            entry[1] += 1
+
+    def discard(self, name, value):
+        if not _pop(self._exact, normalize_name(name), value):
+            return
+        key = compact_name(name)
+        _pop(self._compact, key, value)
+        entry = self._names[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._names[key]
+            self._slots[self._slot_of.pop(key)] = None
+            self._dead += 1
+            self._sorted = None
+            if self._dead > 1024 and self._dead * 2 > len(self._slots):
+                self._rebuild_grams()
+
+    def clear(self):
+        self.__init__()
+
+    def _add_slot(self, key):
+        slot = len(self._slots)
+        self._slots.append(key)
+        self._slot_of[key] = slot
+        grams = self._grams
+        for g in trigrams(key):
+            postings = grams.get(g)
+            if postings is None:
+                grams[g] = [slot]
+            else:
+                postings.append(slot)
+
+    def _rebuild_grams(self):
+        keys = [k for k in self._slots if k is not None]
+        self._slots = []
+        self._slot_of = {}
+        self._grams = {}
+        self._dead = 0
+        for key in keys:
+            self._add_slot(key)
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+
+    def get(self, name):
+        return _first(self._exact.get(normalize_name(name)))
+
+    def resolve(self, name, cutoff=0.6):
+        value = self.get(name)
+        if value is not None:
+            return value
+        key = compact_name(name)
+        if not key:
+            return None
+        value = _first(self._compact.get(key))
+        if value is not None:
+            return value
+
+        matches = self.prefix_matches(key, limit=2)
+        if len(matches) == 1:
+            return _first(self._compact[matches[0]])
+
+        best = self._closest(key, 1, cutoff)
+        return _first(self._compact[best[0]]) if best else None
+
+    def suggest(self, name, n=3, cutoff=0.5):
+        """Noms (tels qu'ajoutés) les plus proches de name."""
+        key = compact_name(name)
+        if not key:
+            return []
+        return [self._names[k][0] for k in self._closest(key, n, cutoff)]
+
+    def prefix_matches(self, key, limit=None):
+        """Clés compactes commençant par key (ordre alphabétique)."""
+        if self._sorted is None:
+            self._sorted = sorted(self._names)
+        keys = self._sorted
+        out = []
+        i = bisect.bisect_left(keys, key)
+        while i < len(keys) and keys[i].startswith(key):
+            out.append(keys[i])
+            if limit is not None and len(out) >= limit:
+                break
+            i += 1
+        return out
+
+    def _closest(self, key, n, cutoff):
+        grams = self._grams
+        postings = sorted(
+            (grams[g] for g in trigrams(key) if g in grams),
+            key=len,
+        )
+        counts = Counter()
+        scanned = 0
+        for i, plist in enumerate(postings):
+            # Une faute de frappe détruit au plus 3 trigrammes : la bonne salle
+            # figure forcément dans l'une des 4 listes les plus rares.
+            if i >= 4 and scanned + len(plist) > self.SCAN_BUDGET:
+                break
+            scanned += len(plist)
+            counts.update(plist)
+
+        # Classement fin des meilleurs candidats : recouvrement exact des
+        # trigrammes (opérations d'ensembles en C), puis difflib sur les
+        # quelques premiers seulement.
+        slots = self._slots
+        qgrams = trigrams(key)
+        ranked = []
+        for slot, _ in counts.most_common(self.CANDIDATES):
+            candidate = slots[slot]
+            if candidate is None:
+                continue
+            cgrams = trigrams(candidate)
+            dice = 2 * len(qgrams & cgrams) / (len(qgrams) + len(cgrams))
+            ranked.append((dice, candidate))
+        ranked.sort(key=lambda s: (-s[0], s[1]))
+
+        scored = []
+        matcher = difflib.SequenceMatcher(None, "", key)
+        for _, candidate in ranked[:max(n, 3)]:
+            matcher.set_seq1(candidate)
+            ratio = matcher.ratio()
+            if ratio >= cutoff:
+                scored.append((ratio, candidate))
+        scored.sort(key=lambda s: (-s[0], s[1]))
+        return [candidate for _, candidate in scored[:n]]
+
+
+# Valeurs d'un dict d'index : la valeur seule, ou une liste s'il y a des doublons
+def _push(index, key, value):
+    current = index.get(key)
+    if current is None:
+        index[key] = value
+    elif type(current) is _Dups:
+        current.append(value)
+    else:
+        index[key] = _Dups((current, value))
+
+
+def _pop(index, key, value):
+    current = index.get(key)
+    if current is None:
+        return False
+    if type(current) is _Dups:
+        if value not in current:
+            return False
+        current.remove(value)
+        if len(current) == 1:
+            index[key] = current[0]
+        return True
+    if current is value:
+        del index[key]
+        return True
+    return False
+
+
+def _first(value):
+    return value[0] if type(value) is _Dups else value
+
+
+class _Dups(list):
+    """Plusieurs valeurs pour une même clé (noms de salles en double)."""
+
+
+class RoomRegistry(list):
+    """
+    Liste des salles d'un Game (game.rooms) avec son index de noms.
+
+    Se manipule comme une liste ; chaque ajout ou retrait met l'index à
+    jour. L'index n'est construit qu'à la première recherche (une session
+    qui ne cherche jamais de salle par nom ne le paie pas). Les salles ne
+    doivent pas être renommées une fois enregistrées.
+    """
+
+    _names = None
+
+    def __init__(self, rooms=()):
+        super().__init__(rooms)
+        self._names = None
+
+    def __getstate__(self):
+        # l'index est reconstruit à la demande après dépickling
+        return {"_names": None}
+
+    @property
+    def names(self):
+        if self._names is None:
+            self._names = NameIndex()
+            self._added(self)
+        return self._names
+
+    # --- recherche -----------------------------------------------------
+
+    def get(self, name):
+        return self.names.get(name)
+
+    def resolve(self, name, cutoff=0.6):
+        return self.names.resolve(name, cutoff)
+
+    def suggest(self, name, n=3):
+        return self.names.suggest(name, n)
+
+    # --- mutations suivies ---------------------------------------------
+
+    def _added(self, rooms):
+        add = self._names.add
+        for room in rooms:
+            add(room.name, room)
+
+    def _removed(self, rooms):
+        discard = self._names.discard
+        for room in rooms:
+            discard(room.name, room)
+
+    def append(self, room):
+        super().append(room)
+        if self._names is not None:
+            self._names.add(room.name, room)
+
+    def extend(self, rooms):
+        rooms = list(rooms)
+        super().extend(rooms)
+        if self._names is not None:
+            self._added(rooms)
+
+    def __iadd__(self, rooms):
+        self.extend(rooms)
+        return self
+
+    def insert(self, index, room):
+        super().insert(index, room)
+        if self._names is not None:
+            self._names.add(room.name, room)
+
+    def remove(self, room):
+        super().remove(room)
+        if self._names is not None:
+            self._removed([room])
+
+    def pop(self, index=-1):
+        room = super().pop(index)
+        if self._names is not None:
+            self._removed([room])
+        return room
+
+    def clear(self):
+        super().clear()
+        self._names = None
+
+    def __setitem__(self, index, value):
+        old = self[index]
+        if isinstance(index, slice):
+            value = list(value)
+        super().__setitem__(index, value)
+        if self._names is None:
+            return
+        if isinstance(index, slice):
+            self._removed(old)
+            self._added(value)
+        else:
+            self._removed([old])
+            self._names.add(value.name, value)
+
+    def __delitem__(self, index):
+        old = self[index]
+        super().__delitem__(index)
+        if self._names is not None:
+            self._removed(old if isinstance(index, slice) else [old])
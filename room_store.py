@@ -0,0 +1,81 @@
+# room_store.py
+# Description: sorties des salles en tableaux compacts (format CSR).
+#
+# Pour les grands mondes générés, un dict de sorties par salle coûte plus
+# cher que la salle elle-même. RoomStore gèle les sorties d'une liste de
+# salles dans trois tableaux :
+#   offsets[i] .. offsets[i + 1]  -> plage des sorties de la salle i
+#   codes[k]                      -> code de direction (store.directions.code)
+#   targets[k]                    -> index de la salle cible (-1 : None)
+# Chaque salle ne garde que son numéro de ligne ; room.exits reste lisible
+# comme un dict, et une écriture rend à la salle un dict ordinaire.
+# Les codes sont ceux du jeu de directions du monde (directions.py),
+# complété si besoin par les noms de sortie rencontrés.
+#
+# Exemple :
+#   store = RoomStore(rooms)   # gèle les sorties et compacte les salles
+#   rooms[0].get_exit("n")     # lecture dans les tableaux
+
+from array import array
+
+from directions import DEFAULT_DIRECTIONS
+
+
+class RoomStore:
+    """Sorties gelées d'une liste de salles (voir l'en-tête du module)."""
+
+    def __init__(self, rooms, directions=DEFAULT_DIRECTIONS):
+        # salles gelées d'abord, puis cibles extérieures à la liste
+        self.rooms = list(rooms)
+        self.frozen = len(self.rooms)
+        self.directions = directions = directions.including(
+            d for room in self.rooms for d in room.exits
+        )
+        index = {id(room): i for i, room in enumerate(self.rooms)}
+
+        self.offsets = array("i", [0])
+        self.codes = array("H")
+        self.targets = array("i")
+        for room in self.rooms[:self.frozen]:
+            for direction, target in room.exits.items():
+                self.codes.append(directions.code(direction))
+                if target is None:
+                    self.targets.append(-1)
+                    continue
+                i = index.get(id(target))
+                if i is None:
+                    i = index[id(target)] = len(self.rooms)
+                    self.rooms.append(target)
+                self.targets.append(i)
+            self.offsets.append(len(self.codes))
+
+        for row, room in enumerate(self.rooms[:self.frozen]):
+            room._exits = row
+            room._store = self
+            room.compact()
+
+    def find(self, row, code):
+        """Position de la sortie code de la ligne row, ou -1."""
+        offsets = self.offsets
+        try:
+            return self.codes.index(code, offsets[row], offsets[row + 1])
+        except ValueError:
+            return -1
+
+    def exit(self, row, code):
+        """Salle dans la direction code (None si absente)."""
+        if code is None:
+            return None
+        offsets = self.offsets
+        try:
+            target = self.targets[self.codes.index(code, offsets[row], offsets[row + 1])]
+        except ValueError:
+            return None
+        return self.rooms[target] if target >= 0 else None
+
+    def codes_of(self, row):
+        return self.codes[self.offsets[row]:self.offsets[row + 1]]
+
+    def nbytes(self):
+        """Taille des trois tableaux, en octets."""
+        return sum(len(a) * a.itemsize for a in (self.offsets, self.codes, self.targets))
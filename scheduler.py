@@ -0,0 +1,145 @@
+# scheduler.py
+# Description: déplacements des PNJ planifiés par tour de jeu.
+#
+# Avant, chaque déplacement réussi du joueur passait en revue tous les
+# personnages de game.characters (pile ou face, puis liste des sorties),
+# y compris ceux qui ne bougent jamais. Le Scheduler range les PNJ mobiles
+# dans des paniers indexés par tour : à chaque tour, seul le panier du tour
+# courant est réveillé, et chaque PNJ réveillé est replanifié par sa
+# politique de déplacement (character.policy, RandomWalk par défaut).
+#
+# RandomWalk(chance) tire directement le nombre de tours avant le prochain
+# pas (loi géométrique) : même loi que le pile ou face à chaque tour, en un
+# seul tirage par déplacement.
+#
+# Exemple :
+#   garde.policy = Patrol(["village", "magasin_village"], period=3)
+#   moved = game.get_scheduler().tick(game.characters, game.locations)
+
+import math
+
+import rng
+
+
+class RandomWalk:
+    """À chaque tour, probabilité chance de prendre une sortie au hasard."""
+
+    def __init__(self, chance=0.5):
+        self.chance = chance
+
+    def delay(self, character, r):
+        """Nombre de tours (>= 1) avant le prochain pas."""
+        if self.chance >= 1:
+            return 1
+        return 1 + int(math.log(1.0 - r.random()) / math.log(1.0 - self.chance))
+
+    def act(self, character, r, locations=None):
+        return character.wander(r, locations)
+
+
+class Patrol:
+    """Ronde : va de salle en salle (noms, salles voisines) tous les period tours."""
+
+    def __init__(self, rooms, period=1):
+        self.rooms = list(rooms)
+        self.period = period
+
+    def delay(self, character, r):
+        return self.period
+
+    def act(self, character, r, locations=None):
+        here = character.current_room.name
+        i = self.rooms.index(here) if here in self.rooms else -1
+        target = self.rooms[(i + 1) % len(self.rooms)]
+        for room in character.current_room.exits.values():
+            if room is not None and room.name == target:
+                character.relocate(room, locations)
+                return True
+        return False
+
+
+DEFAULT_POLICY = RandomWalk()
+
+
+class Scheduler:
+    """Paniers de PNJ par tour de réveil (voir l'en-tête du module)."""
+
+    def __init__(self):
+        self.now = 0
+        # tour -> [personnages] ; due : personnage -> tour prévu (None : immobile)
+        self.buckets = {}
+        self.due = {}
+        # liste game.characters déjà prise en compte, et sa taille
+        self._source = None
+        self._size = -1
+
+    def __len__(self):
+        return len(self.due)
+
+    # ------------------------------------------------------------------
+    # Acteurs
+    # ------------------------------------------------------------------
+
+    def sync(self, characters):
+        """Aligne les acteurs sur game.characters (liste remplacée ou agrandie)."""
+        if characters is self._source and len(characters) == self._size:
+            return
+        present = dict.fromkeys(characters)
+        for character in [c for c in self.due if c not in present]:
+            self.remove(character)
+        for character in present:
+            if character not in self.due:
+                self.add(character)
+        self._source = characters
+        self._size = len(characters)
+
+    def add(self, character):
+        if not character.movable:
+            self.due[character] = None
+            return
+        self._schedule(character, _policy(character), rng.current())
+
+    def remove(self, character):
+        # l'entrée du panier est ignorée au réveil
+        self.due.pop(character, None)
+
+    def reschedule(self, character):
+        """À appeler après un changement de politique ou de mobilité."""
+        self.remove(character)
+        self.add(character)
+
+    def _schedule(self, character, policy, r):
+        tick = self.now + policy.delay(character, r)
+        self.due[character] = tick
+        bucket = self.buckets.get(tick)
+        if bucket is None:
+            self.buckets[tick] = [character]
+        else:
+            bucket.append(character)
+
+    # ------------------------------------------------------------------
+    # Tour de jeu
+    # ------------------------------------------------------------------
+
+    def tick(self, characters, locations=None):
+        """Avance d'un tour ; retourne les personnages qui ont bougé."""
+        self.sync(characters)
+        self.now += 1
+        bucket = self.buckets.pop(self.now, None)
+        if not bucket:
+            return []
+        r = rng.current()
+        moved = []
+        due = self.due
+        for character in bucket:
+            if due.get(character) != self.now:
+                continue
+            policy = _policy(character)
+            if policy.act(character, r, locations):
+                moved.append(character)
+            self._schedule(character, policy, r)
+        return moved
+
+
+def _policy(character):
+    return character.policy or DEFAULT_POLICY
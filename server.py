@@ -0,0 +1,274 @@
+# server.py
+# Description: serveur TCP asyncio (protocole ligne par ligne) hébergeant de
+# nombreuses sessions Game dans un seul processus.
+#
+# Protocole :
+#   - le serveur demande un nom, la première ligne reçue est le nom du joueur ;
+#   - chaque ligne suivante est une commande (Game.process_command) ;
+#   - chaque réponse se termine par l'invite PROMPT ("\n> ").
+#
+# Les Game vivent dans un "backend" : LocalBackend (dans ce processus) ou
+# sharding.ShardedBackend (répartis entre plusieurs processus).
+#
+# Usage : python server.py [--host 127.0.0.1] [--port 4000] [--idle 300] [--workers N]
+#   puis par exemple : nc 127.0.0.1 4000
+
+import argparse
+import asyncio
+import time
+
+from output import OutputSink
+
+PROMPT = "\n> "
+BANNER = "Bienvenue sur TBA !\nEntrez votre nom :" + PROMPT
+
+
+def lazy_world(player_name):
+    """Monde par défaut : content pack + étages construits à la demande (peu de mémoire par session)."""
+    from content_pack import load_pack
+    from regions import build_lazy_game
+    return build_lazy_game(load_pack(), player_name, unload_after=200)
+
+
+def open_game(games, world_factory, session_id, player_name):
+    """Crée le Game d'une session dans games ; retourne le texte d'accueil."""
+    game = world_factory(player_name)
+    game.output = sink = OutputSink()
+    games[session_id] = game
+    with game.session_output():
+        game.print_welcome()
+    return sink.drain()[0]
+
+
+def play_command(games, session_id, line):
+    """Joue une ligne dans le Game de la session ; retourne (texte, partie terminée)."""
+    game = games[session_id]
+    result = game.process_command(line)
+    with game.session_output():
+        game.check_game_over()
+    return result.text + game.output.drain()[0], game.finished
+
+
+class LocalBackend:
+    """Les Game de toutes les sessions, dans le processus du serveur."""
+
+    def __init__(self, world_factory=lazy_world):
+        self.world_factory = world_factory
+        self.games = {}
+
+    async def start(self):
+        pass
+
+    async def open(self, session_id, player_name):
+        return open_game(self.games, self.world_factory, session_id, player_name)
+
+    async def command(self, session_id, line):
+        return play_command(self.games, session_id, line)
+
+    async def close(self, session_id):
+        self.games.pop(session_id, None)
+
+    async def shutdown(self):
+        self.games.clear()
+
+
+class ServerStats:
+    def __init__(self):
+        self.sessions = 0
+        self.active = 0
+        self.commands = 0
+        self.idle_timeouts = 0
+        self.slow_readers = 0
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+class Session:
+    """
+    Une connexion : son Game, et une file de sortie bornée vidée par une
+    tâche d'écriture. Si le client ne lit plus, writer.drain() bloque, la
+    file se remplit et la lecture de ses commandes s'arrête (backpressure).
+    """
+
+    def __init__(self, server, session_id, reader, writer):
+        self.server = server
+        self.id = session_id
+        self.reader = reader
+        self.writer = writer
+        self.opened = False
+        self.queue = asyncio.Queue(maxsize=server.max_pending)
+        self.closed = False
+        self.idle = False
+
+    async def send(self, text):
+        if not self.closed:
+            await self.queue.put(text.encode("utf-8"))
+
+    async def writer_loop(self):
+        writer = self.writer
+        try:
+            while True:
+                data = await self.queue.get()
+                if data is None:
+                    break
+                writer.write(data)
+                if writer.transport.get_write_buffer_size():
+                    # le noyau n'a pas tout pris : on attend, mais pas indéfiniment
+                    try:
+                        await asyncio.wait_for(writer.drain(), self.server.slow_reader_timeout)
+                    except asyncio.TimeoutError:
+                        # client qui ne lit plus : on coupe plutôt que de bufferiser sans fin
+                        self.server.stats.slow_readers += 1
+                        break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.closed = True
+            writer.close()
+            # débloque un send() en attente : la boucle de lecture verra closed
+            while not self.queue.empty():
+                self.queue.get_nowait()
+
+    def _idle(self):
+        # réveille readline() comme une fin de connexion
+        self.idle = True
+        self.reader.feed_eof()
+
+    async def readline(self):
+        """Ligne suivante (None : fin, inactivité ou ligne trop longue)."""
+        # Un simple minuteur par attente (pas de wait_for, qui crée une
+        # tâche à chaque ligne).
+        timer = asyncio.get_running_loop().call_later(self.server.idle_timeout, self._idle)
+        try:
+            line = await self.reader.readline()
+        except (ValueError, ConnectionError):
+            return None
+        finally:
+            timer.cancel()
+        if self.idle:
+            self.server.stats.idle_timeouts += 1
+            await self.send("\nDéconnexion pour inactivité.\n")
+            return None
+        if not line or self.closed:
+            return None
+        return line.decode("utf-8", "replace").strip()
+
+    async def run(self):
+        server = self.server
+        backend = server.backend
+        await self.send(BANNER)
+        name = await self.readline()
+        if name is None:
+            return
+        welcome = await backend.open(self.id, name or "Hero")
+        self.opened = True
+        await self.send(welcome + PROMPT)
+
+        finished = False
+        while not finished:
+            line = await self.readline()
+            if line is None:
+                break
+            text, finished = await backend.command(self.id, line)
+            server.stats.commands += 1
+            await self.send(text + ("" if finished else PROMPT))
+
+
+class GameServer:
+    """
+    Serveur multi-sessions : un Game indépendant par connexion, joué par
+    le backend (par défaut LocalBackend : tous dans la même boucle asyncio,
+    aucune écriture sur sys.stdout).
+    """
+
+    def __init__(self, host="127.0.0.1", port=4000, world_factory=lazy_world,
+                 idle_timeout=300.0, max_pending=32, slow_reader_timeout=30.0, backend=None):
+        self.host = host
+        self.port = port
+        self.backend = backend if backend is not None else LocalBackend(world_factory)
+        self.idle_timeout = idle_timeout
+        self.max_pending = max_pending
+        self.slow_reader_timeout = slow_reader_timeout
+        self.stats = ServerStats()
+        self.sessions = set()
+        self._next_id = 0
+        self._server = None
+
+    async def start(self):
+        await self.backend.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=4096)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.backend.shutdown()
+
+    async def _handle(self, reader, writer):
+        self._next_id += 1
+        session = Session(self, self._next_id, reader, writer)
+        self.sessions.add(session)
+        self.stats.sessions += 1
+        self.stats.active += 1
+        writer_task = asyncio.create_task(session.writer_loop())
+        try:
+            await session.run()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.sessions.discard(session)
+            self.stats.active -= 1
+            if session.opened:
+                await self.backend.close(session.id)
+            if not session.closed:
+                try:
+                    # laisse partir la fin de la sortie, sauf si la file est pleine
+                    session.queue.put_nowait(None)
+                except asyncio.QueueFull:
+                    writer_task.cancel()
+                    writer.close()
+            await asyncio.gather(writer_task, return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur TCP multi-sessions pour TBA")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--idle", type=float, default=300.0, help="déconnexion après N secondes sans commande")
+    parser.add_argument("--workers", type=int, default=0, help="répartir les sessions sur N processus (0 : aucun)")
+    args = parser.parse_args()
+
+    backend = None
+    if args.workers:
+        from sharding import ShardedBackend
+        backend = ShardedBackend(args.workers)
+    server = GameServer(args.host, args.port, idle_timeout=args.idle, backend=backend)
+
+    async def run():
+        await server.start()
+        print(f"Serveur TBA sur {server.host}:{server.port}", flush=True)
+        started = time.monotonic()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.backend.shutdown()
+            print(f"Arrêt après {time.monotonic() - started:.0f} s : {server.stats.as_dict()}")
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
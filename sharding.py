@@ -0,0 +1,275 @@
+# sharding.py
+# Description: sessions réparties entre plusieurs processus (un par cœur).
+#
+# Les commandes (actions.py, combats...) sont du Python pur, limité par le
+# GIL : un seul processus n'utilise qu'un cœur. ShardedBackend garde le
+# front asyncio (server.py) dans le processus principal et confie les Game
+# à N processus workers :
+#   - chaque session est affectée à un worker par hachage de son id ;
+#   - requêtes : multiprocessing.Queue (envoi non bloquant pour la boucle
+#     asyncio) ; réponses : un Pipe par worker, surveillé par add_reader ;
+#   - les requêtes d'un même tour de boucle partent en un seul lot ;
+#   - migrate() déplace une session (Game picklé) vers un autre worker,
+#     rebalance() égalise le nombre de sessions par worker.
+#
+# Usage : python server.py --workers 4
+#   ou   GameServer(backend=ShardedBackend(4))
+
+import asyncio
+import itertools
+import multiprocessing
+import pickle
+import queue
+import zlib
+
+from server import lazy_world, open_game, play_command
+
+
+class ShardError(Exception):
+    """Une requête a échoué dans un worker (ou le worker s'est arrêté)."""
+
+
+def shard_of(session_id, n):
+    """Worker d'une session par défaut (hachage stable d'un processus à l'autre)."""
+    return zlib.crc32(str(session_id).encode()) % n
+
+
+# =========================================================
+# WORKER
+# =========================================================
+
+def _handle(games, world_factory, op, session_id, arg):
+    if op == "command":
+        return play_command(games, session_id, arg)
+    if op == "open":
+        return open_game(games, world_factory, session_id, arg)
+    if op == "close":
+        games.pop(session_id, None)
+        return None
+    if op == "export":
+        return pickle.dumps(games.pop(session_id), pickle.HIGHEST_PROTOCOL)
+    if op == "import":
+        games[session_id] = pickle.loads(arg)
+        return None
+    if op == "count":
+        return len(games)
+    raise ShardError(f"Requête inconnue : {op}")
+
+
+def _worker_main(requests, replies, world_factory):
+    """Boucle d'un worker : possède les Game de ses sessions."""
+    games = {}
+    while True:
+        batch = requests.get()
+        # regroupe les lots déjà arrivés : une seule réponse pour tous
+        try:
+            while True:
+                batch.extend(requests.get_nowait())
+        except queue.Empty:
+            pass
+
+        out = []
+        stop = False
+        for rid, op, session_id, arg in batch:
+            if op == "stop":
+                stop = True
+                out.append((rid, True, None))
+                continue
+            try:
+                out.append((rid, True, _handle(games, world_factory, op, session_id, arg)))
+            except Exception as e:
+                out.append((rid, False, f"{type(e).__name__}: {e}"))
+        replies.send(out)
+        if stop:
+            replies.close()
+            return
+
+
+# =========================================================
+# FRONT
+# =========================================================
+
+_request_ids = itertools.count()
+
+
+class Shard:
+    """Un worker vu du front : sa file de requêtes, son pipe de réponses, ses sessions."""
+
+    def __init__(self, index, world_factory, ctx, loop):
+        self.index = index
+        self.loop = loop
+        self.requests = ctx.Queue()
+        self.replies, send_end = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(
+            target=_worker_main, args=(self.requests, send_end, world_factory),
+            name=f"tba-shard-{index}", daemon=True,
+        )
+        self.process.start()
+        send_end.close()
+        self.sessions = set()
+        self.pending = {}
+        self.outbox = []
+        self.alive = True
+        loop.add_reader(self.replies.fileno(), self._on_readable)
+
+    def request(self, op, session_id=None, arg=None):
+        """Future du résultat ; la requête part avec le lot du tour de boucle."""
+        if not self.alive:
+            raise ShardError(f"Worker {self.index} arrêté")
+        rid = next(_request_ids)
+        future = self.loop.create_future()
+        self.pending[rid] = future
+        if not self.outbox:
+            self.loop.call_soon(self._flush)
+        self.outbox.append((rid, op, session_id, arg))
+        return future
+
+    def _flush(self):
+        batch, self.outbox = self.outbox, []
+        if batch:
+            self.requests.put(batch)
+
+    def _on_readable(self):
+        try:
+            while self.replies.poll():
+                for rid, ok, result in self.replies.recv():
+                    future = self.pending.pop(rid)
+                    if future.done():
+                        continue
+                    if ok:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(ShardError(result))
+        except (EOFError, OSError):
+            self._dead()
+
+    def _dead(self):
+        self.alive = False
+        self.loop.remove_reader(self.replies.fileno())
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ShardError(f"Worker {self.index} arrêté"))
+        self.pending.clear()
+
+    async def stop(self, timeout=5.0):
+        if self.alive:
+            try:
+                await asyncio.wait_for(self.request("stop"), timeout)
+            except (ShardError, asyncio.TimeoutError):
+                pass
+            if self.alive:
+                self._dead()
+        await self.loop.run_in_executor(None, self.process.join, timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.replies.close()
+        self.requests.close()
+
+
+class ShardedBackend:
+    """
+    Backend de GameServer : les Game vivent dans `workers` processus.
+
+    world_factory doit être picklable (fonction de module) : elle est
+    appelée dans les workers.
+    """
+
+    def __init__(self, workers, world_factory=lazy_world, mp_context=None):
+        self.workers = workers
+        self.world_factory = world_factory
+        self.ctx = mp_context or multiprocessing.get_context()
+        self.shards = []
+        # sessions déplacées par migrate() : session_id -> index du worker
+        self.placement = {}
+        self._migrating = {}
+        self.migrations = 0
+
+    async def start(self):
+        if self.shards:
+            return
+        loop = asyncio.get_running_loop()
+        self.shards = [Shard(i, self.world_factory, self.ctx, loop) for i in range(self.workers)]
+
+    def shard(self, session_id):
+        index = self.placement.get(session_id)
+        if index is None:
+            index = shard_of(session_id, len(self.shards))
+        return self.shards[index]
+
+    # --- interface backend (voir server.LocalBackend) --------------------
+
+    async def open(self, session_id, player_name):
+        shard = self.shard(session_id)
+        shard.sessions.add(session_id)
+        return await shard.request("open", session_id, player_name)
+
+    async def command(self, session_id, line):
+        migrating = self._migrating.get(session_id)
+        if migrating is not None:
+            await migrating
+        return await self.shard(session_id).request("command", session_id, line)
+
+    async def close(self, session_id):
+        migrating = self._migrating.get(session_id)
+        if migrating is not None:
+            await migrating
+        shard = self.shard(session_id)
+        shard.sessions.discard(session_id)
+        self.placement.pop(session_id, None)
+        if shard.alive:
+            await shard.request("close", session_id)
+
+    async def shutdown(self):
+        shards, self.shards = self.shards, []
+        await asyncio.gather(*(shard.stop() for shard in shards))
+
+    # --- répartition -----------------------------------------------------
+
+    async def migrate(self, session_id, target):
+        """
+        Déplace la session vers le worker target. Les commandes de la
+        session envoyées pendant la migration attendent sa fin. Retourne
+        False si la session y est déjà.
+        """
+        source = self.shard(session_id)
+        destination = self.shards[target]
+        if source is destination:
+            return False
+        done = asyncio.get_running_loop().create_future()
+        self._migrating[session_id] = done
+        try:
+            # la file d'un worker est FIFO : l'export passe après la
+            # commande éventuellement en cours pour cette session
+            blob = await source.request("export", session_id)
+            try:
+                await destination.request("import", session_id, blob)
+            except ShardError:
+                await source.request("import", session_id, blob)
+                raise
+            source.sessions.discard(session_id)
+            destination.sessions.add(session_id)
+            if shard_of(session_id, len(self.shards)) == target:
+                self.placement.pop(session_id, None)
+            else:
+                self.placement[session_id] = target
+            self.migrations += 1
+        finally:
+            del self._migrating[session_id]
+            done.set_result(None)
+        return True
+
+    async def rebalance(self):
+        """Déplace des sessions du worker le plus chargé vers le moins chargé ; retourne leur nombre."""
+        moved = 0
+        while True:
+            busiest = max(self.shards, key=lambda s: len(s.sessions))
+            idlest = min(self.shards, key=lambda s: len(s.sessions))
+            if len(busiest.sessions) - len(idlest.sessions) <= 1:
+                return moved
+            session_id = next(s for s in busiest.sessions if s not in self._migrating)
+            await self.migrate(session_id, idlest.index)
+            moved += 1
+
+    async def counts(self):
+        """Nombre de Game par worker, vu des workers eux-mêmes."""
+        return await asyncio.gather(*(shard.request("count") for shard in self.shards))
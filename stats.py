@@ -0,0 +1,73 @@
+# stats.py
+# Description: somme incrémentale de vecteurs de stats (joueur).
+#
+# Chaque source (stats de base, un emplacement d'équipement, un buff) a son
+# vecteur (attack, magic, armor, hp) en cache. Changer une source met les
+# totaux à jour par différence, en O(1) : équiper une arme ne relit pas les
+# cinq autres emplacements. dirty signale que les totaux ont bougé depuis
+# la dernière publication sur le joueur (Player._apply_stats).
+#
+# Exemple :
+#   engine = StatEngine()
+#   engine.set("base", (10, 0, 0, 1000))
+#   engine.set("weapon", item_vector(sword))
+#   engine.totals       # [28, 0, 0, 1000]
+#   engine.remove("weapon")
+
+STATS = ("attack", "magic", "armor", "hp")
+ZERO = (0, 0, 0, 0)
+
+
+def item_vector(item):
+    """Vecteur de stats d'un objet équipé (ZERO pour un emplacement vide)."""
+    if item is None:
+        return ZERO
+    return (int(item.attack or 0), int(item.magic or 0), int(item.armor or 0), int(item.hp or 0))
+
+
+def stat_vector(stat, amount):
+    """Vecteur d'un bonus sur une seule stat ; ZERO si la stat n'est pas suivie (agilité...)."""
+    if stat not in STATS:
+        return ZERO
+    vector = [0, 0, 0, 0]
+    vector[STATS.index(stat)] = int(amount or 0)
+    return tuple(vector)
+
+
+class StatEngine:
+    """Vecteur de stats par source et totaux tenus à jour."""
+
+    def __init__(self):
+        # source -> vecteur (attack, magic, armor, hp), sources nulles absentes
+        self.sources = {}
+        self.totals = [0, 0, 0, 0]
+        self.dirty = False
+
+    def get(self, source):
+        return self.sources.get(source, ZERO)
+
+    def set(self, source, vector):
+        """Remplace le vecteur de source ; retourne True si les totaux ont changé."""
+        old = self.sources.get(source, ZERO)
+        if old == vector:
+            return False
+        if vector == ZERO:
+            del self.sources[source]
+        else:
+            self.sources[source] = vector
+        totals = self.totals
+        for i in range(4):
+            totals[i] += vector[i] - old[i]
+        self.dirty = True
+        return True
+
+    def remove(self, source):
+        return self.set(source, ZERO)
+
+    def recompute(self):
+        """Totaux recalculés depuis toutes les sources (contrôle)."""
+        totals = [0, 0, 0, 0]
+        for vector in self.sources.values():
+            for i in range(4):
+                totals[i] += vector[i]
+        return totals
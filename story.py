@@ -0,0 +1,69 @@
+# story.py
+# Description: déclencheurs du scénario, abonnés au bus d'événements (events.py).
+#
+# Escorte du marchand ambulant : il suit le joueur, s'arrête à l'avant-poste
+# de la capitale, puis disparaît quand le joueur entre dans la capitale.
+# (Auparavant câblé directement dans Actions.go.)
+
+from events import PlayerMoved
+from locations import CHARACTERS
+from output import emit
+
+
+def subscribe(bus):
+    bus.subscribe(PlayerMoved, escort_follows)
+    bus.subscribe(PlayerMoved, escort_ends, target="avant_post_capitale")
+    bus.subscribe(PlayerMoved, merchant_leaves, target="rue_capitale")
+
+
+def escort_follows(event):
+    """Le PNJ escorté suit le joueur dans sa nouvelle salle."""
+    game = event.player.game
+    npc = getattr(game, "following_npc", None)
+    if npc is None or getattr(game, "marchand_removed", False):
+        return
+    npc_key = getattr(npc, "name", "npc").lower()
+
+    old_room = getattr(npc, "current_room", None)
+    new_room = event.room
+
+    # retirer de l'ancienne salle
+    if old_room is not None and hasattr(old_room, "characters"):
+        old_room.characters.pop(npc_key, None)
+
+    # placer dans la nouvelle salle
+    npc.current_room = new_room
+    if hasattr(new_room, "characters"):
+        new_room.characters[npc_key] = npc
+        if game.locations is not None:
+            game.locations.move(CHARACTERS, npc_key, npc, old_room, new_room)
+
+
+def escort_ends(event):
+    """Arrivée à l'avant-poste : le marchand y reste, mais ne suit plus."""
+    game = event.player.game
+    if getattr(game, "following_npc", None) is None:
+        return
+
+    game.following_npc = None
+
+    emit("\n Le marchand ambulant : 'Merci ! À partir d'ici je suis en sécurité. Au revoir !'\n")
+
+    # flag pour dire qu'il est "posé" à l'avant-poste
+    game.marchand_waiting_at_avantpost = True
+
+
+def merchant_leaves(event):
+    """Entrée dans la capitale : le marchand quitte l'avant-poste pour de bon."""
+    game = event.player.game
+    if not getattr(game, "marchand_waiting_at_avantpost", False):
+        return
+
+    # on le retire de l'avant-poste (il ne doit plus apparaître ensuite)
+    try:
+        game.avant_post_capitale.characters.pop("marchand_ambulant", None)
+    except Exception:
+        pass
+
+    game.marchand_waiting_at_avantpost = False
+    game.marchand_removed = True
@@ -0,0 +1,85 @@
+# world_clock.py
+# Description: temps du monde (en tours) et file d'événements datés.
+#
+# Un tour passe à chaque déplacement réussi du joueur (Game.update_characters).
+# Les événements (réapparition d'un monstre, fin d'un effet, routine d'un
+# PNJ...) sont rangés dans un tas binaire par date : planifier ou réveiller
+# coûte O(log n), même avec des milliers de minuteurs en attente, et un tour
+# sans échéance ne coûte qu'une comparaison. Un minuteur annulé reste dans
+# le tas et est ignoré à son échéance ; le tas est compacté quand les
+# annulés deviennent majoritaires.
+#
+# Les actions doivent rester picklables (méthodes, fonctions de module) :
+# l'horloge voyage avec le Game (sharding, sauvegardes).
+#
+# Exemple :
+#   clock = game.clock
+#   timer = clock.schedule(10, game.get_respawner().respawn, room, "slime")
+#   clock.cancel(timer)
+
+import heapq
+
+
+class Timer(list):
+    """[date, numéro, action, args] ; action None : annulé."""
+
+    __slots__ = ()
+
+    @property
+    def due(self):
+        return self[0]
+
+    @property
+    def cancelled(self):
+        return self[2] is None
+
+
+class WorldClock:
+    """Horloge du monde : now (tours écoulés) et minuteurs en attente."""
+
+    def __init__(self):
+        self.now = 0
+        self.queue = []
+        # numéro d'ordre : deux minuteurs de même date partent dans l'ordre de planification
+        self._seq = 0
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self.queue) - self._cancelled
+
+    def schedule(self, delay, action, *args):
+        """Exécute action(*args) dans delay tours (>= 1) ; retourne le Timer."""
+        return self.schedule_at(self.now + max(1, int(delay)), action, *args)
+
+    def schedule_at(self, due, action, *args):
+        self._seq += 1
+        timer = Timer((due, self._seq, action, args))
+        heapq.heappush(self.queue, timer)
+        return timer
+
+    def cancel(self, timer):
+        if timer.cancelled:
+            return
+        timer[2] = None
+        timer[3] = ()
+        self._cancelled += 1
+        if self._cancelled > 64 and self._cancelled * 2 > len(self.queue):
+            self.queue = [t for t in self.queue if not t.cancelled]
+            heapq.heapify(self.queue)
+            self._cancelled = 0
+
+    def advance(self, turns=1):
+        """Avance de turns tours et exécute les minuteurs échus ; retourne leur nombre."""
+        self.now += turns
+        queue = self.queue
+        ran = 0
+        while queue and queue[0][0] <= self.now:
+            timer = heapq.heappop(queue)
+            action = timer[2]
+            if action is None:
+                self._cancelled -= 1
+                continue
+            timer[2] = None
+            action(*timer[3])
+            ran += 1
+        return ran
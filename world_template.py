@@ -0,0 +1,290 @@
+# world_template.py
+# Description: monde "modèle" construit une seule fois puis cloné pour chaque session.
+
+import types
+
+from room import Room
+from item import Item, ItemDefinition
+from character import Character
+from player import Player
+from quest import Quest
+from game import Game
+
+
+# Types dont chaque instance est un noeud du graphe du monde (clonée une fois)
+NODE_TYPES = (Game, Room, Item, Character, Quest)
+
+# Types immuables partagés tels quels
+_ATOMIC = (str, int, float, bool, type(None))
+
+# Autres valeurs partagées telles quelles : définitions d'objets (immuables,
+# internées), fonctions et classes ; tuple / frozenset s'ils ne contiennent
+# que des valeurs partagées
+_SHARED = (ItemDefinition, types.FunctionType, types.BuiltinFunctionType, type)
+
+# Codes des "recettes" de reconstruction d'une valeur
+_CONST, _NODE, _LIST, _DICT, _COPY_LIST, _COPY_DICT, _NODE_LIST, _NODE_DICT = range(8)
+
+
+class ClonePlan:
+    """
+    Plan de clonage précompilé pour un graphe Game/Room/Character/Item/Quest.
+
+    Le graphe du modèle est parcouru UNE fois : chaque objet du monde reçoit
+    un index, et chaque attribut est compilé en recette :
+    - valeur immuable -> partagée (copiée avec le dict de base),
+    - objet du monde   -> référence vers l'index du clone,
+    - list / dict      -> reconstruits : simple copie s'ils ne contiennent
+                          que des valeurs immuables, table d'index s'ils ne
+                          contiennent que des objets du monde (sorties,
+                          personnages, loot...), recette récursive sinon.
+
+    Les objets sans __dict__ (Room, __slots__) sont lus et reconstruits
+    via __getstate__ / __setstate__.
+
+    Toute autre valeur (objet mutable inconnu : index, compteur, bus...)
+    lève une TypeError : elle serait sinon partagée par toutes les
+    sessions. Elle doit être déclarée partagée (shared_attrs), ignorée
+    (skipped_attrs, recréée par la session) ou détachée (detached_attrs :
+    {classe: attributs} remis à None dans les clones, rattachés ensuite
+    par leur propriétaire).
+
+    build() alloue ensuite tous les clones d'un coup puis recâble les
+    références : les liens Room <-> Character <-> Item sont préservés, sans
+    mémo par id ni isinstance au moment du clonage, et sans récursion sur
+    le graphe des salles.
+    """
+
+    def __init__(self, root, shared_attrs=(), skipped_attrs=(), extra_roots=(), detached_attrs=None):
+        self.shared_attrs = set(shared_attrs)
+        self.skipped_attrs = set(skipped_attrs)
+        self.detached_attrs = dict(detached_attrs or {})
+        self.index = {}
+        self.nodes = []
+        self.classes = []
+        # True : état appliqué par __setstate__ (objet à __slots__)
+        self.slotted = []
+        self.bases = []
+        self.fixups = []
+
+        self._add_node(root)
+        for obj in extra_roots:
+            self._add_node(obj)
+        pos = 0
+        while pos < len(self.nodes):
+            self._compile_node(pos)
+            pos += 1
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _add_node(self, obj):
+        idx = self.index.get(id(obj))
+        if idx is None:
+            idx = len(self.nodes)
+            self.index[id(obj)] = idx
+            self.nodes.append(obj)
+        return idx
+
+    def _compile_node(self, pos):
+        obj = self.nodes[pos]
+        base = {}
+        fixups = []
+        root = pos == 0
+        slotted = not hasattr(obj, "__dict__")
+        state = obj.__getstate__() if slotted else vars(obj)
+        detached = self.detached_attrs.get(type(obj), ())
+        for attr, value in state.items():
+            if root and attr in self.skipped_attrs:
+                continue
+            if root and attr in self.shared_attrs:
+                base[attr] = value
+                continue
+            if attr in detached:
+                base[attr] = None
+                continue
+            try:
+                recipe = self._compile_value(value)
+            except TypeError as e:
+                raise TypeError(f"ClonePlan : {type(obj).__name__}.{attr} : {e}") from None
+            if recipe[0] == _CONST:
+                base[attr] = value
+            else:
+                fixups.append((attr, recipe))
+        self.classes.append(type(obj))
+        self.slotted.append(slotted)
+        self.bases.append(base)
+        self.fixups.append(tuple(fixups))
+
+    def _compile_value(self, value):
+        if isinstance(value, _ATOMIC):
+            return (_CONST, value)
+        if isinstance(value, NODE_TYPES):
+            return (_NODE, self._add_node(value))
+        if isinstance(value, list):
+            items = [self._compile_value(v) for v in value]
+            if all(r[0] == _CONST for r in items):
+                return (_COPY_LIST, value)
+            if all(self._is_node_ref(v, r) for v, r in zip(value, items)):
+                return (_NODE_LIST, tuple(self._ref_index(r) for r in items))
+            return (_LIST, tuple(items))
+        if isinstance(value, dict):
+            items = [(k, self._compile_value(v)) for k, v in value.items()]
+            if all(r[0] == _CONST for _, r in items):
+                return (_COPY_DICT, value)
+            if all(self._is_node_ref(value[k], r) for k, r in items):
+                return (_NODE_DICT, tuple((k, self._ref_index(r)) for k, r in items))
+            return (_DICT, tuple(items))
+        if isinstance(value, _SHARED):
+            return (_CONST, value)
+        if isinstance(value, (tuple, frozenset)):
+            if all(self._compile_value(v)[0] == _CONST for v in value):
+                return (_CONST, value)
+            raise TypeError(f"{type(value).__name__} contenant des valeurs à cloner")
+        raise TypeError(
+            f"{type(value).__name__} n'est ni immuable ni un objet du monde : "
+            "état de session (Game.reset_session_state), attribut partagé ou détaché ?"
+        )
+
+    @staticmethod
+    def _is_node_ref(value, recipe):
+        """Objet du monde ou None (sortie vide) : indexable directement."""
+        return recipe[0] == _NODE or value is None
+
+    @staticmethod
+    def _ref_index(recipe):
+        # None -> -1 : build() place None en dernière position de la table
+        return recipe[1] if recipe[0] == _NODE else -1
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def build(self):
+        """Retourne la liste des clones (même ordre que self.nodes)."""
+        new = [cls.__new__(cls) for cls in self.classes]
+        # None reste None : index -1
+        new.append(None)
+
+        def make(recipe):
+            kind, data = recipe
+            if kind == _NODE:
+                return new[data]
+            if kind == _NODE_DICT:
+                return {k: new[i] for k, i in data}
+            if kind == _NODE_LIST:
+                return [new[i] for i in data]
+            if kind == _COPY_LIST:
+                return list(data)
+            if kind == _COPY_DICT:
+                return dict(data)
+            if kind == _LIST:
+                return [make(r) for r in data]
+            if kind == _DICT:
+                return {k: make(r) for k, r in data}
+            return data
+
+        for obj, slotted, base, fixups in zip(new, self.slotted, self.bases, self.fixups):
+            state = base.copy()
+            for attr, (kind, data) in fixups:
+                if kind == _NODE:
+                    state[attr] = new[data]
+                elif kind == _NODE_DICT:
+                    state[attr] = {k: new[i] for k, i in data}
+                elif kind == _NODE_LIST:
+                    state[attr] = [new[i] for i in data]
+                elif kind == _COPY_DICT:
+                    state[attr] = dict(data)
+                elif kind == _COPY_LIST:
+                    state[attr] = list(data)
+                else:
+                    state[attr] = make((kind, data))
+            if slotted:
+                obj.__setstate__(state)
+            else:
+                obj.__dict__ = state
+        new.pop()
+        return new
+
+    def clone_of(self, clones, obj):
+        """Clone correspondant à un objet du modèle (ou None)."""
+        idx = self.index.get(id(obj))
+        return None if idx is None else clones[idx]
+
+
+class WorldTemplate:
+    """
+    Monde prototype : Game.setup() est exécuté une seule fois, puis chaque
+    nouvelle session reçoit un clone indépendant via spawn().
+
+    Exemple :
+        template = WorldTemplate()
+        g1 = template.spawn("Alice")
+        g2 = template.spawn("Bob")   # monde totalement séparé de g1
+    """
+
+    # Attributs de Game partagés tels quels entre les sessions (lecture seule)
+    SHARED_ATTRS = ("commands", "dialogues", "directions", "catalog")
+
+    # Attributs d'autres objets remis à None dans les clones : leur
+    # propriétaire les rattache (QuestManager.add_quest -> Quest.tracker)
+    DETACHED_ATTRS = {Quest: ("tracker",)}
+
+    def __init__(self, game=None):
+        if game is None:
+            game = Game()
+            game.setup(player_name="template")
+        if game.regions is not None:
+            raise ValueError("WorldTemplate : le monde modèle doit être entièrement construit (pas de régions paresseuses)")
+        self.game = game
+        # catalogue d'objets construit une fois, partagé par toutes les sessions
+        game.get_catalog()
+
+        # Les quêtes ne sont accessibles que via le joueur : racines en plus
+        qm = game.player.quest_manager
+        self._quests = list(qm.quests)
+        self._active_quests = list(qm.active_quests)
+        self.plan = ClonePlan(game, self.SHARED_ATTRS, session_attrs(), extra_roots=self._quests,
+                              detached_attrs=self.DETACHED_ATTRS)
+
+    def spawn(self, player_name="Hero", seed=None):
+        """Retourne un nouveau Game prêt à jouer, sans relancer setup() ; seed : voir rng.py."""
+        plan = self.plan
+        clones = plan.build()
+        game = clones[0]
+
+        game.reset_session_state(seed)
+        # le clone reçoit une liste simple : on la ré-indexe (RoomRegistry)
+        game.rooms = game.rooms
+        player = Player(player_name)
+        player.current_room = plan.clone_of(clones, self.game.player.current_room)
+        player.max_weight = self.game.player.max_weight
+        player.game = game
+
+        qm = player.quest_manager
+        for quest in self._quests:
+            qm.add_quest(plan.clone_of(clones, quest))
+        qm.active_quests = [plan.clone_of(clones, q) for q in self._active_quests]
+
+        game.player = player
+        game._setup_events()
+        return game
+
+
+def session_attrs():
+    """Attributs de Game posés par reset_session_state() : jamais clonés."""
+    probe = Game.__new__(Game)
+    probe.reset_session_state()
+    return tuple(vars(probe))
+
+
+_default_template = None
+
+
+def spawn_game(player_name="Hero", seed=None):
+    """Crée une session à partir du modèle par défaut (construit au premier appel)."""
+    global _default_template
+    if _default_template is None:
+        _default_template = WorldTemplate()
+    return _default_template.spawn(player_name, seed)